@@ -0,0 +1,169 @@
+#!/usr/bin/env python3
+"""
+Protocol micro-benchmark for Rhino MCP
+Compares legacy re-parse-on-every-recv reading with framed single-pass
+reading over a local socket pair. Does not require Rhino.
+"""
+
+import socket
+import json
+import time
+import threading
+import array
+import math
+
+import protocol
+
+LEGACY_CHUNK_SIZE = 8192
+LEGACY_MAX_BYTES = 2 * 1024 * 1024
+GEOMETRY_VERTEX_COUNT = 200000
+SCENE_OBJECT_COUNT = 50000
+MESSAGE_SIZES = [
+	("1 KB", 1024, 50),
+	("1 MB", 1024 * 1024, 5),
+	("50 MB", 50 * 1024 * 1024, 1),
+]
+
+
+def build_message(size):
+	"""
+	Build a create_mesh style command of roughly the given encoded size
+	size: target size in bytes
+	return: message dict
+	"""
+	vertex = [123.456789, -98.7654321, 42.0]
+	vertex_size = len(json.dumps(vertex)) + 2
+	count = max(1, size // vertex_size)
+	return {"type": "create_mesh", "params": {"vertices": [vertex] * count, "faces": []}}
+
+
+def legacy_recv(sock):
+	"""Read one message the way the listener did before framing"""
+	chunks = []
+	while True:
+		chunk = sock.recv(LEGACY_CHUNK_SIZE)
+		if not chunk:
+			return None
+		chunks.append(chunk)
+		try:
+			return json.loads(b"".join(chunks).decode("utf-8"))
+		except (json.JSONDecodeError, UnicodeDecodeError):
+			continue
+
+
+def framed_recv(sock):
+	"""Read one framed message in a single pass"""
+	return protocol.recv_frame(sock)
+
+
+def time_transfer(data, reader):
+	"""
+	Send data over a socket pair and time how long the reader takes
+	data: encoded bytes to send
+	reader: function(sock) returning the decoded message
+	return: elapsed seconds
+	"""
+	send_sock, recv_sock = socket.socketpair()
+	sender = threading.Thread(target=send_sock.sendall, args=(data,))
+	sender.daemon = True
+
+	start = time.perf_counter()
+	sender.start()
+	message = reader(recv_sock)
+	elapsed = time.perf_counter() - start
+
+	sender.join()
+	send_sock.close()
+	recv_sock.close()
+	if message is None:
+		raise RuntimeError("Reader returned no message")
+	return elapsed
+
+
+def best_time(data, reader, repeats):
+	"""Return the fastest of several transfers"""
+	return min(time_transfer(data, reader) for i in range(repeats))
+
+
+def format_rate(size, elapsed):
+	"""Format throughput as MB/s"""
+	return f"{size / elapsed / (1024 * 1024):10.1f} MB/s"
+
+
+def time_codec(message):
+	"""
+	Time one encode and decode round of a message
+	message: message dict
+	return: (encoded size, seconds)
+	"""
+	start = time.perf_counter()
+	data = protocol.encode_message(message)
+	flags, length = protocol.decode_header(data[:protocol.HEADER_SIZE])
+	protocol.decode_payload(flags, data[protocol.HEADER_SIZE:])
+	return len(data), time.perf_counter() - start
+
+
+def run_geometry_benchmark():
+	"""Compare nested JSON coordinates with packed binary arrays"""
+	count = GEOMETRY_VERTEX_COUNT
+	vertices = [[math.sin(i) * 100, math.cos(i) * 100, i * 0.001] for i in range(count)]
+	faces = [[i, i + 1, i + 2, i + 2] for i in range(count - 2)]
+	packed_vertices = array.array("d", [c for v in vertices for c in v])
+	packed_faces = array.array("i", [i for f in faces for i in f])
+
+	nested = {"type": "create_mesh", "params": {"vertices": vertices, "faces": faces}}
+	packed = {"type": "create_mesh", "params": {"vertices": packed_vertices, "faces": packed_faces}}
+
+	print(f"\nGEOMETRY ENCODING ({count} vertices, encode + decode)")
+	print("-" * 70)
+	for label, message in [("json", nested), ("binary", packed)]:
+		size, elapsed = time_codec(message)
+		print(f"{label:<10} {size / (1024 * 1024):8.2f} MB {elapsed * 1000:10.2f}ms")
+
+
+def run_compression_benchmark():
+	"""Compare uncompressed and compressed transfer of a scene listing"""
+	objects = [{"id": f"{i:08x}-0000-4000-8000-000000000000", "type": "Brep", "layer": "Default",
+		"name": f"object_{i}"} for i in range(SCENE_OBJECT_COUNT)]
+	message = {"status": "success", "result": {"objects": objects}}
+
+	print(f"\nCOMPRESSION ({SCENE_OBJECT_COUNT} objects, transfer + decode)")
+	print("-" * 70)
+	for codec in [None] + protocol.available_codecs():
+		data = protocol.encode_message(message, compress=[codec] if codec else None)
+		elapsed = best_time(data, framed_recv, 3)
+		label = codec or "none"
+		print(f"{label:<10} {len(data) / (1024 * 1024):8.2f} MB {elapsed * 1000:10.2f}ms")
+
+
+def run_benchmark():
+	"""Run the framing benchmark for each message size"""
+	print("=" * 70)
+	print("RHINO MCP PROTOCOL BENCHMARK")
+	print("=" * 70)
+	print(f"{'Size':<8} {'Mode':<10} {'Time':>12} {'Throughput':>16}")
+	print("-" * 70)
+
+	for label, size, repeats in MESSAGE_SIZES:
+		message = build_message(size)
+		framed = protocol.encode_message(message)
+		legacy = protocol.encode_legacy(message)
+
+		elapsed = best_time(framed, framed_recv, repeats)
+		rate = format_rate(len(framed), elapsed)
+		print(f"{label:<8} {'framed':<10} {elapsed * 1000:10.2f}ms {rate:>16}")
+
+		if len(legacy) > LEGACY_MAX_BYTES:
+			print(f"{label:<8} {'legacy':<10} {'skipped (quadratic re-parse)':>30}")
+			continue
+		elapsed = best_time(legacy, legacy_recv, repeats)
+		rate = format_rate(len(legacy), elapsed)
+		print(f"{label:<8} {'legacy':<10} {elapsed * 1000:10.2f}ms {rate:>16}")
+
+	run_geometry_benchmark()
+	run_compression_benchmark()
+	print("=" * 70)
+
+
+if __name__ == "__main__":
+	run_benchmark()
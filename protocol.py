@@ -0,0 +1,430 @@
+"""
+Wire protocol shared by the Rhino listener and its clients
+Compatible with CPython 3 (Rhino 8 and the MCP server)
+
+Framed messages start with a fixed 8-byte header followed by a JSON payload:
+	magic (2 bytes, b"RM"), version (1 byte), flags (1 byte),
+	payload length (4 bytes, unsigned big-endian)
+
+Raw JSON without a header is still accepted as the legacy protocol, so
+existing scripts that send a bare JSON object keep working.
+
+Framed messages may carry packed binary arrays (FLAG_ARRAYS). The payload
+is then a 4-byte JSON length, the JSON document, and the raw array data.
+Each array.array in the message is replaced in the JSON by a marker
+{"$array": "f8" or "i4", "offset": ..., "count": ...} pointing into the
+data section, which holds little-endian float64/int32 values.
+
+Payloads of at least COMPRESS_THRESHOLD bytes may be compressed when the
+receiver asked for it (FLAG_ZLIB, or FLAG_ZSTD when zstandard is installed).
+The header length is then the compressed length.
+
+A streamed response is a run of frames flagged FLAG_STREAM, each holding
+newline-delimited JSON records, followed by one ordinary frame (the trailer)
+carrying the status, record count and any summary.
+
+On Linux and macOS the listener can also accept connections on a Unix domain
+socket whose path is given by the RHINO_MCP_SOCKET environment variable.
+Clients use it instead of TCP whenever that path exists.
+"""
+
+import os
+import sys
+import socket
+import json
+import struct
+import array
+import zlib
+
+try:
+	import zstandard
+except ImportError:
+	zstandard = None
+
+MAGIC = b"RM"
+VERSION = 1
+HEADER = struct.Struct(">2sBBI")
+HEADER_SIZE = HEADER.size
+MAX_PAYLOAD_SIZE = 1 << 30
+RECV_CHUNK_SIZE = 65536
+
+FLAG_ARRAYS = 0x01
+FLAG_ZLIB = 0x02
+FLAG_ZSTD = 0x04
+FLAG_STREAM = 0x08
+COMPRESSION_FLAGS = FLAG_ZLIB | FLAG_ZSTD
+
+COMPRESS_THRESHOLD = 16384
+ZLIB_LEVEL = 1
+ZSTD_LEVEL = 3
+
+SOCKET_PATH_ENV = "RHINO_MCP_SOCKET"
+
+# Response id of an error that ends the connection when no request is being
+# answered; clients raise it as-is instead of treating it as out of sync
+CONNECTION_ERROR_ID = "connection"
+
+JSON_LENGTH = struct.Struct(">I")
+ARRAY_ALIGNMENT = 8
+ARRAY_TYPES = {"f8": "d", "i4": "i"}
+
+
+class ProtocolError(Exception):
+	"""Raised when a peer sends a malformed or oversized message"""
+
+
+def unix_socket_path():
+	"""
+	Get the configured Unix domain socket path
+	return: path string, or None if unset or unsupported on this platform
+	"""
+	if not hasattr(socket, "AF_UNIX"):
+		return None
+	return os.environ.get(SOCKET_PATH_ENV) or None
+
+
+def set_nodelay(sock):
+	"""Disable Nagle's algorithm on TCP sockets (no-op for Unix sockets)"""
+	if sock.family in (socket.AF_INET, socket.AF_INET6):
+		sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+
+
+def connect(host, port, timeout):
+	"""
+	Connect to the listener, preferring the Unix socket when it exists
+	host: TCP host used as fallback
+	port: TCP port used as fallback
+	timeout: socket timeout in seconds
+	return: connected socket
+	"""
+	path = unix_socket_path()
+	if path and os.path.exists(path):
+		sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+		sock.settimeout(timeout)
+		try:
+			sock.connect(path)
+			return sock
+		except OSError:
+			sock.close()
+	sock = socket.create_connection((host, port), timeout=timeout)
+	set_nodelay(sock)
+	return sock
+
+
+def array_dtype(values):
+	"""
+	Get the wire type name of a packed array
+	values: array.array of doubles or 32-bit integers
+	return: "f8" or "i4"
+	"""
+	if values.typecode == "d":
+		return "f8"
+	if values.typecode in "il" and values.itemsize == 4:
+		return "i4"
+	raise TypeError("Unsupported array type: " + values.typecode)
+
+
+def available_codecs():
+	"""
+	List the compression codecs this side can decode, preferred first
+	return: list of codec names
+	"""
+	if zstandard is not None:
+		return ["zstd", "zlib"]
+	return ["zlib"]
+
+
+def compress_payload(payload, codecs, threshold=COMPRESS_THRESHOLD):
+	"""
+	Compress a payload with the first codec the receiver accepts
+	payload: encoded payload bytes
+	codecs: codec names accepted by the receiver, preferred first
+	threshold: payloads smaller than this are sent uncompressed
+	return: (payload, compression flag or 0)
+	"""
+	if not codecs or len(payload) < threshold:
+		return payload, 0
+	for codec in codecs:
+		if codec == "zstd" and zstandard is not None:
+			return zstandard.ZstdCompressor(level=ZSTD_LEVEL).compress(payload), FLAG_ZSTD
+		if codec == "zlib":
+			return zlib.compress(payload, ZLIB_LEVEL), FLAG_ZLIB
+	return payload, 0
+
+
+def decompressor(flags):
+	"""
+	Create an incremental decompressor for a frame
+	flags: header flag bits
+	return: object with decompress(chunk) and flush(), or None if uncompressed
+	"""
+	if flags & FLAG_ZSTD:
+		if zstandard is None:
+			raise ProtocolError("Received zstd frame but zstandard is not installed")
+		return zstandard.ZstdDecompressor().decompressobj()
+	if flags & FLAG_ZLIB:
+		return zlib.decompressobj()
+	return None
+
+
+def encode_message(message, flags=0, compress=None, threshold=COMPRESS_THRESHOLD):
+	"""
+	Serialize a message into a single framed buffer
+	Any array.array values are sent as packed binary attachments.
+	message: JSON-serializable object, may contain array.array values
+	flags: extra header flag bits
+	compress: codec names accepted by the receiver, or None for no compression
+	threshold: minimum payload size worth compressing
+	return: bytes ready for sendall
+	"""
+	blobs = []
+	offset = [0]
+
+	def pack_array(value):
+		if not isinstance(value, array.array):
+			raise TypeError("Object of type " + type(value).__name__ + " is not JSON serializable")
+		marker = {"$array": array_dtype(value), "offset": offset[0], "count": len(value)}
+		if sys.byteorder != "little":
+			value = array.array(value.typecode, value)
+			value.byteswap()
+		data = value.tobytes()
+		padding = -len(data) % ARRAY_ALIGNMENT
+		blobs.append(data + b"\0" * padding)
+		offset[0] += len(data) + padding
+		return marker
+
+	payload = json.dumps(message, separators=(",", ":"), default=pack_array).encode("utf-8")
+	if blobs:
+		flags |= FLAG_ARRAYS
+		payload = b"".join([JSON_LENGTH.pack(len(payload)), payload] + blobs)
+	payload, compression = compress_payload(payload, compress, threshold)
+	flags |= compression
+	return HEADER.pack(MAGIC, VERSION, flags, len(payload)) + payload
+
+
+def encode_records(records, compress=None, threshold=COMPRESS_THRESHOLD):
+	"""
+	Frame a chunk of a streamed response as newline-delimited JSON
+	records: list of JSON-serializable records
+	compress: codec names accepted by the receiver, or None for no compression
+	threshold: minimum payload size worth compressing
+	return: bytes ready for sendall
+	"""
+	lines = [json.dumps(record, separators=(",", ":")).encode("utf-8") for record in records]
+	payload = b"\n".join(lines) + b"\n"
+	payload, compression = compress_payload(payload, compress, threshold)
+	return HEADER.pack(MAGIC, VERSION, FLAG_STREAM | compression, len(payload)) + payload
+
+
+def decode_records(payload):
+	"""
+	Decode the records of one streamed chunk
+	payload: newline-delimited JSON bytes
+	return: list of records
+	"""
+	return [json.loads(line) for line in bytes(payload).splitlines() if line]
+
+
+def decode_payload(flags, payload):
+	"""
+	Decode a frame payload, restoring packed arrays as array.array
+	flags: header flag bits
+	payload: payload bytes
+	return: decoded message
+	"""
+	if not flags & FLAG_ARRAYS:
+		return json.loads(payload)
+
+	view = memoryview(payload)
+	json_length = JSON_LENGTH.unpack_from(view)[0]
+	data_start = JSON_LENGTH.size + json_length
+	data = view[data_start:]
+
+	def unpack_array(obj):
+		dtype = obj.get("$array")
+		if dtype is None:
+			return obj
+		typecode = ARRAY_TYPES.get(dtype)
+		if typecode is None:
+			raise ProtocolError("Unknown array type: " + str(dtype))
+		values = array.array(typecode)
+		start = obj["offset"]
+		end = start + obj["count"] * values.itemsize
+		if start < 0 or end > len(data):
+			raise ProtocolError("Array outside of payload")
+		values.frombytes(data[start:end])
+		if sys.byteorder != "little":
+			values.byteswap()
+		return values
+
+	return json.loads(bytes(view[JSON_LENGTH.size:data_start]), object_hook=unpack_array)
+
+
+def encode_legacy(message):
+	"""
+	Serialize a message as bare JSON for legacy clients
+	message: JSON-serializable object
+	return: bytes ready for sendall
+	"""
+	return json.dumps(message).encode("utf-8")
+
+
+def decode_header(header):
+	"""
+	Validate a frame header
+	header: HEADER_SIZE bytes read from the socket
+	return: (flags, payload_length)
+	"""
+	magic, version, flags, length = HEADER.unpack(header)
+	if magic != MAGIC:
+		raise ProtocolError("Bad frame magic")
+	if version != VERSION:
+		raise ProtocolError("Unsupported protocol version: " + str(version))
+	if length > MAX_PAYLOAD_SIZE:
+		raise ProtocolError("Frame too large: " + str(length) + " bytes")
+	return flags, length
+
+
+def is_framed(data):
+	"""
+	Check whether the first bytes of a stream belong to a framed message
+	data: bytes received so far (at least one byte)
+	return: True for framed, False for legacy raw JSON
+	"""
+	return data[:1] == MAGIC[:1]
+
+
+def recv_exact(sock, size, prefix=b""):
+	"""
+	Read exactly size bytes into one preallocated buffer
+	sock: connected socket
+	size: number of bytes to read
+	prefix: bytes already received that count towards size
+	return: bytearray of length size, or None if the peer closed first
+	"""
+	buf = bytearray(size)
+	view = memoryview(buf)
+	filled = len(prefix)
+	view[:filled] = prefix
+	while filled < size:
+		count = sock.recv_into(view[filled:], min(size - filled, RECV_CHUNK_SIZE))
+		if not count:
+			return None
+		filled += count
+	return buf
+
+
+class Inflater:
+	"""Incrementally decompress a frame payload as chunks arrive"""
+
+	def __init__(self, flags):
+		self.decompressor = decompressor(flags)
+		self.parts = []
+		self.size = 0
+
+	def feed(self, chunk):
+		"""Decompress one received chunk"""
+		data = self.decompressor.decompress(chunk)
+		self.size += len(data)
+		if self.size > MAX_PAYLOAD_SIZE:
+			raise ProtocolError("Decompressed frame too large")
+		self.parts.append(data)
+
+	def finish(self):
+		"""
+		Flush the decompressor
+		return: complete decompressed payload
+		"""
+		self.parts.append(self.decompressor.flush())
+		return b"".join(self.parts)
+
+
+def recv_compressed(sock, flags, length):
+	"""
+	Read a compressed payload, decompressing each chunk as it arrives
+	sock: connected socket
+	flags: header flag bits
+	length: compressed payload length
+	return: decompressed payload bytes
+	"""
+	inflater = Inflater(flags)
+	remaining = length
+	while remaining:
+		chunk = sock.recv(min(remaining, RECV_CHUNK_SIZE))
+		if not chunk:
+			raise ProtocolError("Connection closed mid-frame")
+		remaining -= len(chunk)
+		inflater.feed(chunk)
+	return inflater.finish()
+
+
+def recv_payload(sock, prefix=b""):
+	"""
+	Read one frame and return its decompressed payload undecoded
+	sock: connected socket
+	prefix: header bytes already received (used by legacy detection)
+	return: (flags, payload), or None if the peer closed cleanly
+	"""
+	header = recv_exact(sock, HEADER_SIZE, prefix[:HEADER_SIZE])
+	if header is None:
+		return None
+	flags, length = decode_header(bytes(header))
+	if flags & COMPRESSION_FLAGS:
+		payload = recv_compressed(sock, flags, length)
+	else:
+		payload = recv_exact(sock, length, prefix[HEADER_SIZE:])
+	if payload is None:
+		raise ProtocolError("Connection closed mid-frame")
+	return flags, payload
+
+
+def recv_frame(sock, prefix=b""):
+	"""
+	Read one framed message and decode its JSON payload in a single pass
+	sock: connected socket
+	prefix: header bytes already received (used by legacy detection)
+	return: decoded message, or None if the peer closed cleanly
+	"""
+	frame = recv_payload(sock, prefix)
+	if frame is None:
+		return None
+	flags, payload = frame
+	if flags & FLAG_STREAM:
+		raise ProtocolError("Unexpected streamed frame")
+	return decode_payload(flags, payload)
+
+
+def recv_legacy(sock, prefix):
+	"""
+	Read one bare JSON message (legacy protocol)
+	Parsing is only attempted when the buffer could end a JSON object.
+	sock: connected socket
+	prefix: bytes already received
+	return: decoded message, or None if the peer closed before it was complete
+	"""
+	chunks = [prefix]
+	last = prefix
+	while True:
+		if last.rstrip().endswith(b"}"):
+			try:
+				return json.loads(b"".join(chunks))
+			except ValueError:
+				pass
+		last = sock.recv(RECV_CHUNK_SIZE)
+		if not last:
+			return None
+		chunks.append(last)
+
+
+def recv_message(sock):
+	"""
+	Read one message, detecting framed vs legacy mode from the first bytes
+	sock: connected socket
+	return: (message, framed) or (None, framed) if the peer closed
+	"""
+	first = sock.recv(HEADER_SIZE)
+	if not first:
+		return None, True
+	if is_framed(first):
+		return recv_frame(sock, first), True
+	return recv_legacy(sock, first), False
@@ -4,6 +4,8 @@ RhinoScriptSyntax annotation functions
 
 import rhinoscriptsyntax as rs
 
+from . import document
+
 
 def add_text(text, point, height=1.0, font=None):
 	"""Add a text object"""
@@ -12,7 +14,7 @@ def add_text(text, point, height=1.0, font=None):
 	else:
 		text_id = rs.AddText(text, point, height)
 	if text_id:
-		rs.Redraw()
+		document.redraw()
 		return {"status": "success", "id": str(text_id)}
 	return {"status": "error", "message": "Failed to add text"}
 
@@ -21,7 +23,7 @@ def add_text_dot(text, point):
 	"""Add a text dot"""
 	dot_id = rs.AddTextDot(text, point)
 	if dot_id:
-		rs.Redraw()
+		document.redraw()
 		return {"status": "success", "id": str(dot_id)}
 	return {"status": "error", "message": "Failed to add text dot"}
 
@@ -33,6 +35,6 @@ def add_leader(points, text=""):
 	else:
 		leader_id = rs.AddLeader(points)
 	if leader_id:
-		rs.Redraw()
+		document.redraw()
 		return {"status": "success", "id": str(leader_id)}
 	return {"status": "error", "message": "Failed to add leader"}
@@ -4,6 +4,8 @@ RhinoScriptSyntax block functions
 
 import rhinoscriptsyntax as rs
 
+from . import document
+
 
 def add_block(object_ids, base_point, name, delete_input=True):
 	"""Create a block definition"""
@@ -19,16 +21,54 @@ def insert_block(name, insertion_point, scale=None, rotation=0):
 		scale = (1, 1, 1)
 	result = rs.InsertBlock(name, insertion_point, scale, rotation)
 	if result:
-		rs.Redraw()
+		document.redraw()
 		return {"status": "success", "id": str(result)}
 	return {"status": "error", "message": "Failed to insert block"}
 
 
+def add_instances(object_ids, transforms, name=None):
+	"""
+	Define a block from objects, left in place, and add one instance per transform
+	object_ids: ids of the objects making up the block
+	transforms: list of Rhino.Geometry.Transform, one instance each
+	name: block name (default: an unused "Array" name)
+	return: result dict with the block name and the new instance ids
+	"""
+	import Rhino
+	import scriptcontext
+	import System
+	definitions = scriptcontext.doc.InstanceDefinitions
+	shapes = []
+	attributes = []
+	for obj_id in object_ids:
+		rhino_obj = rs.coercerhinoobject(obj_id)
+		if rhino_obj is not None:
+			shapes.append(rhino_obj.Geometry)
+			attributes.append(rhino_obj.Attributes)
+	if not shapes:
+		return {"status": "error", "message": "No objects to define a block from"}
+
+	name = name or definitions.GetUnusedInstanceDefinitionName("Array")
+	index = definitions.Add(name, "", Rhino.Geometry.Point3d.Origin, shapes, attributes)
+	if index < 0:
+		return {"status": "error", "message": "Failed to create block: " + name}
+
+	ids = []
+	for xform in transforms:
+		new_id = scriptcontext.doc.Objects.AddInstanceObject(index, xform)
+		if new_id != System.Guid.Empty:
+			ids.append(str(new_id))
+	if not ids:
+		return {"status": "error", "message": "Failed to insert block"}
+	document.redraw()
+	return {"status": "success", "name": name, "count": len(ids), "ids": ids}
+
+
 def explode_block_instance(block_id):
 	"""Explode a block instance into its component objects"""
 	result = rs.ExplodeBlockInstance(block_id)
 	if result:
-		rs.Redraw()
+		document.redraw()
 		return {"status": "success", "count": len(result), "ids": [str(x) for x in result]}
 	return {"status": "error", "message": "Failed to explode block"}
 
@@ -0,0 +1,141 @@
+"""
+Result cache for the listener
+Keeps the results of measurement and analysis commands in a bounded LRU,
+keyed by the objects they read and each object's geometry revision. The
+revision is bumped from RhinoDoc events through rhino.events whenever an
+object's geometry is replaced, deleted or undeleted, so a changed object
+misses the cache and its stale entries age out of the LRU. A revision is
+only kept while a cached entry refers to the object, so the revision map is
+bounded by the cache size rather than by the number of objects ever changed.
+Compatible with CPython 3 (Rhino 8)
+"""
+
+import collections
+import itertools
+import threading
+
+from . import events
+
+MAX_ENTRIES = 1024
+
+lock = threading.Lock()
+
+# Cache key -> result, least recently used first
+entries = collections.OrderedDict()
+
+# Object id -> geometry revision, for objects changed while referenced by
+# an entry; every other object is at revision 0. Revisions come from one
+# counter so a value is never reused for an object.
+revisions = {}
+revision_numbers = itertools.count(1)
+
+# Object id -> number of entries whose key refers to it
+references = {}
+
+stats = {"hits": 0, "misses": 0, "evictions": 0}
+
+
+def object_key(object_id):
+	"""Normalize an object id as given in params or by an event"""
+	return str(object_id).strip("{}").lower() if object_id else None
+
+
+def bump(object_id):
+	"""Move an object to a new geometry revision if a cached entry refers to it"""
+	key = object_key(object_id)
+	with lock:
+		if key in references:
+			revisions[key] = next(revision_numbers)
+
+
+def reference(key, delta):
+	"""
+	Count the entries referring to each object of a cache key (caller holds lock)
+	An object no entry refers to any more goes back to revision 0.
+	key: cache key
+	delta: 1 when the entry is stored, -1 when it is evicted
+	"""
+	for object_id, revision in key[1]:
+		total = references.get(object_id, 0) + delta
+		if total > 0:
+			references[object_id] = total
+		else:
+			references.pop(object_id, None)
+			revisions.pop(object_id, None)
+
+
+def on_change(args):
+	"""ReplaceRhinoObject, DeleteRhinoObject and UndeleteRhinoObject callback"""
+	bump(args.ObjectId)
+
+
+def on_document(args):
+	"""Flush the cache when a document is created, opened, closed or activated"""
+	flush()
+
+
+def install():
+	"""Subscribe the cache to document events"""
+	for event in ("ReplaceRhinoObject", "DeleteRhinoObject", "UndeleteRhinoObject"):
+		events.subscribe(event, on_change)
+	for event in ("NewDocument", "EndOpenDocument", "CloseDocument", "ActiveDocumentChanged"):
+		events.subscribe(event, on_document)
+
+
+def cached(name, object_ids, compute, options=()):
+	"""
+	Get a result from the cache, computing and storing it on a miss
+	Only results with status "success" are stored.
+	name: command name, part of the key
+	object_ids: ids of the objects the result depends on, in order (None allowed)
+	compute: function returning the result dict, called on a miss
+	options: tuple of further hashable inputs of the result, part of the key
+	return: result dict
+	"""
+	with lock:
+		objects = tuple((object_key(i), revisions.get(object_key(i), 0)) for i in object_ids)
+		key = (name, objects, options)
+		if key in entries:
+			entries.move_to_end(key)
+			stats["hits"] += 1
+			return entries[key]
+		stats["misses"] += 1
+	result = compute()
+	if result.get("status") == "success":
+		with lock:
+			if key not in entries:
+				reference(key, 1)
+			entries[key] = result
+			while len(entries) > MAX_ENTRIES:
+				reference(entries.popitem(last=False)[0], -1)
+				stats["evictions"] += 1
+	return result
+
+
+def status():
+	"""
+	Describe the cache
+	return: dict with size, max_entries, the number of objects entries refer
+		to and the hit, miss and eviction counts
+	"""
+	with lock:
+		result = dict(stats)
+		result["size"] = len(entries)
+		result["tracked_objects"] = len(references)
+	result["max_entries"] = MAX_ENTRIES
+	return result
+
+
+def flush():
+	"""
+	Empty the cache and reset its counters
+	return: status() from before the flush
+	"""
+	result = status()
+	with lock:
+		entries.clear()
+		revisions.clear()
+		references.clear()
+		for counter in stats:
+			stats[counter] = 0
+	return result
@@ -12,13 +12,15 @@ import System
 from io import StringIO
 
 from . import curve, surface, geometry, layer, object as obj, selection, utility, plane, document
-from . import mesh, group, view, block, material, annotation, userdata
+from . import mesh, group, view, block, material, annotation, userdata, scene, spatial, cache
+from .registry import command
 
 
 # ============================================================================
 # GEOMETRY COMMANDS
 # ============================================================================
 
+@command()
 def create_point(params):
 	"""Create a point"""
 	x = params.get("x", 0)
@@ -28,6 +30,7 @@ def create_point(params):
 	return {"status": result["status"], "result": {"id": result.get("id"), "type": "point"}} if result["status"] == "success" else result
 
 
+@command()
 def create_line(params):
 	"""Create a line"""
 	start = params.get("start", [0, 0, 0])
@@ -36,6 +39,7 @@ def create_line(params):
 	return {"status": result["status"], "result": {"id": result.get("id"), "type": "line"}} if result["status"] == "success" else result
 
 
+@command()
 def create_circle(params):
 	"""Create a circle"""
 	center = params.get("center", [0, 0, 0])
@@ -44,6 +48,7 @@ def create_circle(params):
 	return {"status": result["status"], "result": {"id": result.get("id"), "type": "circle"}} if result["status"] == "success" else result
 
 
+@command()
 def create_arc(params):
 	"""Create an arc with center, radius, and angles"""
 	center = params.get("center", [0, 0, 0])
@@ -71,6 +76,7 @@ def create_arc(params):
 	return {"status": result["status"], "result": {"id": result.get("id"), "type": "arc"}} if result["status"] == "success" else result
 
 
+@command()
 def create_ellipse(params):
 	"""Create an ellipse"""
 	center = params.get("center", [0, 0, 0])
@@ -82,6 +88,7 @@ def create_ellipse(params):
 	return {"status": result["status"], "result": {"id": result.get("id"), "type": "ellipse"}} if result["status"] == "success" else result
 
 
+@command()
 def create_polyline(params):
 	"""Create a polyline"""
 	points = params.get("points", [[0, 0, 0], [1, 1, 1], [2, 0, 0]])
@@ -89,6 +96,7 @@ def create_polyline(params):
 	return {"status": result["status"], "result": {"id": result.get("id"), "type": "polyline"}} if result["status"] == "success" else result
 
 
+@command()
 def create_curve(params):
 	"""Create an interpolated curve"""
 	points = params.get("points", [[0, 0, 0], [1, 1, 1], [2, 0, 0]])
@@ -101,6 +109,7 @@ def create_curve(params):
 # 3D SOLIDS
 # ============================================================================
 
+@command()
 def create_box(params):
 	"""Create a box"""
 	width = params.get("width", 10)
@@ -123,6 +132,7 @@ def create_box(params):
 	return {"status": result["status"], "result": {"id": result.get("id"), "type": "box"}} if result["status"] == "success" else result
 
 
+@command()
 def create_sphere(params):
 	"""Create a sphere"""
 	center = params.get("center", [0, 0, 0])
@@ -131,6 +141,7 @@ def create_sphere(params):
 	return {"status": result["status"], "result": {"id": result.get("id"), "type": "sphere"}} if result["status"] == "success" else result
 
 
+@command()
 def create_cylinder(params):
 	"""Create a cylinder"""
 	base = params.get("base", [0, 0, 0])
@@ -149,6 +160,7 @@ def create_cylinder(params):
 	return {"status": result["status"], "result": {"id": result.get("id"), "type": "cylinder"}} if result["status"] == "success" else result
 
 
+@command()
 def create_cone(params):
 	"""Create a cone"""
 	base = params.get("base", [0, 0, 0])
@@ -160,6 +172,7 @@ def create_cone(params):
 	return {"status": result["status"], "result": {"id": result.get("id"), "type": "cone"}} if result["status"] == "success" else result
 
 
+@command()
 def create_torus(params):
 	"""Create a torus"""
 	center = params.get("center", [0, 0, 0])
@@ -176,73 +189,203 @@ def create_torus(params):
 
 
 # ============================================================================
-# TRANSFORMATIONS
+# BULK CREATION
 # ============================================================================
+# Columnar variants of the creation commands: each parameter is one list
+# (or packed array) with an entry per object, and every object is added
+# straight to the document in one pass with a single redraw.
+
+def bulk_result(result, object_type):
+	"""Wrap a bulk creation result in a command response"""
+	if result["status"] != "success":
+		return result
+	return {"status": "success", "result": {
+		"count": result["count"],
+		"failed": result["failed"],
+		"ids": result["ids"],
+		"type": object_type
+	}}
+
+
+def column_error(name):
+	"""Error response for a column whose length does not match the points"""
+	return {"status": "error", "message": name + " must have one value per object"}
+
+
+@command(cost="heavy")
+def create_points(params):
+	"""Create many points from a column of [x, y, z] or a packed x,y,z array"""
+	points = geometry.point_column(params.get("points", []))
+	if not points:
+		return {"status": "error", "message": "No points given"}
+	return bulk_result(geometry.add_points(points), "point")
+
+
+@command(cost="heavy")
+def create_lines(params):
+	"""Create many lines from columns of start and end points"""
+	starts = geometry.point_column(params.get("starts", []))
+	ends = geometry.point_column(params.get("ends", []))
+	if not starts:
+		return {"status": "error", "message": "No lines given"}
+	if len(ends) != len(starts):
+		return column_error("ends")
+	return bulk_result(curve.add_lines(starts, ends), "line")
+
+
+@command(cost="heavy")
+def create_circles(params):
+	"""Create many circles from columns of centers and radii (or one radius)"""
+	centers = geometry.point_column(params.get("centers", []))
+	if not centers:
+		return {"status": "error", "message": "No circles given"}
+	radii = geometry.value_column(params.get("radii", 5), len(centers))
+	if radii is None:
+		return column_error("radii")
+	return bulk_result(curve.add_circles(centers, radii), "circle")
+
+
+@command(cost="heavy")
+def create_spheres(params):
+	"""Create many spheres from columns of centers and radii (or one radius)"""
+	centers = geometry.point_column(params.get("centers", []))
+	if not centers:
+		return {"status": "error", "message": "No spheres given"}
+	radii = geometry.value_column(params.get("radii", 5), len(centers))
+	if radii is None:
+		return column_error("radii")
+	return bulk_result(surface.add_spheres(centers, radii), "sphere")
+
+
+@command(cost="heavy")
+def create_boxes(params):
+	"""
+	Create many boxes from a column of minimum corners and columns of
+	widths, depths and heights (each may be one number for all boxes)
+	"""
+	corners = geometry.point_column(params.get("corners", []))
+	if not corners:
+		return {"status": "error", "message": "No boxes given"}
+	sizes = {}
+	for name in ("widths", "depths", "heights"):
+		sizes[name] = geometry.value_column(params.get(name, 10), len(corners))
+		if sizes[name] is None:
+			return column_error(name)
+	result = surface.add_boxes(corners, sizes["widths"], sizes["depths"], sizes["heights"])
+	return bulk_result(result, "box")
 
-def move_objects(params):
-	"""Move selected objects"""
-	displacement = params.get("displacement", [0, 0, 0])
-	objects = selection.selected_objects()
 
+# ============================================================================
+# TRANSFORMATIONS
+# ============================================================================
+
+def target_objects(params):
+	"""Get the object_ids param, or the selected objects if it is not given"""
+	object_ids = params.get("object_ids")
+	if object_ids is not None:
+		return object_ids
+	return selection.selected_objects()
+
+
+def apply_transform(params, xform, key):
+	"""
+	Transform the target objects with one matrix
+	params: command params, read for object_ids
+	xform: Rhino.Geometry.Transform
+	key: result key holding the number of transformed objects
+	return: response dict with the count and the ids
+	"""
+	objects = target_objects(params)
 	if not objects:
 		return {"status": "error", "message": "No objects selected"}
+	result = obj.transform_objects(objects, xform)
+	if result["status"] != "success":
+		return result
+	return {"status": "success", "result": {key: result["count"], "ids": result["ids"]}}
 
-	for obj_id in objects:
-		obj.move_object(obj_id, displacement)
 
-	return {"status": "success", "result": {"moved": len(objects)}}
+@command(cost="medium", needs_selection=True)
+def move_objects(params):
+	"""Move the selected objects, or object_ids"""
+	displacement = params.get("displacement", [0, 0, 0])
+	xform = Rhino.Geometry.Transform.Translation(Rhino.Geometry.Vector3d(*displacement))
+	return apply_transform(params, xform, "moved")
 
 
+@command(cost="medium", needs_selection=True)
 def rotate_objects(params):
-	"""Rotate selected objects"""
+	"""Rotate the selected objects, or object_ids, by angle degrees about axis through center"""
 	center = params.get("center", [0, 0, 0])
 	angle = params.get("angle", 90)
 	axis = params.get("axis", [0, 0, 1])
 
-	objects = selection.selected_objects()
-	if not objects:
-		return {"status": "error", "message": "No objects selected"}
-
-	# Already runs on UI thread via server.py InvokeOnUiThread dispatch
-	result = rs.RotateObjects(objects, center, angle, axis)
-	if result:
-		document.redraw()
-		return {"status": "success", "result": {"count": len(result)}}
-
-	return {"status": "error", "message": "Failed to rotate objects"}
+	xform = Rhino.Geometry.Transform.Rotation(
+		math.radians(angle), Rhino.Geometry.Vector3d(*axis), Rhino.Geometry.Point3d(*center))
+	return apply_transform(params, xform, "count")
 
 
+@command(cost="medium", needs_selection=True)
 def scale_objects(params):
-	"""Scale selected objects"""
+	"""
+	Scale the selected objects, or object_ids, by a factor or [x, y, z] factors
+	along the construction plane axes, about center
+	"""
 	center = params.get("center", [0, 0, 0])
 	scale_factor = params.get("scale", 1.0)
 
-	objects = selection.selected_objects()
-	if not objects:
-		return {"status": "error", "message": "No objects selected"}
-
-	scale = [scale_factor, scale_factor, scale_factor]
-	for obj_id in objects:
-		obj.scale_object(obj_id, center, scale)
-
-	return {"status": "success", "result": {"scaled": len(objects)}}
+	if isinstance(scale_factor, (int, float)):
+		scale_factor = [scale_factor] * 3
+	cplane = view.construction_plane()
+	frame = Rhino.Geometry.Plane(Rhino.Geometry.Point3d(*center), cplane.XAxis, cplane.YAxis)
+	xform = Rhino.Geometry.Transform.Scale(frame, *scale_factor)
+	return apply_transform(params, xform, "scaled")
 
 
+@command(cost="medium", needs_selection=True)
 def mirror_objects(params):
-	"""Mirror selected objects"""
-	start = params.get("start", [0, 0, 0])
-	end = params.get("end", [10, 0, 0])
-
-	objects = selection.selected_objects()
-	if not objects:
-		return {"status": "error", "message": "No objects selected"}
-
-	for obj_id in objects:
-		obj.mirror_object(obj_id, start, end)
+	"""
+	Mirror the selected objects, or object_ids, across the line start-end
+	in the construction plane
+	"""
+	start = Rhino.Geometry.Point3d(*params.get("start", [0, 0, 0]))
+	end = Rhino.Geometry.Point3d(*params.get("end", [10, 0, 0]))
+
+	direction = end - start
+	if direction.IsTiny():
+		return {"status": "error", "message": "Mirror start and end points are too close"}
+	normal = view.construction_plane_normal()
+	mirror_normal = Rhino.Geometry.Vector3d.CrossProduct(direction, normal)
+	mirror_normal.Unitize()
+	xform = Rhino.Geometry.Transform.Mirror(start, mirror_normal)
+	return apply_transform(params, xform, "mirrored")
+
+
+@command(cost="medium", needs_selection=True)
+def transform_objects(params):
+	"""
+	Apply an arbitrary affine transform to the selected objects, or object_ids
+	params: {"matrix": 4x4 row-major matrix as 4 rows or 16 numbers,
+		"object_ids": ids to transform (default: the selection)}
+	"""
+	matrix = params.get("matrix")
+	if matrix is None:
+		return {"status": "error", "message": "matrix is required"}
+	if matrix and isinstance(matrix[0], (list, tuple)):
+		values = [v for row in matrix for v in row]
+	else:
+		values = list(matrix)
+	if len(values) != 16:
+		return {"status": "error", "message": "matrix must have 16 values"}
 
-	return {"status": "success", "result": {"mirrored": len(objects)}}
+	xform = Rhino.Geometry.Transform(1.0)
+	for index, value in enumerate(values):
+		setattr(xform, "M%d%d" % divmod(index, 4), float(value))
+	if not xform.IsValid:
+		return {"status": "error", "message": "matrix is not a valid transform"}
+	return apply_transform(params, xform, "count")
 
 
+@command(cost="medium", needs_selection=True)
 def copy_objects(params):
 	"""Copy selected objects"""
 	displacement = params.get("displacement", [10, 0, 0])
@@ -260,8 +403,35 @@ def copy_objects(params):
 	return {"status": "success", "result": {"copied": len(copied), "ids": copied}}
 
 
+def array_copies(objects, transforms, params):
+	"""
+	Place the objects once per transform for the array commands
+	objects: ids of the source objects
+	transforms: list of Rhino.Geometry.Transform
+	params: command params, read for as_blocks and block_name
+	return: response dict with the number of created objects and their ids
+	"""
+	if not transforms:
+		return {"status": "success", "result": {"created": 0, "ids": []}}
+	if params.get("as_blocks", False):
+		result = block.add_instances(objects, transforms, params.get("block_name"))
+	else:
+		result = obj.copy_transformed(objects, transforms)
+	if result["status"] != "success":
+		return result
+	created = {"created": result["count"], "ids": result["ids"]}
+	if "name" in result:
+		created["block"] = result["name"]
+	return {"status": "success", "result": created}
+
+
+@command(cost="medium", needs_selection=True)
 def array_linear(params):
-	"""Create linear array"""
+	"""
+	Create linear array
+	Every copy is added in one pass from precomputed translations, as full
+	copies or, with as_blocks, as instances of a block made from the selection.
+	"""
 	displacement = params.get("displacement", [10, 0, 0])
 	count = params.get("count", 3)
 
@@ -269,21 +439,19 @@ def array_linear(params):
 	if not objects:
 		return {"status": "error", "message": "No objects selected"}
 
-	total_created = 0
-	for obj_id in objects:
-		for i in range(1, count):
-			offset = [displacement[j] * i for j in range(3)]
-			result = obj.copy_object(obj_id, offset)
-			if result["status"] == "success":
-				total_created += 1
-
-	return {"status": "success", "result": {"created": total_created}}
+	transforms = [
+		Rhino.Geometry.Transform.Translation(
+			displacement[0] * i, displacement[1] * i, displacement[2] * i)
+		for i in range(1, count)
+	]
+	return array_copies(objects, transforms, params)
 
 
 # ============================================================================
 # BOOLEAN OPERATIONS
 # ============================================================================
 
+@command(cost="heavy", needs_selection=True)
 def boolean_union(params):
 	"""Boolean union on selected objects"""
 	objects = selection.selected_objects()
@@ -305,6 +473,7 @@ def boolean_union(params):
 	return result
 
 
+@command(cost="heavy", needs_selection=True)
 def boolean_difference(params):
 	"""Boolean difference on selected objects"""
 	objects = selection.selected_objects()
@@ -325,6 +494,7 @@ def boolean_difference(params):
 	return result
 
 
+@command(cost="heavy", needs_selection=True)
 def boolean_intersection(params):
 	"""Boolean intersection on selected objects"""
 	objects = selection.selected_objects()
@@ -349,6 +519,7 @@ def boolean_intersection(params):
 # CURVE OPERATIONS
 # ============================================================================
 
+@command(needs_selection=True)
 def join_curves(params):
 	"""Join selected curves"""
 	objects = selection.selected_objects()
@@ -369,6 +540,7 @@ def join_curves(params):
 	return result
 
 
+@command(needs_selection=True)
 def explode_curves(params):
 	"""Explode selected curves"""
 	objects = selection.selected_objects()
@@ -395,6 +567,7 @@ def explode_curves(params):
 	return {"status": "error", "message": "No curves to explode"}
 
 
+@command(cost="medium", needs_selection=True)
 def offset_curve(params):
 	"""Offset selected curve"""
 	distance = params.get("distance", 5)
@@ -419,6 +592,7 @@ def offset_curve(params):
 	return result
 
 
+@command(cost="medium", needs_selection=True)
 def fillet_curves(params):
 	"""Fillet two selected curves"""
 	radius = params.get("radius", 1)
@@ -437,6 +611,7 @@ def fillet_curves(params):
 	return result
 
 
+@command(needs_selection=True)
 def extend_curve(params):
 	"""Extend selected curve"""
 	extension = params.get("extension", 5)
@@ -456,6 +631,7 @@ def extend_curve(params):
 # SURFACE OPERATIONS
 # ============================================================================
 
+@command(cost="medium", needs_selection=True)
 def extrude_curve_straight(params):
 	"""Extrude curve straight"""
 	height = params.get("height", 10)
@@ -474,6 +650,7 @@ def extrude_curve_straight(params):
 	return result
 
 
+@command(cost="medium", needs_selection=True)
 def revolve_curve(params):
 	"""Revolve curve around axis"""
 	axis_start = params.get("axis_start", [0, 0, 0])
@@ -497,6 +674,7 @@ def revolve_curve(params):
 	return result
 
 
+@command(cost="medium", needs_selection=True)
 def loft_curves(params):
 	"""Loft surface through selected curves"""
 	objects = selection.selected_objects()
@@ -521,6 +699,7 @@ def loft_curves(params):
 # LAYER MANAGEMENT
 # ============================================================================
 
+@command(redraw=False)
 def create_layer(params):
 	"""Create a new layer"""
 	name = params.get("name", "NewLayer")
@@ -531,6 +710,7 @@ def create_layer(params):
 	return result
 
 
+@command()
 def delete_layer(params):
 	"""Delete a layer"""
 	name = params.get("name", "")
@@ -540,6 +720,7 @@ def delete_layer(params):
 	return result
 
 
+@command(redraw=False)
 def set_current_layer(params):
 	"""Set current layer"""
 	name = params.get("name", "")
@@ -549,6 +730,7 @@ def set_current_layer(params):
 	return result
 
 
+@command()
 def set_layer_color(params):
 	"""Set layer color"""
 	name = params.get("name", "")
@@ -559,6 +741,7 @@ def set_layer_color(params):
 	return result
 
 
+@command()
 def set_layer_visibility(params):
 	"""Set layer visibility"""
 	name = params.get("name", "")
@@ -569,27 +752,27 @@ def set_layer_visibility(params):
 	return result
 
 
-def list_layers(params):
-	"""List all layers"""
-	layers = layer.layer_names()
-	layer_info = []
-
-	for lyr in layers:
-		info = {
-			"name": lyr,
-			"visible": layer.layer_visible(lyr),
-			"locked": layer.layer_locked(lyr),
-			"current": lyr == layer.current_layer()
-		}
-		layer_info.append(info)
+def stream_layers(params):
+	"""Yield layer records one at a time by full path (streaming form of list_layers)"""
+	for record in sorted(layer.layer_records(), key=lambda r: r["name"]):
+		yield record
 
-	return {"status": "success", "result": {"layers": layer_info}}
+
+@command(mutating=False, stream=stream_layers)
+def list_layers(params):
+	"""
+	List layers from the layer table snapshot by full path, one page at a time
+	params: {"limit": page size (default all), "cursor": next_cursor of the previous page}
+	"""
+	records, info = utility.paginate(layer.layer_records(), lambda r: r["name"], params)
+	return page_result("layers", records, info)
 
 
 # ============================================================================
 # ANALYSIS
 # ============================================================================
 
+@command(mutating=False)
 def measure_distance(params):
 	"""Measure distance between two points"""
 	point1 = params.get("point1", [0, 0, 0])
@@ -600,101 +783,211 @@ def measure_distance(params):
 	return result
 
 
+@command(mutating=False, needs_selection=True)
 def measure_curve_length(params):
 	"""Measure curve length"""
 	curves = selection.selected_objects()
 	if not curves:
 		return {"status": "error", "message": "No curve selected"}
 
-	result = curve.curve_length(curves[0])
+	result = cache.cached("measure_curve_length", curves[:1], lambda: curve.curve_length(curves[0]))
 	if result["status"] == "success":
 		return {"status": "success", "result": {"length": result["length"]}}
 	return result
 
 
+def object_area(obj_id):
+	"""Compute the area of a closed planar curve or a surface"""
+	if curve.is_curve(obj_id):
+		return curve.curve_area(obj_id)
+	elif surface.is_surface(obj_id):
+		return surface.surface_area(obj_id)
+	return {"status": "error", "message": "Object must be a closed planar curve or surface"}
+
+
+@command(mutating=False, needs_selection=True)
 def measure_area(params):
 	"""Measure area of closed planar curve or surface"""
 	objects = selection.selected_objects()
 	if not objects:
 		return {"status": "error", "message": "No object selected"}
 
-	obj_id = objects[0]
-
-	if curve.is_curve(obj_id):
-		result = curve.curve_area(obj_id)
-		if result["status"] == "success":
-			return {"status": "success", "result": {"area": result["area"]}}
-		return result
-	elif surface.is_surface(obj_id):
-		result = surface.surface_area(obj_id)
-		if result["status"] == "success":
-			return {"status": "success", "result": {"area": result["area"]}}
-		return result
-
-	return {"status": "error", "message": "Object must be a closed planar curve or surface"}
+	result = cache.cached("measure_area", objects[:1], lambda: object_area(objects[0]))
+	if result["status"] == "success":
+		return {"status": "success", "result": {"area": result["area"]}}
+	return result
 
 
+@command(mutating=False, cost="medium", needs_selection=True)
 def measure_volume(params):
 	"""Measure volume of closed surface"""
 	objects = selection.selected_objects()
 	if not objects:
 		return {"status": "error", "message": "No object selected"}
 
-	result = surface.surface_volume(objects[0])
+	result = cache.cached("measure_volume", objects[:1], lambda: surface.surface_volume(objects[0]))
 	if result["status"] == "success":
 		return {"status": "success", "result": {"volume": result["volume"]}}
 	return result
 
 
-def get_scene_info(params):
-	"""Get scene information"""
-	all_objs = selection.all_objects()
-	layers = layer.layer_names()
+def scene_summary(object_count, obj_types):
+	"""Build the get_scene_info result from object counts"""
+	layers = [row[1] for row in layer.layer_table()]
+	return {
+		"object_count": object_count,
+		"layer_count": len(layers),
+		"layers": layers,
+		"object_types": obj_types,
+		"unit_system": document.unit_system_name()
+	}
+
 
+def stream_scene_objects(params):
+	"""
+	Yield an id/type record per object (streaming form of get_scene_info)
+	return: the get_scene_info summary once every object has been yielded
+	"""
+	all_objs = selection.all_objects()
 	obj_types = {}
 	for obj_id in all_objs:
 		obj_type = obj.object_type(obj_id)
 		obj_types[obj_type] = obj_types.get(obj_type, 0) + 1
+		yield {"id": str(obj_id), "type": obj_type}
+	return scene_summary(len(all_objs), obj_types)
 
-	return {
-		"status": "success",
-		"result": {
-			"object_count": len(all_objs),
-			"layer_count": len(layers),
-			"layers": layers,
-			"object_types": obj_types,
-			"unit_system": document.unit_system_name()
-		}
-	}
 
+@command(mutating=False, stream=stream_scene_objects)
+def get_scene_info(params):
+	"""Get scene information from the scene index, scanning only if it is not built"""
+	counts = scene.snapshot()
+	if counts is None:
+		all_objs = selection.all_objects()
+		obj_types = {}
+		for obj_id in all_objs:
+			obj_type = obj.object_type(obj_id)
+			obj_types[obj_type] = obj_types.get(obj_type, 0) + 1
+		return {"status": "success", "result": scene_summary(len(all_objs), obj_types)}
+
+	result = scene_summary(counts["object_count"], counts["type"])
+	result["objects_by_layer"] = scene.layer_counts(counts)
+	result["objects_by_group"] = scene.group_counts(counts)
+	result["named_objects"] = sum(counts["name"].values())
+	return {"status": "success", "result": result}
 
-def get_selected_objects(params):
-	"""Get selected objects info"""
-	objects = selection.selected_objects()
 
-	if not objects:
-		return {"status": "success", "result": {"count": 0, "objects": []}}
+@command(mutating=False, cost="heavy")
+def check_scene_index(params):
+	"""
+	Verify the scene index against a full rescan of the document
+	params: {"repair": rebuild the index if it is inconsistent (default False)}
+	"""
+	return {"status": "success", "result": scene.check(params.get("repair", False))}
+
+
+def page_result(key, items, info):
+	"""
+	Build the response of a paginated listing
+	key: result key holding the page items
+	items: items on the page
+	info: page info returned by utility.paginate
+	return: response dict with the items, count, total and next_cursor
+	"""
+	result = {key: items, "count": len(items)}
+	result.update(info)
+	return {"status": "success", "result": result}
 
-	obj_info = []
-	for obj_id in objects:
-		info = {
-			"id": str(obj_id),
-			"type": obj.object_type(obj_id),
-			"layer": obj.object_layer(obj_id),
-			"name": obj.object_name(obj_id)
-		}
-		bbox = geometry.bounding_box(obj_id)
-		if bbox:
-			info["bounding_box"] = [[p[0], p[1], p[2]] for p in bbox]
-		obj_info.append(info)
 
-	return {"status": "success", "result": {"count": len(objects), "objects": obj_info}}
+def requested_fields(params):
+	"""
+	Get the fields param of an object listing
+	return: tuple of field names, or None if one is unknown
+	"""
+	fields = params.get("fields", obj.OBJECT_FIELDS)
+	if any(field not in obj.OBJECT_FIELDS for field in fields):
+		return None
+	return tuple(fields)
+
+
+def stream_selected_objects(params):
+	"""Yield selected object records one at a time (streaming form of get_selected_objects)"""
+	fields = requested_fields(params)
+	if fields is None:
+		raise ValueError("fields must be chosen from " + ", ".join(obj.OBJECT_FIELDS))
+	for rhino_obj in selection.selected_rhino_objects():
+		yield obj.object_records([rhino_obj], fields)[0]
+
+
+@command(mutating=False, cost="medium", needs_selection=True, stream=stream_selected_objects)
+def get_selected_objects(params):
+	"""
+	Get selected objects info, one page at a time
+	params: {"fields": subset of type, layer, name, bounding_box (default all),
+		"limit": page size (default all), "cursor": next_cursor of the previous page}
+	"""
+	fields = requested_fields(params)
+	if fields is None:
+		message = "fields must be chosen from " + ", ".join(obj.OBJECT_FIELDS)
+		return {"status": "error", "message": message}
+	page, info = utility.paginate(
+		selection.selected_rhino_objects(), lambda o: o.RuntimeSerialNumber, params)
+	return page_result("objects", obj.object_records(page, fields), info)
+
+
+# ============================================================================
+# SPATIAL QUERIES
+# ============================================================================
+# Answered from the spatial index on the handler thread, without waiting for
+# the UI thread. Distances are to each object's world bounding box.
+
+@command(mutating=False, control=True)
+def objects_in_box(params):
+	"""
+	Find objects whose bounding box meets a query box
+	params: {"min": [x, y, z], "max": [x, y, z],
+		"contained": only objects entirely inside the box (default False)}
+	"""
+	corner_min = params.get("min")
+	corner_max = params.get("max")
+	if corner_min is None or corner_max is None:
+		return {"status": "error", "message": "min and max are required"}
+	ids = spatial.objects_in_box(corner_min, corner_max, params.get("contained", False))
+	return {"status": "success", "result": {"count": len(ids), "ids": ids}}
+
+
+@command(mutating=False, control=True)
+def objects_in_sphere(params):
+	"""
+	Find objects whose bounding box is within radius of a point, nearest first
+	params: {"center": [x, y, z], "radius": query radius}
+	"""
+	center = params.get("center", [0, 0, 0])
+	radius = params.get("radius")
+	if radius is None or radius < 0:
+		return {"status": "error", "message": "radius must be a non-negative number"}
+	hits = spatial.objects_in_sphere(center, radius)
+	objects = [{"id": object_id, "distance": dist} for object_id, dist in hits]
+	return {"status": "success", "result": {"count": len(objects), "objects": objects}}
+
+
+@command(mutating=False, control=True)
+def nearest_objects(params):
+	"""
+	Find the objects nearest to a point, nearest first
+	params: {"point": [x, y, z], "count": number of objects (default 1)}
+	"""
+	point = params.get("point", [0, 0, 0])
+	count = params.get("count", 1)
+	hits = spatial.nearest_objects(point, count)
+	objects = [{"id": object_id, "distance": dist} for object_id, dist in hits]
+	return {"status": "success", "result": {"count": len(objects), "objects": objects}}
 
 
 # ============================================================================
 # SELECTION
 # ============================================================================
 
+@command(mutating=False, redraw=True)
 def select_all(params):
 	"""Select all objects"""
 	all_objs = selection.all_objects()
@@ -704,12 +997,14 @@ def select_all(params):
 	return {"status": "success", "result": {"count": 0}}
 
 
+@command(mutating=False, redraw=True)
 def unselect_all(params):
 	"""Unselect all objects"""
 	selection.unselect_all_objects()
 	return {"status": "success", "result": {"message": "All objects unselected"}}
 
 
+@command(mutating=False, redraw=True)
 def select_by_type(params):
 	"""Select objects by type"""
 	obj_type = params.get("type", "curve")
@@ -731,6 +1026,7 @@ def select_by_type(params):
 	return {"status": "success", "result": {"count": 0}}
 
 
+@command(mutating=False, redraw=True)
 def select_by_layer(params):
 	"""Select objects by layer"""
 	layer_name = params.get("layer", "")
@@ -745,6 +1041,7 @@ def select_by_layer(params):
 	return {"status": "success", "result": {"count": 0}}
 
 
+@command(needs_selection=True)
 def delete_selected(params):
 	"""Delete selected objects"""
 	objects = selection.selected_objects()
@@ -758,6 +1055,7 @@ def delete_selected(params):
 	return result
 
 
+@command(needs_selection=True, redraw=False)
 def set_object_name(params):
 	"""Set object name"""
 	name = params.get("name", "")
@@ -772,6 +1070,7 @@ def set_object_name(params):
 	return {"status": "success", "result": {"count": len(objects)}}
 
 
+@command(needs_selection=True)
 def set_object_color(params):
 	"""Set object color"""
 	color = params.get("color", [255, 0, 0])
@@ -786,6 +1085,7 @@ def set_object_color(params):
 	return {"status": "success", "result": {"count": len(objects)}}
 
 
+@command(needs_selection=True)
 def set_object_layer(params):
 	"""Set object layer"""
 	layer_name = params.get("layer", "")
@@ -807,6 +1107,7 @@ def set_object_layer(params):
 # NEW SURFACE OPERATIONS (Phase 1)
 # ============================================================================
 
+@command(cost="medium")
 def create_pipe(params):
 	"""Create a pipe along a curve"""
 	curve_id = params.get("curve_id")
@@ -818,6 +1119,7 @@ def create_pipe(params):
 	return result
 
 
+@command(cost="heavy")
 def sweep1(params):
 	"""Sweep shapes along one rail"""
 	rail = params.get("rail")
@@ -828,6 +1130,7 @@ def sweep1(params):
 	return result
 
 
+@command(cost="heavy")
 def sweep2(params):
 	"""Sweep shapes along two rails"""
 	rails = params.get("rails", [])
@@ -838,6 +1141,7 @@ def sweep2(params):
 	return result
 
 
+@command(cost="medium")
 def create_planar_surface(params):
 	"""Create planar surface from curves"""
 	curve_ids = params.get("curve_ids", [])
@@ -847,6 +1151,7 @@ def create_planar_surface(params):
 	return result
 
 
+@command(cost="medium")
 def create_edge_surface(params):
 	"""Create edge surface"""
 	curve_ids = params.get("curve_ids", [])
@@ -856,6 +1161,7 @@ def create_edge_surface(params):
 	return result
 
 
+@command(cost="heavy")
 def create_network_surface(params):
 	"""Create network surface"""
 	curve_ids = params.get("curve_ids", [])
@@ -866,6 +1172,7 @@ def create_network_surface(params):
 	return result
 
 
+@command(cost="heavy")
 def create_patch(params):
 	"""Create patch surface"""
 	object_ids = params.get("object_ids", [])
@@ -877,6 +1184,7 @@ def create_patch(params):
 	return result
 
 
+@command(cost="medium")
 def offset_surface(params):
 	"""Offset a surface"""
 	surface_id = params.get("surface_id")
@@ -887,6 +1195,7 @@ def offset_surface(params):
 	return result
 
 
+@command(cost="medium")
 def split_brep(params):
 	"""Split a brep"""
 	brep_id = params.get("brep_id")
@@ -897,6 +1206,7 @@ def split_brep(params):
 	return result
 
 
+@command(cost="heavy")
 def fillet_surfaces(params):
 	"""Fillet between two surfaces"""
 	srf1 = params.get("surface1_id")
@@ -908,6 +1218,7 @@ def fillet_surfaces(params):
 	return result
 
 
+@command(cost="medium")
 def cap_planar_holes(params):
 	"""Cap planar holes"""
 	brep_id = params.get("brep_id")
@@ -917,6 +1228,7 @@ def cap_planar_holes(params):
 	return result
 
 
+@command(cost="medium")
 def extrude_curve_along_curve(params):
 	"""Extrude curve along another curve"""
 	curve_id = params.get("curve_id")
@@ -927,6 +1239,7 @@ def extrude_curve_along_curve(params):
 	return result
 
 
+@command(cost="medium")
 def extrude_curve_to_point(params):
 	"""Extrude curve to a point"""
 	curve_id = params.get("curve_id")
@@ -937,6 +1250,7 @@ def extrude_curve_to_point(params):
 	return result
 
 
+@command()
 def duplicate_edge_curves(params):
 	"""Duplicate edge curves of a brep"""
 	brep_id = params.get("brep_id")
@@ -946,6 +1260,7 @@ def duplicate_edge_curves(params):
 	return result
 
 
+@command(cost="medium")
 def duplicate_surface_border(params):
 	"""Duplicate surface border"""
 	surface_id = params.get("surface_id")
@@ -955,6 +1270,7 @@ def duplicate_surface_border(params):
 	return result
 
 
+@command(cost="medium")
 def join_surfaces(params):
 	"""Join surfaces"""
 	surface_ids = params.get("surface_ids", [])
@@ -964,6 +1280,7 @@ def join_surfaces(params):
 	return result
 
 
+@command(cost="medium")
 def explode_polysurfaces(params):
 	"""Explode polysurfaces"""
 	brep_id = params.get("brep_id")
@@ -973,6 +1290,7 @@ def explode_polysurfaces(params):
 	return result
 
 
+@command(cost="medium")
 def unroll_surface(params):
 	"""Unroll a surface"""
 	surface_id = params.get("surface_id")
@@ -986,6 +1304,7 @@ def unroll_surface(params):
 # NEW CURVE OPERATIONS (Phase 1)
 # ============================================================================
 
+@command()
 def create_rectangle(params):
 	"""Create a rectangle"""
 	center = params.get("center", [0, 0, 0])
@@ -998,6 +1317,7 @@ def create_rectangle(params):
 	return result
 
 
+@command()
 def create_spiral(params):
 	"""Create a spiral"""
 	point0 = params.get("point0", [0, 0, 0])
@@ -1012,21 +1332,29 @@ def create_spiral(params):
 	return result
 
 
+@command()
 def create_nurbs_curve(params):
 	"""Create a NURBS curve"""
 	points = params.get("points", [])
 	degree = params.get("degree", 3)
-	points_tuple = [tuple(pt) for pt in points]
+	weights = params.get("weights", None)
+	if geometry.is_packed(points):
+		points_tuple = list(geometry.packed_points(points))
+	else:
+		points_tuple = [tuple(pt) for pt in points]
+	if weights is not None:
+		weights = list(weights)
 	# Generate uniform knot vector
 	n = len(points_tuple)
 	knot_count = n + degree - 1
 	knots = [i for i in range(knot_count)]
-	result = curve.add_nurbs_curve(points_tuple, knots, degree)
+	result = curve.add_nurbs_curve(points_tuple, knots, degree, weights)
 	if result["status"] == "success":
 		return {"status": "success", "result": {"id": result["id"], "type": "nurbs_curve"}}
 	return result
 
 
+@command()
 def create_blend_curve(params):
 	"""Create a blend curve"""
 	curve1 = params.get("curve1")
@@ -1043,6 +1371,7 @@ def create_blend_curve(params):
 	return result
 
 
+@command("divide_curve", cost="medium")
 def divide_curve_cmd(params):
 	"""Divide a curve into segments"""
 	curve_id = params.get("curve_id")
@@ -1054,6 +1383,7 @@ def divide_curve_cmd(params):
 	return result
 
 
+@command("divide_curve_length", cost="medium")
 def divide_curve_length_cmd(params):
 	"""Divide curve by length"""
 	curve_id = params.get("curve_id")
@@ -1065,6 +1395,7 @@ def divide_curve_length_cmd(params):
 	return result
 
 
+@command(cost="medium")
 def split_curve(params):
 	"""Split a curve at parameters"""
 	curve_id = params.get("curve_id")
@@ -1075,6 +1406,7 @@ def split_curve(params):
 	return result
 
 
+@command()
 def close_curve(params):
 	"""Close an open curve"""
 	curve_id = params.get("curve_id")
@@ -1084,6 +1416,7 @@ def close_curve(params):
 	return result
 
 
+@command()
 def reverse_curve(params):
 	"""Reverse curve direction"""
 	curve_id = params.get("curve_id")
@@ -1093,6 +1426,7 @@ def reverse_curve(params):
 	return result
 
 
+@command(cost="medium")
 def rebuild_curve(params):
 	"""Rebuild a curve"""
 	curve_id = params.get("curve_id")
@@ -1104,6 +1438,7 @@ def rebuild_curve(params):
 	return result
 
 
+@command(cost="medium")
 def project_curve_to_surface(params):
 	"""Project curves onto surfaces"""
 	curve_ids = params.get("curve_ids", [])
@@ -1119,6 +1454,7 @@ def project_curve_to_surface(params):
 # CURVE ANALYSIS (Phase 5)
 # ============================================================================
 
+@command(mutating=False)
 def curve_closest_point(params):
 	"""Find closest point on curve"""
 	curve_id = params.get("curve_id")
@@ -1129,6 +1465,7 @@ def curve_closest_point(params):
 	return result
 
 
+@command(mutating=False)
 def evaluate_curve(params):
 	"""Evaluate curve at parameter"""
 	curve_id = params.get("curve_id")
@@ -1139,6 +1476,7 @@ def evaluate_curve(params):
 	return result
 
 
+@command(mutating=False)
 def curve_start_end_points(params):
 	"""Get curve start/end points"""
 	curve_id = params.get("curve_id")
@@ -1148,11 +1486,13 @@ def curve_start_end_points(params):
 	return result
 
 
+@command(mutating=False)
 def curve_curve_intersection(params):
 	"""Find curve-curve intersections"""
 	curve1 = params.get("curve1")
 	curve2 = params.get("curve2")
-	result = curve.curve_curve_intersection(curve1, curve2)
+	result = cache.cached("curve_curve_intersection", [curve1, curve2],
+		lambda: curve.curve_curve_intersection(curve1, curve2))
 	if result["status"] == "success":
 		return {"status": "success", "result": result}
 	return result
@@ -1162,16 +1502,19 @@ def curve_curve_intersection(params):
 # MESH OPERATIONS (Phase 2)
 # ============================================================================
 
+@command(cost="medium")
 def create_mesh(params):
 	"""Create a mesh"""
 	vertices = params.get("vertices", [])
 	faces = params.get("faces", [])
-	result = mesh.add_mesh(vertices, faces)
+	face_size = params.get("face_size", 4)
+	result = mesh.add_mesh(vertices, faces, face_size)
 	if result["status"] == "success":
 		return {"status": "success", "result": result}
 	return result
 
 
+@command(cost="medium")
 def create_planar_mesh(params):
 	"""Create a planar mesh from a closed curve"""
 	curve_id = params.get("curve_id")
@@ -1181,6 +1524,7 @@ def create_planar_mesh(params):
 	return result
 
 
+@command(cost="medium")
 def mesh_from_surface(params):
 	"""Mesh brep/surface objects"""
 	object_ids = params.get("object_ids", [])
@@ -1190,6 +1534,7 @@ def mesh_from_surface(params):
 	return result
 
 
+@command(cost="heavy")
 def mesh_boolean_union(params):
 	"""Mesh boolean union"""
 	mesh_ids = params.get("mesh_ids", [])
@@ -1199,6 +1544,7 @@ def mesh_boolean_union(params):
 	return result
 
 
+@command(cost="heavy")
 def mesh_boolean_difference(params):
 	"""Mesh boolean difference"""
 	input_ids = params.get("input_ids", [])
@@ -1209,6 +1555,7 @@ def mesh_boolean_difference(params):
 	return result
 
 
+@command(cost="heavy")
 def mesh_boolean_intersection(params):
 	"""Mesh boolean intersection"""
 	mesh_ids1 = params.get("mesh_ids1", [])
@@ -1219,6 +1566,7 @@ def mesh_boolean_intersection(params):
 	return result
 
 
+@command(cost="medium")
 def join_meshes(params):
 	"""Join meshes"""
 	mesh_ids = params.get("mesh_ids", [])
@@ -1228,6 +1576,7 @@ def join_meshes(params):
 	return result
 
 
+@command(cost="heavy")
 def mesh_to_nurb(params):
 	"""Convert mesh to NURBS"""
 	mesh_id = params.get("mesh_id")
@@ -1237,6 +1586,7 @@ def mesh_to_nurb(params):
 	return result
 
 
+@command(cost="medium")
 def mesh_offset(params):
 	"""Offset a mesh"""
 	mesh_id = params.get("mesh_id")
@@ -1251,6 +1601,7 @@ def mesh_offset(params):
 # GROUP OPERATIONS (Phase 2)
 # ============================================================================
 
+@command(redraw=False)
 def create_group(params):
 	"""Create a group"""
 	name = params.get("name")
@@ -1263,6 +1614,7 @@ def create_group(params):
 	return result
 
 
+@command(redraw=False)
 def delete_group(params):
 	"""Delete a group"""
 	name = params.get("name")
@@ -1272,6 +1624,7 @@ def delete_group(params):
 	return result
 
 
+@command(redraw=False)
 def add_to_group(params):
 	"""Add objects to a group"""
 	name = params.get("name")
@@ -1282,6 +1635,7 @@ def add_to_group(params):
 	return result
 
 
+@command(redraw=False)
 def remove_from_group(params):
 	"""Remove objects from a group"""
 	name = params.get("name")
@@ -1292,14 +1646,26 @@ def remove_from_group(params):
 	return result
 
 
+def stream_groups(params):
+	"""Yield group records one at a time by name (streaming form of list_groups)"""
+	for name in sorted(group.group_names()["groups"]):
+		yield {"name": name}
+
+
+@command(mutating=False, stream=stream_groups)
 def list_groups(params):
-	"""List all groups"""
+	"""
+	List group names, one page at a time
+	params: {"limit": page size (default all), "cursor": next_cursor of the previous page}
+	"""
 	result = group.group_names()
-	if result["status"] == "success":
-		return {"status": "success", "result": result}
-	return result
+	if result["status"] != "success":
+		return result
+	names, info = utility.paginate(result["groups"], str, params)
+	return page_result("groups", names, info)
 
 
+@command(mutating=False, redraw=True)
 def select_by_group(params):
 	"""Select objects by group"""
 	name = params.get("name")
@@ -1313,6 +1679,7 @@ def select_by_group(params):
 # VIEW OPERATIONS (Phase 3)
 # ============================================================================
 
+@command(mutating=False, redraw=True)
 def set_view_camera(params):
 	"""Set view camera"""
 	camera = params.get("camera", [0, 0, 50])
@@ -1323,18 +1690,21 @@ def set_view_camera(params):
 	return result
 
 
+@command(mutating=False, redraw=True)
 def zoom_extents(params):
 	"""Zoom to extents"""
 	result = view.zoom_extents()
 	return {"status": "success", "result": result}
 
 
+@command(mutating=False, redraw=True)
 def zoom_selected(params):
 	"""Zoom to selected"""
 	result = view.zoom_selected()
 	return {"status": "success", "result": result}
 
 
+@command(mutating=False)
 def get_view_info(params):
 	"""Get view info"""
 	result = view.get_view_info()
@@ -1343,6 +1713,7 @@ def get_view_info(params):
 	return result
 
 
+@command(mutating=False, redraw=True)
 def set_display_mode(params):
 	"""Set display mode"""
 	mode = params.get("mode", "Shaded")
@@ -1352,6 +1723,7 @@ def set_display_mode(params):
 	return result
 
 
+@command(redraw=False)
 def add_named_view(params):
 	"""Add a named view"""
 	name = params.get("name")
@@ -1361,6 +1733,7 @@ def add_named_view(params):
 	return result
 
 
+@command(mutating=False, redraw=True)
 def restore_named_view(params):
 	"""Restore a named view"""
 	name = params.get("name")
@@ -1370,6 +1743,7 @@ def restore_named_view(params):
 	return result
 
 
+@command(mutating=False, cost="heavy")
 def capture_viewport(params):
 	"""Capture viewport to base64 PNG image"""
 	width = params.get("width", 800)
@@ -1384,6 +1758,7 @@ def capture_viewport(params):
 # BLOCK OPERATIONS (Phase 3)
 # ============================================================================
 
+@command(cost="medium")
 def create_block(params):
 	"""Create a block definition"""
 	object_ids = params.get("object_ids", [])
@@ -1395,6 +1770,7 @@ def create_block(params):
 	return result
 
 
+@command()
 def insert_block(params):
 	"""Insert a block instance"""
 	name = params.get("name")
@@ -1407,6 +1783,7 @@ def insert_block(params):
 	return result
 
 
+@command()
 def explode_block(params):
 	"""Explode a block instance"""
 	block_id = params.get("block_id")
@@ -1416,6 +1793,7 @@ def explode_block(params):
 	return result
 
 
+@command()
 def delete_block(params):
 	"""Delete a block definition"""
 	name = params.get("name")
@@ -1425,18 +1803,30 @@ def delete_block(params):
 	return result
 
 
+def stream_blocks(params):
+	"""Yield block definition records one at a time by name (streaming form of list_blocks)"""
+	for name in sorted(block.block_names()["blocks"]):
+		yield {"name": name}
+
+
+@command(mutating=False, stream=stream_blocks)
 def list_blocks(params):
-	"""List block definitions"""
+	"""
+	List block definition names, one page at a time
+	params: {"limit": page size (default all), "cursor": next_cursor of the previous page}
+	"""
 	result = block.block_names()
-	if result["status"] == "success":
-		return {"status": "success", "result": result}
-	return result
+	if result["status"] != "success":
+		return result
+	names, info = utility.paginate(result["blocks"], str, params)
+	return page_result("blocks", names, info)
 
 
 # ============================================================================
 # MATERIAL OPERATIONS (Phase 3)
 # ============================================================================
 
+@command()
 def add_material_to_object(params):
 	"""Add material to object"""
 	object_id = params.get("object_id")
@@ -1448,6 +1838,7 @@ def add_material_to_object(params):
 	return result
 
 
+@command()
 def add_material_to_layer(params):
 	"""Add material to layer"""
 	layer_name = params.get("layer_name")
@@ -1457,6 +1848,7 @@ def add_material_to_layer(params):
 	return result
 
 
+@command()
 def set_material_color(params):
 	"""Set material color"""
 	object_id = params.get("object_id")
@@ -1468,6 +1860,7 @@ def set_material_color(params):
 	return {"status": "success", "result": result}
 
 
+@command()
 def set_material_transparency(params):
 	"""Set material transparency"""
 	object_id = params.get("object_id")
@@ -1479,6 +1872,7 @@ def set_material_transparency(params):
 	return {"status": "success", "result": result}
 
 
+@command()
 def set_material_shine(params):
 	"""Set material shine"""
 	object_id = params.get("object_id")
@@ -1494,6 +1888,7 @@ def set_material_shine(params):
 # OBJECT OPERATIONS (Phase 4)
 # ============================================================================
 
+@command(needs_selection=True)
 def hide_objects(params):
 	"""Hide selected objects"""
 	objects = selection.selected_objects()
@@ -1505,6 +1900,7 @@ def hide_objects(params):
 	return result
 
 
+@command()
 def show_objects(params):
 	"""Show hidden objects"""
 	object_ids = params.get("object_ids", [])
@@ -1522,6 +1918,7 @@ def show_objects(params):
 	return result
 
 
+@command(needs_selection=True)
 def lock_objects(params):
 	"""Lock selected objects"""
 	objects = selection.selected_objects()
@@ -1533,6 +1930,7 @@ def lock_objects(params):
 	return result
 
 
+@command()
 def unlock_objects(params):
 	"""Unlock locked objects"""
 	object_ids = params.get("object_ids", [])
@@ -1549,33 +1947,55 @@ def unlock_objects(params):
 	return result
 
 
+@command(mutating=False)
 def is_object_solid(params):
 	"""Check if object is solid"""
 	object_id = params.get("object_id")
-	result = obj.is_object_solid(object_id)
+	result = cache.cached("is_object_solid", [object_id], lambda: obj.is_object_solid(object_id))
 	return {"status": "success", "result": result}
 
 
+@command(mutating=False)
+def flush_result_cache(params):
+	"""
+	Empty the measurement and analysis result cache
+	Runs on the UI thread, in order with the commands that fill the cache.
+	return: the cache's size and hit, miss and eviction counts before the flush
+	"""
+	return {"status": "success", "result": cache.flush()}
+
+
 # ============================================================================
 # SELECTION OPERATIONS (Phase 4)
 # ============================================================================
 
+@command(mutating=False, redraw=True)
 def select_by_name(params):
-	"""Select objects by name"""
+	"""
+	Select every object with a name, returning their ids a page at a time
+	params: {"name": object name, "limit": page size (default all),
+		"cursor": next_cursor of the previous page}
+	"""
 	name = params.get("name", "")
 	objects = selection.objects_by_name(name)
 	if objects:
 		selection.select_objects(objects)
-		return {"status": "success", "result": {"count": len(objects)}}
-	return {"status": "success", "result": {"count": 0}}
+	ids, info = utility.paginate(objects, str, params)
+	return page_result("ids", ids, info)
 
 
+@command(mutating=False, redraw=True)
 def last_created_objects(params):
-	"""Select last created objects"""
+	"""
+	Select the last created objects, returning their ids a page at a time
+	params: {"limit": page size (default all), "cursor": next_cursor of the previous page}
+	"""
 	objects = selection.last_created_objects(select=True)
-	return {"status": "success", "result": {"count": len(objects), "ids": objects}}
+	ids, info = utility.paginate(objects, str, params)
+	return page_result("ids", ids, info)
 
 
+@command(mutating=False, needs_selection=True, redraw=True)
 def invert_selection(params):
 	"""Invert selection"""
 	count = selection.invert_selected_objects()
@@ -1586,6 +2006,7 @@ def invert_selection(params):
 # DOCUMENT OPERATIONS (Phase 4)
 # ============================================================================
 
+@command(mutating=False)
 def get_document_info(params):
 	"""Get document info"""
 	return {
@@ -1599,6 +2020,7 @@ def get_document_info(params):
 	}
 
 
+@command(redraw=False)
 def set_unit_system(params):
 	"""Set unit system"""
 	system = params.get("system", 4)
@@ -1606,6 +2028,7 @@ def set_unit_system(params):
 	return {"status": "success", "result": {"system": system}}
 
 
+@command(mutating=False, redraw=True)
 def enable_redraw(params):
 	"""Enable/disable redraw"""
 	enable = params.get("enable", True)
@@ -1617,8 +2040,15 @@ def enable_redraw(params):
 # TRANSFORM OPERATIONS (Phase 4)
 # ============================================================================
 
+@command(cost="medium", needs_selection=True)
 def array_polar(params):
-	"""Create polar array"""
+	"""
+	Create polar array around an axis through center
+	The axis defaults to the active construction plane's normal, as
+	rs.RotateObject uses. Every copy is added in one pass from precomputed
+	rotations, as full copies or, with as_blocks, as instances of a block
+	made from the selection.
+	"""
 	center = params.get("center", [0, 0, 0])
 	count = params.get("count", 6)
 	total_angle = params.get("angle", 360)
@@ -1627,20 +2057,18 @@ def array_polar(params):
 	if not objects:
 		return {"status": "error", "message": "No objects selected"}
 
-	angle_step = total_angle / count
-	total_created = 0
-
-	for obj_id in objects:
-		for i in range(1, count):
-			new_id = rs.CopyObject(obj_id)
-			if new_id:
-				rs.RotateObject(new_id, center, angle_step * i)
-				total_created += 1
-
-	document.redraw()
-	return {"status": "success", "result": {"created": total_created}}
+	angle_step = math.radians(total_angle / count)
+	if params.get("axis"):
+		axis = Rhino.Geometry.Vector3d(*params["axis"])
+	else:
+		axis = view.construction_plane_normal()
+	origin = Rhino.Geometry.Point3d(*center)
+	transforms = [Rhino.Geometry.Transform.Rotation(angle_step * i, axis, origin)
+		for i in range(1, count)]
+	return array_copies(objects, transforms, params)
 
 
+@command(cost="medium", needs_selection=True)
 def orient_objects(params):
 	"""Orient objects from reference to target (translation)"""
 	reference = params.get("reference", [0, 0, 0])
@@ -1667,6 +2095,7 @@ def orient_objects(params):
 # ANNOTATION OPERATIONS (Phase 4)
 # ============================================================================
 
+@command()
 def add_text(params):
 	"""Add text"""
 	text = params.get("text", "")
@@ -1679,6 +2108,7 @@ def add_text(params):
 	return result
 
 
+@command()
 def add_text_dot(params):
 	"""Add text dot"""
 	text = params.get("text", "")
@@ -1689,6 +2119,7 @@ def add_text_dot(params):
 	return result
 
 
+@command()
 def add_leader(params):
 	"""Add leader"""
 	points = params.get("points", [])
@@ -1704,6 +2135,7 @@ def add_leader(params):
 # USER DATA OPERATIONS (Phase 5)
 # ============================================================================
 
+@command(redraw=False)
 def set_user_text(params):
 	"""Set user text on object"""
 	object_id = params.get("object_id")
@@ -1715,6 +2147,7 @@ def set_user_text(params):
 	return result
 
 
+@command(mutating=False)
 def get_user_text(params):
 	"""Get user text from object"""
 	object_id = params.get("object_id")
@@ -1725,6 +2158,7 @@ def get_user_text(params):
 	return result
 
 
+@command(redraw=False)
 def set_document_user_text(params):
 	"""Set document user text"""
 	key = params.get("key")
@@ -1735,6 +2169,7 @@ def set_document_user_text(params):
 	return result
 
 
+@command(mutating=False)
 def get_document_user_text(params):
 	"""Get document user text"""
 	key = params.get("key", None)
@@ -1748,6 +2183,7 @@ def get_document_user_text(params):
 # CODE EXECUTION
 # ============================================================================
 
+@command(cost="heavy", redraw=True)
 def execute_python_code(params):
 	"""Execute arbitrary Python code with access to rhinoscriptsyntax"""
 	code = params.get("code", "")
@@ -1788,3 +2224,4 @@ def execute_python_code(params):
 		if 'old_stdout' in locals():
 			sys.stdout = old_stdout
 		return {"status": "error", "message": "Execution error: {0}".format(str(e))}
+
@@ -5,12 +5,14 @@ Direct wrappers around rs.Add*, rs.Curve*, etc.
 
 import rhinoscriptsyntax as rs
 
+from . import geometry, document
+
 
 def add_line(start, end):
 	"""Add a line curve"""
 	line_id = rs.AddLine(start, end)
 	if line_id:
-		rs.Redraw()
+		document.redraw()
 		return {"status": "success", "id": str(line_id)}
 	return {"status": "error", "message": "Failed to add line"}
 
@@ -19,16 +21,42 @@ def add_circle(center, radius):
 	"""Add a circle curve"""
 	circle_id = rs.AddCircle(center, radius)
 	if circle_id:
-		rs.Redraw()
+		document.redraw()
 		return {"status": "success", "id": str(circle_id)}
 	return {"status": "error", "message": "Failed to add circle"}
 
 
+def add_lines(starts, ends):
+	"""
+	Add many line curves
+	starts: list of Point3d
+	ends: list of Point3d, one per start
+	return: result dict with the new ids
+	"""
+	import Rhino
+	import scriptcontext
+	lines = (Rhino.Geometry.Line(start, end) for start, end in zip(starts, ends))
+	return geometry.add_all(scriptcontext.doc.Objects.AddLine, lines)
+
+
+def add_circles(centers, radii):
+	"""
+	Add many circles parallel to the world XY plane
+	centers: list of Point3d
+	radii: list of radii, one per center
+	return: result dict with the new ids
+	"""
+	import Rhino
+	import scriptcontext
+	circles = (Rhino.Geometry.Circle(center, radius) for center, radius in zip(centers, radii))
+	return geometry.add_all(scriptcontext.doc.Objects.AddCircle, circles)
+
+
 def add_arc_3pt(start, mid, end):
 	"""Add arc through 3 points"""
 	arc_id = rs.AddArc3Pt(start, mid, end)
 	if arc_id:
-		rs.Redraw()
+		document.redraw()
 		return {"status": "success", "id": str(arc_id)}
 	return {"status": "error", "message": "Failed to add arc"}
 
@@ -37,27 +65,48 @@ def add_ellipse(plane, x_radius, y_radius):
 	"""Add an ellipse"""
 	ellipse_id = rs.AddEllipse(plane, x_radius, y_radius)
 	if ellipse_id:
-		rs.Redraw()
+		document.redraw()
 		return {"status": "success", "id": str(ellipse_id)}
 	return {"status": "error", "message": "Failed to add ellipse"}
 
 
 def add_polyline(points):
-	"""Add a polyline"""
+	"""Add a polyline from a list of points or a packed x,y,z array"""
+	if geometry.is_packed(points):
+		return add_packed_polyline(points)
 	points_tuple = [tuple(pt) for pt in points]
 	polyline_id = rs.AddPolyline(points_tuple)
 	if polyline_id:
-		rs.Redraw()
+		document.redraw()
+		return {"status": "success", "id": str(polyline_id)}
+	return {"status": "error", "message": "Failed to add polyline"}
+
+
+def add_packed_polyline(points):
+	"""Build a polyline straight from a packed x,y,z array"""
+	import Rhino
+	import scriptcontext
+	import System
+	polyline = Rhino.Geometry.Polyline(len(points) // 3)
+	it = iter(points)
+	for x, y, z in zip(it, it, it):
+		polyline.Add(x, y, z)
+	polyline_id = scriptcontext.doc.Objects.AddPolyline(polyline)
+	if polyline_id != System.Guid.Empty:
+		document.redraw()
 		return {"status": "success", "id": str(polyline_id)}
 	return {"status": "error", "message": "Failed to add polyline"}
 
 
 def add_interp_curve(points, degree=3):
-	"""Add interpolated curve"""
-	points_tuple = [tuple(pt) for pt in points]
+	"""Add interpolated curve from a list of points or a packed x,y,z array"""
+	if geometry.is_packed(points):
+		points_tuple = list(geometry.packed_points(points))
+	else:
+		points_tuple = [tuple(pt) for pt in points]
 	curve_id = rs.AddInterpCurve(points_tuple, degree)
 	if curve_id:
-		rs.Redraw()
+		document.redraw()
 		return {"status": "success", "id": str(curve_id)}
 	return {"status": "error", "message": "Failed to add curve"}
 
@@ -66,7 +115,7 @@ def join_curves(curve_ids):
 	"""Join curves"""
 	result = rs.JoinCurves(curve_ids, delete_input=True)
 	if result:
-		rs.Redraw()
+		document.redraw()
 		return {"status": "success", "count": len(result), "ids": [str(x) for x in result]}
 	return {"status": "error", "message": "Failed to join curves"}
 
@@ -75,7 +124,7 @@ def explode_curves(curve_id, delete_input=True):
 	"""Explode curve into segments"""
 	segments = rs.ExplodeCurves(curve_id, delete_input)
 	if segments:
-		rs.Redraw()
+		document.redraw()
 		return {"status": "success", "count": len(segments), "ids": [str(x) for x in segments]}
 	return {"status": "error", "message": "Failed to explode curve"}
 
@@ -84,7 +133,7 @@ def offset_curve(curve_id, point, distance):
 	"""Offset curve"""
 	result = rs.OffsetCurve(curve_id, point, distance)
 	if result:
-		rs.Redraw()
+		document.redraw()
 		return {"status": "success", "id": str(result)}
 	return {"status": "error", "message": "Failed to offset curve"}
 
@@ -93,7 +142,7 @@ def extend_curve_length(curve_id, curve_type, side, length):
 	"""Extend curve length"""
 	result = rs.ExtendCurveLength(curve_id, curve_type, side, length)
 	if result:
-		rs.Redraw()
+		document.redraw()
 		return {"status": "success", "id": str(result)}
 	return {"status": "error", "message": "Failed to extend curve"}
 
@@ -134,7 +183,7 @@ def add_rectangle(plane, width, height):
 	"""Add a rectangle"""
 	rect_id = rs.AddRectangle(plane, width, height)
 	if rect_id:
-		rs.Redraw()
+		document.redraw()
 		return {"status": "success", "id": str(rect_id)}
 	return {"status": "error", "message": "Failed to add rectangle"}
 
@@ -145,7 +194,7 @@ def add_spiral(point0, point1, pitch, turns, radius0, radius1=None):
 		radius1 = radius0
 	spiral_id = rs.AddSpiral(point0, point1, pitch, turns, radius0, radius1)
 	if spiral_id:
-		rs.Redraw()
+		document.redraw()
 		return {"status": "success", "id": str(spiral_id)}
 	return {"status": "error", "message": "Failed to add spiral"}
 
@@ -154,7 +203,7 @@ def add_nurbs_curve(points, knots, degree, weights=None):
 	"""Add a NURBS curve"""
 	curve_id = rs.AddNurbsCurve(points, knots, degree, weights)
 	if curve_id:
-		rs.Redraw()
+		document.redraw()
 		return {"status": "success", "id": str(curve_id)}
 	return {"status": "error", "message": "Failed to add NURBS curve"}
 
@@ -163,7 +212,7 @@ def add_blend_curve(curves, parameters, reverses, continuities):
 	"""Add a blend curve between two curves"""
 	curve_id = rs.AddBlendCurve(curves, parameters, reverses, continuities)
 	if curve_id:
-		rs.Redraw()
+		document.redraw()
 		return {"status": "success", "id": str(curve_id)}
 	return {"status": "error", "message": "Failed to add blend curve"}
 
@@ -172,7 +221,7 @@ def add_fillet_curve(curve0, curve1, radius=1.0, base_point0=None, base_point1=N
 	"""Add a fillet curve between two curves"""
 	curve_id = rs.AddFilletCurve(curve0, curve1, radius, base_point0, base_point1)
 	if curve_id:
-		rs.Redraw()
+		document.redraw()
 		return {"status": "success", "id": str(curve_id)}
 	return {"status": "error", "message": "Failed to add fillet curve"}
 
@@ -181,7 +230,7 @@ def divide_curve(curve_id, segments, create_points=True):
 	"""Divide a curve into segments"""
 	points = rs.DivideCurve(curve_id, segments, create_points)
 	if points:
-		rs.Redraw()
+		document.redraw()
 		return {"status": "success", "count": len(points), "points": [[p[0], p[1], p[2]] for p in points]}
 	return {"status": "error", "message": "Failed to divide curve"}
 
@@ -190,7 +239,7 @@ def divide_curve_length(curve_id, length, create_points=True):
 	"""Divide a curve by arc length"""
 	points = rs.DivideCurveLength(curve_id, length, create_points)
 	if points:
-		rs.Redraw()
+		document.redraw()
 		return {"status": "success", "count": len(points), "points": [[p[0], p[1], p[2]] for p in points]}
 	return {"status": "error", "message": "Failed to divide curve by length"}
 
@@ -199,7 +248,7 @@ def split_curve(curve_id, parameters):
 	"""Split a curve at parameters"""
 	result = rs.SplitCurve(curve_id, parameters)
 	if result:
-		rs.Redraw()
+		document.redraw()
 		return {"status": "success", "count": len(result), "ids": [str(x) for x in result]}
 	return {"status": "error", "message": "Failed to split curve"}
 
@@ -220,14 +269,14 @@ def close_curve(curve_id, tolerance=-1):
 	dup = curve_geom.DuplicateCurve()
 	if dup.MakeClosed(tolerance):
 		scriptcontext.doc.Objects.Replace(curve_obj.Id, dup)
-		rs.Redraw()
+		document.redraw()
 		return {"status": "success", "id": str(curve_id)}
 	# Fallback: add a line segment from end to start and join
 	line = Rhino.Geometry.LineCurve(curve_geom.PointAtEnd, curve_geom.PointAtStart)
 	joined = Rhino.Geometry.Curve.JoinCurves([curve_geom, line], tolerance)
 	if joined and len(joined) == 1:
 		scriptcontext.doc.Objects.Replace(curve_obj.Id, joined[0])
-		rs.Redraw()
+		document.redraw()
 		return {"status": "success", "id": str(curve_id)}
 	return {"status": "error", "message": "Failed to close curve"}
 
@@ -236,7 +285,7 @@ def reverse_curve(curve_id):
 	"""Reverse curve direction"""
 	result = rs.ReverseCurve(curve_id)
 	if result:
-		rs.Redraw()
+		document.redraw()
 		return {"status": "success", "id": str(curve_id)}
 	return {"status": "error", "message": "Failed to reverse curve"}
 
@@ -251,7 +300,7 @@ def rebuild_curve(curve_id, degree=3, point_count=10):
 	nurbs = curve_geom.Rebuild(point_count, degree, True)
 	if nurbs:
 		scriptcontext.doc.Objects.Replace(curve_obj.Id, nurbs)
-		rs.Redraw()
+		document.redraw()
 		return {"status": "success", "id": str(curve_id)}
 	return {"status": "error", "message": "Failed to rebuild curve"}
 
@@ -260,7 +309,7 @@ def project_curve_to_surface(curve_ids, surface_ids, direction):
 	"""Project curves onto surfaces"""
 	result = rs.ProjectCurveToSurface(curve_ids, surface_ids, direction)
 	if result:
-		rs.Redraw()
+		document.redraw()
 		return {"status": "success", "count": len(result), "ids": [str(x) for x in result]}
 	return {"status": "error", "message": "Failed to project curve to surface"}
 
@@ -4,10 +4,29 @@ RhinoScriptSyntax document functions
 
 import rhinoscriptsyntax as rs
 
+# Set when something changed the viewport since the last flush_redraw
+redraw_pending = [False]
+
 
 def redraw():
-	"""Redraw the viewport"""
+	"""
+	Mark the viewport as needing a redraw
+	The listener redraws once per UI time slice via flush_redraw, so a
+	command or batch touching many objects costs a single redraw.
+	"""
+	redraw_pending[0] = True
+
+
+def flush_redraw():
+	"""
+	Redraw the viewport if it was marked dirty since the last flush
+	return: True if a redraw was performed
+	"""
+	if not redraw_pending[0]:
+		return False
+	redraw_pending[0] = False
 	rs.Redraw()
+	return True
 
 
 def unit_system_name():
@@ -37,3 +56,47 @@ def enable_redraw(enable=True):
 	"""Enable or disable viewport redraw"""
 	rs.EnableRedraw(enable)
 	return {"status": "success"}
+
+
+def suspend_redraw():
+	"""
+	Disable viewport redraw for a block of work
+	return: previous redraw state, to pass to resume_redraw
+	"""
+	return rs.EnableRedraw(False)
+
+
+def resume_redraw(previous):
+	"""Restore the redraw state and schedule one redraw if it was enabled"""
+	rs.EnableRedraw(previous)
+	if previous:
+		redraw()
+
+
+def begin_undo_record(description):
+	"""
+	Start an undo record so following changes undo as one step
+	description: text shown in Rhino's undo list
+	return: undo record serial number (0 if it could not be started)
+	"""
+	import scriptcontext
+	return scriptcontext.doc.BeginUndoRecord(description)
+
+
+def end_undo_record(serial):
+	"""
+	Finish an undo record started with begin_undo_record
+	serial: serial number returned by begin_undo_record
+	return: True on success
+	"""
+	import scriptcontext
+	return scriptcontext.doc.EndUndoRecord(serial)
+
+
+def undo():
+	"""
+	Undo the most recent undo record
+	return: True if something was undone
+	"""
+	import scriptcontext
+	return scriptcontext.doc.Undo()
@@ -0,0 +1,86 @@
+"""
+RhinoDoc event hub for the listener
+Subscribes once to the document events and fans each one out to the
+callbacks registered here, so indexes can follow document changes instead
+of rescanning. The .NET handlers are kept in scriptcontext.sticky, which
+survives re-running server.py, so a new subscription replaces the old one
+rather than doubling every event.
+Compatible with CPython 3 (Rhino 8)
+"""
+
+STICKY_KEY = "rhino_mcp.event_handlers"
+
+# RhinoDoc events the hub forwards
+EVENTS = (
+	"AddRhinoObject",
+	"DeleteRhinoObject",
+	"ReplaceRhinoObject",
+	"UndeleteRhinoObject",
+	"ModifyObjectAttributes",
+	"LayerTableEvent",
+	"NewDocument",
+	"EndOpenDocument",
+	"CloseDocument",
+	"ActiveDocumentChanged",
+)
+
+# Registered callbacks by event name
+listeners = dict((event, []) for event in EVENTS)
+
+
+def subscribe(event, callback):
+	"""
+	Call a function whenever a RhinoDoc event fires
+	event: event name from EVENTS
+	callback: function taking the event args
+	"""
+	if callback not in listeners[event]:
+		listeners[event].append(callback)
+
+
+def dispatch(event):
+	"""
+	Build the .NET handler for one event
+	event: event name from EVENTS
+	return: handler calling every callback subscribed to the event
+	"""
+	def handler(sender, args):
+		for callback in listeners[event]:
+			try:
+				callback(args)
+			except Exception as e:
+				print("Event callback error (" + event + "): " + str(e))
+	return handler
+
+
+def install():
+	"""
+	Subscribe the hub to RhinoDoc, replacing any earlier subscription
+	return: list of subscribed event names
+	"""
+	import Rhino
+	import scriptcontext
+	uninstall()
+	handlers = {}
+	for event in EVENTS:
+		handler = dispatch(event)
+		try:
+			getattr(Rhino.RhinoDoc, event).__iadd__(handler)
+		except Exception as e:
+			print("Cannot subscribe to " + event + ": " + str(e))
+			continue
+		handlers[event] = handler
+	scriptcontext.sticky[STICKY_KEY] = handlers
+	return list(handlers)
+
+
+def uninstall():
+	"""Remove the handlers of an earlier install(), if any"""
+	import Rhino
+	import scriptcontext
+	handlers = scriptcontext.sticky.pop(STICKY_KEY, None) or {}
+	for event, handler in handlers.items():
+		try:
+			getattr(Rhino.RhinoDoc, event).__isub__(handler)
+		except Exception as e:
+			print("Cannot unsubscribe from " + event + ": " + str(e))
@@ -2,14 +2,17 @@
 RhinoScriptSyntax geometry functions
 """
 
+import array
 import rhinoscriptsyntax as rs
 
+from . import document
+
 
 def add_point(x, y, z):
 	"""Add a point"""
 	point_id = rs.AddPoint(x, y, z)
 	if point_id:
-		rs.Redraw()
+		document.redraw()
 		return {"status": "success", "id": str(point_id)}
 	return {"status": "error", "message": "Failed to add point"}
 
@@ -17,3 +20,80 @@ def add_point(x, y, z):
 def bounding_box(obj_id):
 	"""Get object bounding box"""
 	return rs.BoundingBox(obj_id)
+
+
+def is_packed(values):
+	"""Check whether values arrived as a packed binary array"""
+	return isinstance(values, array.array)
+
+
+def packed_points(values):
+	"""
+	Iterate points stored in a packed flat x,y,z float64 array
+	values: array.array of 3 * n doubles
+	return: generator of Point3d
+	"""
+	import Rhino
+	it = iter(values)
+	for x, y, z in zip(it, it, it):
+		yield Rhino.Geometry.Point3d(x, y, z)
+
+
+def point_column(values):
+	"""
+	Convert a column of points to Point3d
+	values: list of [x, y, z], or packed flat x,y,z float64 array
+	return: list of Point3d
+	"""
+	import Rhino
+	if is_packed(values):
+		return list(packed_points(values))
+	return [Rhino.Geometry.Point3d(*pt) for pt in values]
+
+
+def value_column(values, count):
+	"""
+	Expand a column of numbers, repeating a single number count times
+	values: list or packed array of numbers, or one number
+	count: number of values required
+	return: list of floats, or None if the column has the wrong length
+	"""
+	if isinstance(values, (int, float)):
+		return [float(values)] * count
+	values = list(values)
+	if len(values) != count:
+		return None
+	return values
+
+
+def add_all(add, items):
+	"""
+	Add many objects to the document in one pass with a single redraw
+	add: scriptcontext.doc.Objects method adding one item, e.g. AddSphere
+	items: iterable of geometry accepted by add; None for an item that could
+		not be built, which is counted as failed
+	return: result dict with the new ids and the number that failed
+	"""
+	import System
+	ids = []
+	failed = 0
+	for item in items:
+		object_id = System.Guid.Empty if item is None else add(item)
+		if object_id == System.Guid.Empty:
+			failed += 1
+		else:
+			ids.append(str(object_id))
+	if not ids:
+		return {"status": "error", "message": "Failed to add objects"}
+	document.redraw()
+	return {"status": "success", "count": len(ids), "failed": failed, "ids": ids}
+
+
+def add_points(points):
+	"""
+	Add many points
+	points: list of Point3d
+	return: result dict with the new ids
+	"""
+	import scriptcontext
+	return add_all(scriptcontext.doc.Objects.AddPoint, points)
@@ -2,8 +2,16 @@
 RhinoScriptSyntax layer functions
 """
 
+import threading
+
 import rhinoscriptsyntax as rs
 
+from . import events, scene
+
+# Layer table snapshot, rebuilt on the first read after a layer table event
+table_lock = threading.Lock()
+table = [None]
+
 
 def add_layer(name, color=None):
 	"""Add a new layer"""
@@ -68,3 +76,76 @@ def layer_locked(name):
 def is_layer(name):
 	"""Check if layer exists"""
 	return rs.IsLayer(name)
+
+
+def invalidate_table(args=None):
+	"""Drop the layer table snapshot (LayerTableEvent and document event callback)"""
+	with table_lock:
+		table[0] = None
+
+
+def read_table():
+	"""
+	Read the layer table in one pass
+	return: tuple of (index, full path, parent index, [r, g, b], visible,
+		locked, material index), one per layer that is not deleted
+	"""
+	import scriptcontext
+	layers = [lyr for lyr in scriptcontext.doc.Layers if not lyr.IsDeleted]
+	indices = dict((lyr.Id, lyr.Index) for lyr in layers)
+	return tuple(
+		(
+			lyr.Index,
+			lyr.FullPath,
+			indices.get(lyr.ParentLayerId, -1),
+			[lyr.Color.R, lyr.Color.G, lyr.Color.B],
+			lyr.IsVisible,
+			lyr.IsLocked,
+			lyr.RenderMaterialIndex,
+		)
+		for lyr in layers
+	)
+
+
+def layer_table():
+	"""
+	Get the layer table snapshot, reading the table if it changed since the last call
+	return: tuple of layer rows as returned by read_table
+	"""
+	with table_lock:
+		if table[0] is None:
+			table[0] = read_table()
+		return table[0]
+
+
+def install_table():
+	"""Invalidate the layer table snapshot whenever the layer table or document changes"""
+	events.subscribe("LayerTableEvent", invalidate_table)
+	for event in ("NewDocument", "EndOpenDocument", "CloseDocument", "ActiveDocumentChanged"):
+		events.subscribe(event, invalidate_table)
+	invalidate_table()
+
+
+def layer_records():
+	"""
+	Describe every layer from the snapshot, with current object counts
+	return: list of dicts with name (full path), index, parent, color, visible,
+		locked, current, material and object_count (None if the scene index is not built)
+	"""
+	import scriptcontext
+	counts = scene.count_table("layer")
+	current = scriptcontext.doc.Layers.CurrentLayerIndex
+	return [
+		{
+			"name": path,
+			"index": index,
+			"parent": parent,
+			"color": color,
+			"visible": visible,
+			"locked": locked,
+			"current": index == current,
+			"material": material,
+			"object_count": counts.get(index, 0) if counts else None,
+		}
+		for index, path, parent, color, visible, locked, material in layer_table()
+	]
@@ -4,6 +4,8 @@ RhinoScriptSyntax material functions
 
 import rhinoscriptsyntax as rs
 
+from . import document
+
 
 def add_material_to_object(object_id):
 	"""Add a material to an object and return the material index"""
@@ -25,7 +27,7 @@ def material_color(index, color=None):
 	"""Get or set material color"""
 	if color:
 		rs.MaterialColor(index, color)
-		rs.Redraw()
+		document.redraw()
 		return {"status": "success"}
 	c = rs.MaterialColor(index)
 	if c is not None:
@@ -37,7 +39,7 @@ def material_transparency(index, transparency=None):
 	"""Get or set material transparency (0.0 to 1.0)"""
 	if transparency is not None:
 		rs.MaterialTransparency(index, transparency)
-		rs.Redraw()
+		document.redraw()
 		return {"status": "success"}
 	t = rs.MaterialTransparency(index)
 	if t is not None:
@@ -49,7 +51,7 @@ def material_shine(index, shine=None):
 	"""Get or set material shine (0.0 to 255.0)"""
 	if shine is not None:
 		rs.MaterialShine(index, shine)
-		rs.Redraw()
+		document.redraw()
 		return {"status": "success"}
 	s = rs.MaterialShine(index)
 	if s is not None:
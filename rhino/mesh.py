@@ -4,12 +4,45 @@ RhinoScriptSyntax mesh functions
 
 import rhinoscriptsyntax as rs
 
-
-def add_mesh(vertices, face_vertices):
-	"""Add a mesh from vertices and face vertex indices"""
+from . import geometry, document
+
+
+def add_mesh(vertices, face_vertices, face_size=4):
+	"""
+	Add a mesh from vertices and face vertex indices
+	vertices: list of [x, y, z], or packed flat float64 array
+	face_vertices: list of index lists, or packed flat int32 array
+	face_size: indices per face in a packed face array (3 or 4)
+	"""
+	if geometry.is_packed(vertices):
+		return add_packed_mesh(vertices, face_vertices, face_size)
 	mesh_id = rs.AddMesh(vertices, face_vertices)
 	if mesh_id:
-		rs.Redraw()
+		document.redraw()
+		return {"status": "success", "id": str(mesh_id)}
+	return {"status": "error", "message": "Failed to create mesh"}
+
+
+def add_packed_mesh(vertices, face_vertices, face_size=4):
+	"""Build a mesh straight from packed arrays without per-point tuples"""
+	import Rhino
+	import scriptcontext
+	import System
+	mesh = Rhino.Geometry.Mesh()
+	it = iter(vertices)
+	for x, y, z in zip(it, it, it):
+		mesh.Vertices.Add(x, y, z)
+	if geometry.is_packed(face_vertices):
+		faces = zip(*[iter(face_vertices)] * face_size)
+	else:
+		faces = face_vertices
+	for face in faces:
+		mesh.Faces.AddFace(*face)
+	mesh.Normals.ComputeNormals()
+	mesh.Compact()
+	mesh_id = scriptcontext.doc.Objects.AddMesh(mesh)
+	if mesh_id != System.Guid.Empty:
+		document.redraw()
 		return {"status": "success", "id": str(mesh_id)}
 	return {"status": "error", "message": "Failed to create mesh"}
 
@@ -18,7 +51,7 @@ def add_planar_mesh(object_id):
 	"""Create a planar mesh from a closed planar curve"""
 	mesh_id = rs.AddPlanarMesh(object_id)
 	if mesh_id:
-		rs.Redraw()
+		document.redraw()
 		return {"status": "success", "id": str(mesh_id)}
 	return {"status": "error", "message": "Failed to create planar mesh"}
 
@@ -38,7 +71,7 @@ def mesh_objects(object_ids):
 					if added:
 						mesh_ids.append(str(added))
 	if mesh_ids:
-		rs.Redraw()
+		document.redraw()
 		return {"status": "success", "count": len(mesh_ids), "ids": mesh_ids}
 	return {"status": "error", "message": "Failed to mesh objects"}
 
@@ -47,7 +80,7 @@ def mesh_boolean_union(mesh_ids):
 	"""Boolean union of meshes"""
 	result = rs.MeshBooleanUnion(mesh_ids)
 	if result:
-		rs.Redraw()
+		document.redraw()
 		return {"status": "success", "count": len(result), "ids": [str(x) for x in result]}
 	return {"status": "error", "message": "Failed to perform mesh boolean union"}
 
@@ -56,7 +89,7 @@ def mesh_boolean_difference(input_meshes, subtract_meshes):
 	"""Boolean difference of meshes"""
 	result = rs.MeshBooleanDifference(input_meshes, subtract_meshes)
 	if result:
-		rs.Redraw()
+		document.redraw()
 		return {"status": "success", "count": len(result), "ids": [str(x) for x in result]}
 	return {"status": "error", "message": "Failed to perform mesh boolean difference"}
 
@@ -65,7 +98,7 @@ def mesh_boolean_intersection(mesh_ids1, mesh_ids2):
 	"""Boolean intersection of meshes"""
 	result = rs.MeshBooleanIntersection(mesh_ids1, mesh_ids2)
 	if result:
-		rs.Redraw()
+		document.redraw()
 		return {"status": "success", "count": len(result), "ids": [str(x) for x in result]}
 	return {"status": "error", "message": "Failed to perform mesh boolean intersection"}
 
@@ -74,7 +107,7 @@ def join_meshes(mesh_ids, delete_input=True):
 	"""Join meshes into a single mesh"""
 	result = rs.JoinMeshes(mesh_ids, delete_input)
 	if result:
-		rs.Redraw()
+		document.redraw()
 		return {"status": "success", "id": str(result)}
 	return {"status": "error", "message": "Failed to join meshes"}
 
@@ -83,7 +116,7 @@ def mesh_to_nurb(mesh_id):
 	"""Convert a mesh to a NURBS polysurface"""
 	result = rs.MeshToNurb(mesh_id)
 	if result:
-		rs.Redraw()
+		document.redraw()
 		return {"status": "success", "id": str(result)}
 	return {"status": "error", "message": "Failed to convert mesh to NURBS"}
 
@@ -92,6 +125,6 @@ def mesh_offset(mesh_id, distance):
 	"""Offset a mesh"""
 	result = rs.MeshOffset(mesh_id, distance)
 	if result:
-		rs.Redraw()
+		document.redraw()
 		return {"status": "success", "id": str(result)}
 	return {"status": "error", "message": "Failed to offset mesh"}
@@ -4,20 +4,55 @@ RhinoScriptSyntax object functions
 
 import rhinoscriptsyntax as rs
 
+from . import document, scene
+
+# Fields object_records can read, besides the id
+OBJECT_FIELDS = ("type", "layer", "name", "bounding_box")
+
 
 def copy_object(obj_id, translation):
 	"""Copy an object"""
 	new_obj = rs.CopyObject(obj_id, translation)
 	if new_obj:
-		rs.Redraw()
+		document.redraw()
 		return {"status": "success", "id": str(new_obj)}
 	return {"status": "error", "message": "Failed to copy object"}
 
 
+def copy_transformed(object_ids, transforms):
+	"""
+	Add a transformed copy of every object for every transform in one pass
+	object_ids: ids of the objects to copy
+	transforms: list of Rhino.Geometry.Transform, one copy each
+	return: result dict with the new ids
+	"""
+	import scriptcontext
+	import System
+	table = scriptcontext.doc.Objects
+	ids = []
+	for obj_id in object_ids:
+		rhino_obj = rs.coercerhinoobject(obj_id)
+		if rhino_obj is None:
+			continue
+		attributes = rhino_obj.Attributes.Duplicate()
+		attributes.ObjectId = System.Guid.Empty
+		for xform in transforms:
+			copy = rhino_obj.Geometry.Duplicate()
+			if not copy.Transform(xform):
+				continue
+			new_id = table.Add(copy, attributes)
+			if new_id != System.Guid.Empty:
+				ids.append(str(new_id))
+	if not ids:
+		return {"status": "error", "message": "Failed to copy objects"}
+	document.redraw()
+	return {"status": "success", "count": len(ids), "ids": ids}
+
+
 def delete_object(obj_id):
 	"""Delete an object"""
 	if rs.DeleteObject(obj_id):
-		rs.Redraw()
+		document.redraw()
 		return {"status": "success"}
 	return {"status": "error", "message": "Failed to delete object"}
 
@@ -25,7 +60,7 @@ def delete_object(obj_id):
 def delete_objects(obj_ids):
 	"""Delete multiple objects"""
 	if rs.DeleteObjects(obj_ids):
-		rs.Redraw()
+		document.redraw()
 		return {"status": "success", "count": len(obj_ids)}
 	return {"status": "error", "message": "Failed to delete objects"}
 
@@ -34,16 +69,40 @@ def move_object(obj_id, translation):
 	"""Move an object"""
 	result = rs.MoveObject(obj_id, translation)
 	if result:
-		rs.Redraw()
+		document.redraw()
 		return {"status": "success", "id": str(result)}
 	return {"status": "error", "message": "Failed to move object"}
 
 
+def transform_objects(obj_ids, xform):
+	"""
+	Apply one transform to many objects in a single pass
+	obj_ids: ids of the objects to transform
+	xform: Rhino.Geometry.Transform
+	return: result dict with the ids of the transformed objects
+	"""
+	import scriptcontext
+	import System
+	table = scriptcontext.doc.Objects
+	ids = []
+	for obj_id in obj_ids:
+		guid = rs.coerceguid(obj_id)
+		if guid is None:
+			continue
+		new_id = table.Transform(guid, xform, True)
+		if new_id != System.Guid.Empty:
+			ids.append(str(new_id))
+	if not ids:
+		return {"status": "error", "message": "Failed to transform objects"}
+	document.redraw()
+	return {"status": "success", "count": len(ids), "ids": ids}
+
+
 def rotate_objects(obj_ids, center, angle, axis=None):
 	"""Rotate objects"""
 	result = rs.RotateObjects(obj_ids, center, angle, axis)
 	if result:
-		rs.Redraw()
+		document.redraw()
 		return {"status": "success", "count": len(result)}
 	return {"status": "error", "message": "Failed to rotate objects"}
 
@@ -52,7 +111,7 @@ def scale_object(obj_id, origin, scale):
 	"""Scale an object"""
 	result = rs.ScaleObject(obj_id, origin, scale)
 	if result:
-		rs.Redraw()
+		document.redraw()
 		return {"status": "success", "id": str(result)}
 	return {"status": "error", "message": "Failed to scale object"}
 
@@ -61,7 +120,7 @@ def mirror_object(obj_id, start, end):
 	"""Mirror an object"""
 	result = rs.MirrorObject(obj_id, start, end)
 	if result:
-		rs.Redraw()
+		document.redraw()
 		return {"status": "success", "id": str(result)}
 	return {"status": "error", "message": "Failed to mirror object"}
 
@@ -95,6 +154,37 @@ def object_type(obj_id):
 	return rs.ObjectType(obj_id)
 
 
+def object_records(rhino_objects, fields=OBJECT_FIELDS):
+	"""
+	Read attributes of many objects, touching each RhinoObject once
+	rhino_objects: iterable of RhinoObject
+	fields: names from OBJECT_FIELDS to read; the id is always included
+	return: list of dicts, in the same format as the per-object rs readers
+	"""
+	import scriptcontext
+	layers = scriptcontext.doc.Layers
+	layer_paths = {}
+	records = []
+	for rhino_obj in rhino_objects:
+		attributes = rhino_obj.Attributes
+		record = {"id": str(rhino_obj.Id)}
+		if "type" in fields:
+			record["type"] = scene.object_type_code(rhino_obj)
+		if "layer" in fields:
+			index = attributes.LayerIndex
+			if index not in layer_paths:
+				layer_paths[index] = layers.FindIndex(index).FullPath
+			record["layer"] = layer_paths[index]
+		if "name" in fields:
+			record["name"] = attributes.Name or None
+		if "bounding_box" in fields:
+			bbox = rhino_obj.Geometry.GetBoundingBox(True)
+			if bbox.IsValid:
+				record["bounding_box"] = [[p.X, p.Y, p.Z] for p in bbox.GetCorners()]
+		records.append(record)
+	return records
+
+
 def select_objects(obj_ids):
 	"""Select objects"""
 	rs.SelectObjects(obj_ids)
@@ -105,7 +195,7 @@ def hide_objects(obj_ids):
 	"""Hide objects"""
 	count = rs.HideObjects(obj_ids)
 	if count:
-		rs.Redraw()
+		document.redraw()
 		return {"status": "success", "count": count}
 	return {"status": "error", "message": "Failed to hide objects"}
 
@@ -114,7 +204,7 @@ def show_objects(obj_ids):
 	"""Show hidden objects"""
 	count = rs.ShowObjects(obj_ids)
 	if count:
-		rs.Redraw()
+		document.redraw()
 		return {"status": "success", "count": count}
 	return {"status": "error", "message": "Failed to show objects"}
 
@@ -123,7 +213,7 @@ def lock_objects(obj_ids):
 	"""Lock objects"""
 	count = rs.LockObjects(obj_ids)
 	if count:
-		rs.Redraw()
+		document.redraw()
 		return {"status": "success", "count": count}
 	return {"status": "error", "message": "Failed to lock objects"}
 
@@ -132,7 +222,7 @@ def unlock_objects(obj_ids):
 	"""Unlock objects"""
 	count = rs.UnlockObjects(obj_ids)
 	if count:
-		rs.Redraw()
+		document.redraw()
 		return {"status": "success", "count": count}
 	return {"status": "error", "message": "Failed to unlock objects"}
 
@@ -147,6 +237,6 @@ def orient_object(obj_id, reference, target):
 	"""Orient an object from reference to target planes"""
 	result = rs.OrientObject(obj_id, reference, target)
 	if result:
-		rs.Redraw()
+		document.redraw()
 		return {"status": "success", "id": str(result)}
 	return {"status": "error", "message": "Failed to orient object"}
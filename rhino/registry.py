@@ -0,0 +1,89 @@
+"""
+Command registry for the Rhino listener
+Commands register themselves at import time with the command() decorator,
+together with metadata the dispatcher and scheduler use for fast paths.
+Compatible with CPython 3 (Rhino 8)
+"""
+
+COST_CLASSES = ("light", "medium", "heavy")
+
+# Registered commands by name
+COMMANDS = {}
+
+
+def qualified_name(func):
+	"""Get the module-qualified name of a function"""
+	return func.__module__ + "." + func.__qualname__
+
+
+def command(name=None, mutating=True, cost="light", needs_selection=False, redraw=None,
+		stream=None, control=False):
+	"""
+	Register a function as a listener command
+	Registering the same module-qualified function again replaces its entry,
+	so re-running server.py in Rhino redefines its commands instead of failing.
+	name: command name (defaults to the function name)
+	mutating: False if the command does not change the document
+	cost: expected cost class, "light", "medium" or "heavy"
+	needs_selection: True if the command acts on the current selection
+	redraw: True if the command redraws the viewport (defaults to mutating)
+	stream: generator function yielding the command's records, for streaming
+	control: True to answer on the handler thread instead of the UI thread
+	return: decorator that registers the function and returns it unchanged
+	"""
+	if cost not in COST_CLASSES:
+		raise ValueError("Unknown cost class: " + str(cost))
+
+	def register(func):
+		key = name or func.__name__
+		previous = COMMANDS.get(key)
+		if previous is not None and qualified_name(previous["handler"]) != qualified_name(func):
+			raise ValueError("Command registered twice: " + key + " (" + qualified_name(func)
+				+ " and " + qualified_name(previous["handler"]) + ")")
+		COMMANDS[key] = {
+			"name": key,
+			"handler": func,
+			"mutating": mutating,
+			"cost": cost,
+			"needs_selection": needs_selection,
+			"redraw": mutating if redraw is None else redraw,
+			"stream": stream,
+			"control": control,
+		}
+		return func
+
+	return register
+
+
+def lookup(name):
+	"""
+	Get a registered command
+	name: command name
+	return: registry entry dict, or None if unknown
+	"""
+	return COMMANDS.get(name)
+
+
+def describe(entry):
+	"""
+	Get the public metadata of a registry entry
+	entry: registry entry dict
+	return: JSON-serializable metadata dict
+	"""
+	return {
+		"name": entry["name"],
+		"mutating": entry["mutating"],
+		"cost": entry["cost"],
+		"needs_selection": entry["needs_selection"],
+		"redraw": entry["redraw"],
+		"streaming": entry["stream"] is not None,
+		"thread": "listener" if entry["control"] else "ui",
+	}
+
+
+def list_commands():
+	"""
+	Describe every registered command
+	return: list of metadata dicts sorted by name
+	"""
+	return [describe(COMMANDS[name]) for name in sorted(COMMANDS)]
@@ -0,0 +1,269 @@
+"""
+Incremental scene index for the listener
+Keeps per-object entries and counts by type, layer, name and group, updated
+from RhinoDoc events through rhino.events, so scene summaries do not have to
+walk every object. Layers and groups are counted by table index and named
+when read, so renaming a layer or group does not invalidate the index.
+Compatible with CPython 3 (Rhino 8)
+"""
+
+import threading
+
+from . import events
+
+COUNT_KINDS = ("type", "layer", "name", "group")
+CHECK_SAMPLE_SIZE = 100
+
+lock = threading.Lock()
+
+# Object id -> (type code, layer index, name, group indices)
+entries = {}
+counts = dict((kind, {}) for kind in COUNT_KINDS)
+
+# Set once the index has been built from a full scan
+ready = [False]
+
+
+def object_type_code(rhino_obj):
+	"""Get the rs.ObjectType code of a RhinoObject (single-face breps are surfaces)"""
+	import Rhino
+	geometry = rhino_obj.Geometry
+	if isinstance(geometry, Rhino.Geometry.Brep) and geometry.Faces.Count == 1:
+		return 8
+	return int(geometry.ObjectType)
+
+
+def is_indexed(rhino_obj):
+	"""Check whether an object is one rs.AllObjects would return"""
+	import Rhino
+	import scriptcontext
+	document = rhino_obj.Document
+	if document is None or document.RuntimeSerialNumber != scriptcontext.doc.RuntimeSerialNumber:
+		return False
+	if rhino_obj.IsDeleted or rhino_obj.IsReference or rhino_obj.IsInstanceDefinitionGeometry:
+		return False
+	object_type = rhino_obj.ObjectType
+	return object_type not in (Rhino.DocObjects.ObjectType.Light, Rhino.DocObjects.ObjectType.Grip)
+
+
+def describe(rhino_obj, attributes=None):
+	"""
+	Build the index entry of an object
+	rhino_obj: RhinoObject
+	attributes: ObjectAttributes to use instead of the object's own
+	return: (type code, layer index, name, group indices) tuple
+	"""
+	attributes = attributes or rhino_obj.Attributes
+	return (
+		object_type_code(rhino_obj),
+		attributes.LayerIndex,
+		attributes.Name or None,
+		tuple(attributes.GetGroupList() or ()),
+	)
+
+
+def count(kind, key, delta):
+	"""Adjust one counter, dropping it when it reaches zero (caller holds lock)"""
+	table = counts[kind]
+	total = table.get(key, 0) + delta
+	if total > 0:
+		table[key] = total
+	else:
+		table.pop(key, None)
+
+
+def apply(entry, delta):
+	"""Add (delta 1) or remove (delta -1) an entry's counts (caller holds lock)"""
+	object_type, layer_index, name, groups = entry
+	count("type", object_type, delta)
+	count("layer", layer_index, delta)
+	if name:
+		count("name", name, delta)
+	for group_index in groups:
+		count("group", group_index, delta)
+
+
+def put(object_id, entry):
+	"""Insert or replace an entry (caller holds lock)"""
+	previous = entries.get(object_id)
+	if previous is not None:
+		apply(previous, -1)
+	entries[object_id] = entry
+	apply(entry, 1)
+
+
+def drop(object_id):
+	"""Remove an entry if present (caller holds lock)"""
+	previous = entries.pop(object_id, None)
+	if previous is not None:
+		apply(previous, -1)
+
+
+def track(rhino_obj, attributes=None):
+	"""Index an added, replaced, undeleted or modified object"""
+	object_id = str(rhino_obj.Id)
+	if not is_indexed(rhino_obj):
+		with lock:
+			drop(object_id)
+		return
+	entry = describe(rhino_obj, attributes)
+	with lock:
+		put(object_id, entry)
+
+
+def on_add(args):
+	"""AddRhinoObject and UndeleteRhinoObject callback"""
+	track(args.TheObject)
+
+
+def on_delete(args):
+	"""DeleteRhinoObject callback"""
+	with lock:
+		drop(str(args.ObjectId))
+
+
+def on_replace(args):
+	"""ReplaceRhinoObject callback"""
+	track(args.NewRhinoObject)
+
+
+def on_modify_attributes(args):
+	"""ModifyObjectAttributes callback, for layer, name and group changes"""
+	track(args.RhinoObject, args.NewAttributes)
+
+
+def on_document(args):
+	"""Rebuild the index when a document is created, opened, closed or activated"""
+	rebuild()
+
+
+def document_objects():
+	"""
+	Walk the active document the way rs.AllObjects does
+	return: iterable of RhinoObject
+	"""
+	import Rhino
+	import scriptcontext
+	settings = Rhino.DocObjects.ObjectEnumeratorSettings()
+	settings.IncludeLights = False
+	settings.IncludeGrips = False
+	settings.NormalObjects = True
+	settings.LockedObjects = True
+	settings.HiddenObjects = True
+	settings.ReferenceObjects = False
+	return scriptcontext.doc.Objects.GetObjectList(settings)
+
+
+def scan():
+	"""
+	Build index entries for every object in the document
+	return: dict of object id -> entry
+	"""
+	return dict((str(rhino_obj.Id), describe(rhino_obj)) for rhino_obj in document_objects())
+
+
+def rebuild():
+	"""Replace the index with a full scan of the active document"""
+	scanned = scan()
+	with lock:
+		entries.clear()
+		for table in counts.values():
+			table.clear()
+		for object_id, entry in scanned.items():
+			entries[object_id] = entry
+			apply(entry, 1)
+		ready[0] = True
+
+
+def install():
+	"""Subscribe the index to document events and build it"""
+	events.subscribe("AddRhinoObject", on_add)
+	events.subscribe("UndeleteRhinoObject", on_add)
+	events.subscribe("DeleteRhinoObject", on_delete)
+	events.subscribe("ReplaceRhinoObject", on_replace)
+	events.subscribe("ModifyObjectAttributes", on_modify_attributes)
+	for event in ("NewDocument", "EndOpenDocument", "CloseDocument", "ActiveDocumentChanged"):
+		events.subscribe(event, on_document)
+	rebuild()
+
+
+def snapshot():
+	"""
+	Copy the current counts
+	return: dict with object_count and a copy of each count table, or None
+		if the index has not been built
+	"""
+	with lock:
+		if not ready[0]:
+			return None
+		result = {"object_count": len(entries)}
+		for kind in COUNT_KINDS:
+			result[kind] = dict(counts[kind])
+	return result
+
+
+def count_table(kind):
+	"""
+	Copy one count table
+	kind: one of COUNT_KINDS
+	return: dict of key -> object count, or None if the index has not been built
+	"""
+	with lock:
+		return dict(counts[kind]) if ready[0] else None
+
+
+def layer_counts(snapshot):
+	"""
+	Name the layer counts of a snapshot
+	snapshot: dict returned by snapshot()
+	return: dict of layer full path -> object count
+	"""
+	import scriptcontext
+	named = {}
+	for index, total in snapshot["layer"].items():
+		table_layer = scriptcontext.doc.Layers.FindIndex(index)
+		named[table_layer.FullPath if table_layer else str(index)] = total
+	return named
+
+
+def group_counts(snapshot):
+	"""
+	Name the group counts of a snapshot
+	snapshot: dict returned by snapshot()
+	return: dict of group name -> object count
+	"""
+	import scriptcontext
+	named = {}
+	for index, total in snapshot["group"].items():
+		group = scriptcontext.doc.Groups.FindIndex(index)
+		named[group.Name if group and group.Name else str(index)] = total
+	return named
+
+
+def check(repair=False):
+	"""
+	Compare the index with a full rescan of the document
+	repair: rebuild the index if they differ
+	return: dict with consistent flag, object counts, the number of missing,
+		stale and changed entries and a sample of the ids that differ
+	"""
+	scanned = scan()
+	with lock:
+		indexed = dict(entries)
+	missing = [object_id for object_id in scanned if object_id not in indexed]
+	stale = [object_id for object_id in indexed if object_id not in scanned]
+	changed = [object_id for object_id, entry in scanned.items()
+		if object_id in indexed and indexed[object_id] != entry]
+	consistent = not (missing or stale or changed)
+	if repair and not consistent:
+		rebuild()
+	return {
+		"consistent": consistent,
+		"indexed": len(indexed),
+		"scanned": len(scanned),
+		"missing": len(missing),
+		"stale": len(stale),
+		"changed": len(changed),
+		"differences": (missing + stale + changed)[:CHECK_SAMPLE_SIZE],
+		"repaired": repair and not consistent,
+	}
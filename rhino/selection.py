@@ -15,6 +15,12 @@ def selected_objects():
 	return rs.SelectedObjects()
 
 
+def selected_rhino_objects():
+	"""Get the selected RhinoObjects, as rs.SelectedObjects would find them"""
+	import scriptcontext
+	return list(scriptcontext.doc.Objects.GetSelectedObjects(False, False))
+
+
 def unselect_all_objects():
 	"""Unselect all objects"""
 	rs.UnselectAllObjects()
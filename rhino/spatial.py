@@ -0,0 +1,198 @@
+"""
+Spatial index for the listener
+Keeps a RhinoCommon RTree over the world bounding box of every object the
+scene index tracks, updated from RhinoDoc events through rhino.events, so
+box, sphere and nearest-object queries do not touch the document. Queries
+only read the tree and run on the handler thread under the index lock.
+Compatible with CPython 3 (Rhino 8)
+"""
+
+import itertools
+import threading
+
+from . import events, scene
+
+lock = threading.Lock()
+
+# RhinoCommon RTree, replaced on rebuild
+tree = [None]
+
+# Object id -> (tree element id, BoundingBox), and the reverse mapping
+boxes = {}
+object_ids = {}
+element_ids = itertools.count()
+
+# Union of every box inserted since the last rebuild; it only grows, so it
+# bounds the search radius of nearest queries
+extent = [None]
+
+
+def bounding_box(rhino_obj):
+	"""Get an object's world bounding box, or None if it has none"""
+	bbox = rhino_obj.Geometry.GetBoundingBox(True)
+	return bbox if bbox.IsValid else None
+
+
+def insert(object_id, bbox):
+	"""Add or move an object in the tree (caller holds lock)"""
+	import Rhino
+	remove(object_id)
+	element = next(element_ids)
+	tree[0].Insert(bbox, element)
+	boxes[object_id] = (element, bbox)
+	object_ids[element] = object_id
+	extent[0] = bbox if extent[0] is None else Rhino.Geometry.BoundingBox.Union(extent[0], bbox)
+
+
+def remove(object_id):
+	"""Remove an object from the tree if present (caller holds lock)"""
+	entry = boxes.pop(object_id, None)
+	if entry is not None:
+		tree[0].Remove(entry[1], entry[0])
+		del object_ids[entry[0]]
+
+
+def track(rhino_obj):
+	"""Insert an added, undeleted or replaced object, or drop it if it is not indexed"""
+	object_id = str(rhino_obj.Id)
+	bbox = bounding_box(rhino_obj) if scene.is_indexed(rhino_obj) else None
+	with lock:
+		if bbox is None:
+			remove(object_id)
+		else:
+			insert(object_id, bbox)
+
+
+def on_add(args):
+	"""AddRhinoObject and UndeleteRhinoObject callback"""
+	track(args.TheObject)
+
+
+def on_delete(args):
+	"""DeleteRhinoObject callback"""
+	with lock:
+		remove(str(args.ObjectId))
+
+
+def on_replace(args):
+	"""ReplaceRhinoObject callback, for geometry changes and transforms"""
+	track(args.NewRhinoObject)
+
+
+def on_document(args):
+	"""Rebuild the tree when a document is created, opened, closed or activated"""
+	rebuild()
+
+
+def rebuild():
+	"""Replace the tree with one built from every object in the document"""
+	import Rhino
+	found = []
+	for rhino_obj in scene.document_objects():
+		bbox = bounding_box(rhino_obj)
+		if bbox is not None:
+			found.append((str(rhino_obj.Id), bbox))
+	with lock:
+		tree[0] = Rhino.Geometry.RTree()
+		boxes.clear()
+		object_ids.clear()
+		extent[0] = None
+		for object_id, bbox in found:
+			insert(object_id, bbox)
+
+
+def install():
+	"""Subscribe the tree to document events and build it"""
+	events.subscribe("AddRhinoObject", on_add)
+	events.subscribe("UndeleteRhinoObject", on_add)
+	events.subscribe("DeleteRhinoObject", on_delete)
+	events.subscribe("ReplaceRhinoObject", on_replace)
+	for event in ("NewDocument", "EndOpenDocument", "CloseDocument", "ActiveDocumentChanged"):
+		events.subscribe(event, on_document)
+	rebuild()
+
+
+def search(region):
+	"""
+	Find the objects whose bounding box meets a box or sphere (caller holds lock)
+	region: Rhino.Geometry.BoundingBox or Rhino.Geometry.Sphere
+	return: list of object ids
+	"""
+	hits = []
+
+	def found(sender, args):
+		hits.append(args.Id)
+
+	tree[0].Search(region, found)
+	return [object_ids[element] for element in hits]
+
+
+def distance(object_id, point):
+	"""Distance from a point to an object's bounding box (caller holds lock)"""
+	return point.DistanceTo(boxes[object_id][1].ClosestPoint(point))
+
+
+def objects_in_box(corner_min, corner_max, contained=False):
+	"""
+	Find objects by bounding box
+	corner_min, corner_max: opposite corners of the query box as [x, y, z]
+	contained: only objects whose bounding box lies entirely inside
+	return: list of object ids
+	"""
+	import Rhino
+	low = [min(a, b) for a, b in zip(corner_min, corner_max)]
+	high = [max(a, b) for a, b in zip(corner_min, corner_max)]
+	query = Rhino.Geometry.BoundingBox(low[0], low[1], low[2], high[0], high[1], high[2])
+	with lock:
+		if tree[0] is None:
+			return []
+		ids = search(query)
+		if contained:
+			ids = [object_id for object_id in ids if query.Contains(boxes[object_id][1], False)]
+	return ids
+
+
+def objects_in_sphere(center, radius):
+	"""
+	Find objects whose bounding box is within radius of a point
+	center: [x, y, z]
+	radius: query radius
+	return: list of (object id, distance) sorted by distance
+	"""
+	import Rhino
+	point = Rhino.Geometry.Point3d(*center)
+	with lock:
+		if tree[0] is None:
+			return []
+		hits = search(Rhino.Geometry.Sphere(point, radius))
+		found = [(object_id, distance(object_id, point)) for object_id in hits]
+	return sorted((hit for hit in found if hit[1] <= radius), key=lambda hit: hit[1])
+
+
+def nearest_objects(center, count):
+	"""
+	Find the objects with the nearest bounding boxes
+	Searches spheres of doubling radius until count objects are found within
+	the radius, or the radius covers every indexed box.
+	center: [x, y, z]
+	count: number of objects to return
+	return: list of (object id, distance) sorted by distance
+	"""
+	import Rhino
+	point = Rhino.Geometry.Point3d(*center)
+	with lock:
+		if tree[0] is None or not boxes or count < 1:
+			return []
+		bounds = extent[0]
+		diagonal = bounds.Diagonal.Length
+		gap = point.DistanceTo(bounds.ClosestPoint(point))
+		reach = max(gap + diagonal, 1e-6)
+		radius = max(diagonal * (float(count) / len(boxes)) ** (1.0 / 3), gap, 1e-6)
+		while True:
+			radius = min(radius, reach)
+			hits = search(Rhino.Geometry.Sphere(point, radius))
+			found = sorted(((object_id, distance(object_id, point)) for object_id in hits),
+				key=lambda hit: hit[1])
+			if radius >= reach or (len(found) >= count and found[count - 1][1] <= radius):
+				return found[:count]
+			radius *= 2
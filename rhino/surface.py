@@ -4,12 +4,14 @@ RhinoScriptSyntax surface functions
 
 import rhinoscriptsyntax as rs
 
+from . import geometry, document
+
 
 def add_box(corners):
 	"""Add a box"""
 	box_id = rs.AddBox(corners)
 	if box_id:
-		rs.Redraw()
+		document.redraw()
 		return {"status": "success", "id": str(box_id)}
 	return {"status": "error", "message": "Failed to add box"}
 
@@ -18,16 +20,47 @@ def add_sphere(center, radius):
 	"""Add a sphere"""
 	sphere_id = rs.AddSphere(center, radius)
 	if sphere_id:
-		rs.Redraw()
+		document.redraw()
 		return {"status": "success", "id": str(sphere_id)}
 	return {"status": "error", "message": "Failed to add sphere"}
 
 
+def add_boxes(corners, widths, depths, heights):
+	"""
+	Add many axis-aligned boxes
+	corners: list of Point3d, the minimum corner of each box
+	widths, depths, heights: lists of sizes along X, Y and Z, one per corner;
+		a box without a positive size along every axis is counted as failed
+	return: result dict with the new ids
+	"""
+	import Rhino
+	import scriptcontext
+	breps = (
+		Rhino.Geometry.Brep.CreateFromBox(Rhino.Geometry.BoundingBox(
+			corner.X, corner.Y, corner.Z, corner.X + width, corner.Y + depth, corner.Z + height))
+		for corner, width, depth, height in zip(corners, widths, depths, heights)
+	)
+	return geometry.add_all(scriptcontext.doc.Objects.AddBrep, breps)
+
+
+def add_spheres(centers, radii):
+	"""
+	Add many spheres
+	centers: list of Point3d
+	radii: list of radii, one per center
+	return: result dict with the new ids
+	"""
+	import Rhino
+	import scriptcontext
+	spheres = (Rhino.Geometry.Sphere(center, radius) for center, radius in zip(centers, radii))
+	return geometry.add_all(scriptcontext.doc.Objects.AddSphere, spheres)
+
+
 def add_cone(base, height_point, radius):
 	"""Add a cone"""
 	cone_id = rs.AddCone(base, height_point, radius)
 	if cone_id:
-		rs.Redraw()
+		document.redraw()
 		return {"status": "success", "id": str(cone_id)}
 	return {"status": "error", "message": "Failed to add cone"}
 
@@ -36,7 +69,7 @@ def add_torus(base, major_radius, minor_radius):
 	"""Add a torus"""
 	torus_id = rs.AddTorus(base, major_radius, minor_radius)
 	if torus_id:
-		rs.Redraw()
+		document.redraw()
 		return {"status": "success", "id": str(torus_id)}
 	return {"status": "error", "message": "Failed to add torus"}
 
@@ -45,7 +78,7 @@ def extrude_curve_straight(curve_id, start, end):
 	"""Extrude curve straight"""
 	result = rs.ExtrudeCurveStraight(curve_id, start, end)
 	if result:
-		rs.Redraw()
+		document.redraw()
 		return {"status": "success", "id": str(result)}
 	return {"status": "error", "message": "Failed to extrude curve"}
 
@@ -54,7 +87,7 @@ def add_rev_srf(curve_id, axis, start_angle=0, end_angle=360):
 	"""Add surface of revolution"""
 	result = rs.AddRevSrf(curve_id, axis, start_angle, end_angle)
 	if result:
-		rs.Redraw()
+		document.redraw()
 		return {"status": "success", "id": str(result)}
 	return {"status": "error", "message": "Failed to create revolution surface"}
 
@@ -63,7 +96,7 @@ def add_loft_srf(curve_ids):
 	"""Add lofted surface"""
 	result = rs.AddLoftSrf(curve_ids)
 	if result and len(result) > 0:
-		rs.Redraw()
+		document.redraw()
 		return {"status": "success", "count": len(result), "ids": [str(x) for x in result]}
 	return {"status": "error", "message": "Failed to create loft surface"}
 
@@ -72,7 +105,7 @@ def boolean_union(obj_ids):
 	"""Boolean union"""
 	result = rs.BooleanUnion(obj_ids, delete_input=True)
 	if result:
-		rs.Redraw()
+		document.redraw()
 		return {"status": "success", "count": len(result), "ids": [str(x) for x in result]}
 	return {"status": "error", "message": "Failed to perform boolean union"}
 
@@ -83,7 +116,7 @@ def boolean_difference(obj_ids):
 		return {"status": "error", "message": "Need at least 2 objects"}
 	result = rs.BooleanDifference([obj_ids[0]], obj_ids[1:], delete_input=True)
 	if result:
-		rs.Redraw()
+		document.redraw()
 		return {"status": "success", "count": len(result), "ids": [str(x) for x in result]}
 	return {"status": "error", "message": "Failed to perform boolean difference"}
 
@@ -94,7 +127,7 @@ def boolean_intersection(obj_ids):
 		return {"status": "error", "message": "Need at least 2 objects"}
 	result = rs.BooleanIntersection([obj_ids[0]], obj_ids[1:], delete_input=True)
 	if result:
-		rs.Redraw()
+		document.redraw()
 		return {"status": "success", "count": len(result), "ids": [str(x) for x in result]}
 	return {"status": "error", "message": "Failed to perform boolean intersection"}
 
@@ -129,7 +162,7 @@ def add_pipe(curve_id, parameters, radii, cap=1):
 	"""Add a pipe surface along a curve"""
 	result = rs.AddPipe(curve_id, parameters, radii, cap=cap)
 	if result:
-		rs.Redraw()
+		document.redraw()
 		return {"status": "success", "count": len(result), "ids": [str(x) for x in result]}
 	return {"status": "error", "message": "Failed to create pipe"}
 
@@ -138,7 +171,7 @@ def add_sweep1(rail, shapes, closed=False):
 	"""Sweep shapes along a single rail"""
 	result = rs.AddSweep1(rail, shapes, closed)
 	if result:
-		rs.Redraw()
+		document.redraw()
 		return {"status": "success", "count": len(result), "ids": [str(x) for x in result]}
 	return {"status": "error", "message": "Failed to create sweep1"}
 
@@ -147,7 +180,7 @@ def add_sweep2(rails, shapes, closed=False):
 	"""Sweep shapes along two rails"""
 	result = rs.AddSweep2(rails, shapes, closed)
 	if result:
-		rs.Redraw()
+		document.redraw()
 		return {"status": "success", "count": len(result), "ids": [str(x) for x in result]}
 	return {"status": "error", "message": "Failed to create sweep2"}
 
@@ -156,7 +189,7 @@ def add_planar_srf(curve_ids):
 	"""Create planar surface from closed planar curves"""
 	result = rs.AddPlanarSrf(curve_ids)
 	if result:
-		rs.Redraw()
+		document.redraw()
 		return {"status": "success", "count": len(result), "ids": [str(x) for x in result]}
 	return {"status": "error", "message": "Failed to create planar surface"}
 
@@ -165,7 +198,7 @@ def add_edge_srf(curve_ids):
 	"""Create edge surface from 2-4 edge curves"""
 	result = rs.AddEdgeSrf(curve_ids)
 	if result:
-		rs.Redraw()
+		document.redraw()
 		return {"status": "success", "id": str(result)}
 	return {"status": "error", "message": "Failed to create edge surface"}
 
@@ -174,7 +207,7 @@ def add_network_srf(curves, continuity=1, edge_tolerance=0):
 	"""Create network surface from curves"""
 	result = rs.AddNetworkSrf(curves, continuity, edge_tolerance)
 	if result:
-		rs.Redraw()
+		document.redraw()
 		return {"status": "success", "id": str(result)}
 	return {"status": "error", "message": "Failed to create network surface"}
 
@@ -183,7 +216,7 @@ def add_patch(object_ids, uspan=10, vspan=10):
 	"""Create patch surface from curves/points"""
 	result = rs.AddPatch(object_ids, (uspan, vspan))
 	if result:
-		rs.Redraw()
+		document.redraw()
 		return {"status": "success", "id": str(result)}
 	return {"status": "error", "message": "Failed to create patch surface"}
 
@@ -192,7 +225,7 @@ def offset_surface(surface_id, distance):
 	"""Offset a surface"""
 	result = rs.OffsetSurface(surface_id, distance)
 	if result:
-		rs.Redraw()
+		document.redraw()
 		return {"status": "success", "id": str(result)}
 	return {"status": "error", "message": "Failed to offset surface"}
 
@@ -201,7 +234,7 @@ def split_brep(brep_id, cutter_id):
 	"""Split a brep with another brep"""
 	result = rs.SplitBrep(brep_id, cutter_id)
 	if result:
-		rs.Redraw()
+		document.redraw()
 		return {"status": "success", "count": len(result), "ids": [str(x) for x in result]}
 	return {"status": "error", "message": "Failed to split brep"}
 
@@ -210,7 +243,7 @@ def fillet_surfaces(srf1, srf2, radius):
 	"""Fillet between two surfaces"""
 	result = rs.FilletSurfaces(srf1, srf2, radius)
 	if result:
-		rs.Redraw()
+		document.redraw()
 		return {"status": "success", "count": len(result), "ids": [str(x) for x in result]}
 	return {"status": "error", "message": "Failed to fillet surfaces"}
 
@@ -219,7 +252,7 @@ def cap_planar_holes(brep_id):
 	"""Cap planar holes in a brep"""
 	result = rs.CapPlanarHoles(brep_id)
 	if result:
-		rs.Redraw()
+		document.redraw()
 		return {"status": "success", "id": str(result)}
 	return {"status": "error", "message": "Failed to cap planar holes"}
 
@@ -228,7 +261,7 @@ def extrude_curve_along_curve(curve_id, path_id):
 	"""Extrude a curve along another curve"""
 	result = rs.ExtrudeCurve(curve_id, path_id)
 	if result:
-		rs.Redraw()
+		document.redraw()
 		return {"status": "success", "id": str(result)}
 	return {"status": "error", "message": "Failed to extrude curve along curve"}
 
@@ -237,7 +270,7 @@ def extrude_curve_to_point(curve_id, point):
 	"""Extrude a curve to a point"""
 	result = rs.ExtrudeCurvePoint(curve_id, point)
 	if result:
-		rs.Redraw()
+		document.redraw()
 		return {"status": "success", "id": str(result)}
 	return {"status": "error", "message": "Failed to extrude curve to point"}
 
@@ -246,7 +279,7 @@ def duplicate_edge_curves(brep_id, select=False):
 	"""Duplicate edge curves of a brep"""
 	result = rs.DuplicateEdgeCurves(brep_id, select)
 	if result:
-		rs.Redraw()
+		document.redraw()
 		return {"status": "success", "count": len(result), "ids": [str(x) for x in result]}
 	return {"status": "error", "message": "Failed to duplicate edge curves"}
 
@@ -255,7 +288,7 @@ def duplicate_surface_border(surface_id):
 	"""Duplicate surface border curves"""
 	result = rs.DuplicateSurfaceBorder(surface_id)
 	if result:
-		rs.Redraw()
+		document.redraw()
 		return {"status": "success", "count": len(result), "ids": [str(x) for x in result]}
 	return {"status": "error", "message": "Failed to duplicate surface border"}
 
@@ -264,7 +297,7 @@ def join_surfaces(surface_ids, delete_input=True):
 	"""Join multiple surfaces into a polysurface"""
 	result = rs.JoinSurfaces(surface_ids, delete_input)
 	if result:
-		rs.Redraw()
+		document.redraw()
 		return {"status": "success", "id": str(result)}
 	return {"status": "error", "message": "Failed to join surfaces"}
 
@@ -273,7 +306,7 @@ def explode_polysurfaces(brep_id, delete_input=True):
 	"""Explode a polysurface into individual surfaces"""
 	result = rs.ExplodePolysurfaces(brep_id, delete_input)
 	if result:
-		rs.Redraw()
+		document.redraw()
 		return {"status": "success", "count": len(result), "ids": [str(x) for x in result]}
 	return {"status": "error", "message": "Failed to explode polysurface"}
 
@@ -282,7 +315,7 @@ def unroll_surface(surface_id):
 	"""Unroll a surface"""
 	result = rs.UnrollSurface(surface_id)
 	if result:
-		rs.Redraw()
+		document.redraw()
 		unrolled = result[0]
 		curves = result[1] if len(result) > 1 else []
 		ids = [str(unrolled)]
@@ -2,6 +2,7 @@
 RhinoScriptSyntax utility functions
 """
 
+import bisect
 import rhinoscriptsyntax as rs
 
 
@@ -11,3 +12,31 @@ def distance(point1, point2):
 	if dist is not None:
 		return {"status": "success", "distance": dist}
 	return {"status": "error", "message": "Failed to calculate distance"}
+
+
+def paginate(items, key, params, default_limit=None):
+	"""
+	Take one page of a listing in a stable order
+	The cursor is the key of the last item of the previous page, so paging
+	stays consistent when items are added or removed between requests.
+	items: iterable of items
+	key: function giving each item's unique, JSON-serializable sort key
+	params: command params, read for limit and cursor
+	default_limit: page size when params has no limit (None for all items)
+	return: (items on the page, dict with the total and the next cursor,
+		which is None on the last page)
+	"""
+	limit = params.get("limit", default_limit)
+	cursor = params.get("cursor")
+	ordered = sorted(items, key=key)
+	keys = [key(item) for item in ordered]
+
+	start = 0
+	if cursor is not None:
+		try:
+			start = bisect.bisect_right(keys, cursor)
+		except TypeError:
+			raise ValueError("Invalid cursor: " + str(cursor))
+	end = len(ordered) if limit is None else min(len(ordered), start + max(0, int(limit)))
+	next_cursor = keys[end - 1] if end < len(ordered) and end > start else None
+	return ordered[start:end], {"total": len(ordered), "next_cursor": next_cursor}
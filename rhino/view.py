@@ -9,6 +9,8 @@ import rhinoscriptsyntax as rs
 import Rhino
 import System.Drawing
 
+from . import document
+
 
 def set_view_camera(camera, target, view=None):
 	"""Set view camera and target"""
@@ -19,7 +21,7 @@ def set_view_camera(camera, target, view=None):
 		view = rs.CurrentView()
 		rs.ViewCamera(view, camera)
 		rs.ViewTarget(view, target)
-	rs.Redraw()
+	document.redraw()
 	return {"status": "success", "view": view}
 
 
@@ -51,12 +53,22 @@ def get_view_info(view=None):
 	}
 
 
+def construction_plane(view=None):
+	"""Get a view's construction plane (default: the active view)"""
+	return rs.ViewCPlane(view)
+
+
+def construction_plane_normal(view=None):
+	"""Get the normal of a view's construction plane (default: the active view)"""
+	return construction_plane(view).Normal
+
+
 def set_display_mode(mode, view=None):
 	"""Set display mode for a view"""
 	if not view:
 		view = rs.CurrentView()
 	rs.ViewDisplayMode(view, mode)
-	rs.Redraw()
+	document.redraw()
 	return {"status": "success", "view": view, "mode": mode}
 
 
@@ -74,13 +86,14 @@ def restore_named_view(name, view=None):
 	"""Restore a named view"""
 	result = rs.RestoreNamedView(name, view)
 	if result:
-		rs.Redraw()
+		document.redraw()
 		return {"status": "success", "name": name}
 	return {"status": "error", "message": "Failed to restore named view"}
 
 
 def capture_viewport(width=800, height=600):
 	"""Capture viewport to base64 PNG image"""
+	document.flush_redraw()
 	view = Rhino.RhinoDoc.ActiveDoc.Views.ActiveView
 	if not view:
 		return {"status": "error", "message": "No active view found"}
@@ -69,10 +69,7 @@ def generate_building(floors=5, floor_height=4, width=30, depth=20, column_radiu
 	"""
 	print("\nGenerating building: {} floors, {}x{} footprint".format(floors, width, depth))
 
-	# Create columns at corners
-	send_command("set_current_layer", {"name": "Columns"})
-	time.sleep(0.1)
-
+	# Create columns at corners in one batch (one UI-thread hop)
 	column_positions = [
 		[0, 0],
 		[width, 0],
@@ -81,38 +78,38 @@ def generate_building(floors=5, floor_height=4, width=30, depth=20, column_radiu
 	]
 
 	print("\nCreating columns...")
+	columns = [{"type": "set_current_layer", "params": {"name": "Columns"}}]
 	for x, y in column_positions:
-		result = send_command("create_cylinder", {
+		columns.append({"type": "create_cylinder", "params": {
 			"base": [x, y, 0],
 			"height": floors * floor_height,
 			"radius": column_radius
-		})
-
-		if result["status"] == "success":
-			print("  Column at ({}, {})".format(x, y))
-
-		time.sleep(0.1)
+		}})
 
-	# Create floor slabs
-	send_command("set_current_layer", {"name": "Floors"})
-	time.sleep(0.1)
+	result = send_command("batch", {"commands": columns, "stop_on_error": False})
+	if result["status"] == "success":
+		for (x, y), item in zip(column_positions, result["result"]["results"][1:]):
+			if item["status"] == "success":
+				print("  Column at ({}, {})".format(x, y))
 
+	# Create floor slabs in one batch
 	print("\nCreating floor slabs...")
+	slabs = [{"type": "set_current_layer", "params": {"name": "Floors"}}]
 	for floor in range(floors + 1):
-		z = floor * floor_height
-		result = send_command("create_box", {
+		slabs.append({"type": "create_box", "params": {
 			"width": width,
 			"depth": depth,
 			"height": slab_thickness,
 			"x": 0,
 			"y": 0,
-			"z": z
-		})
-
-		if result["status"] == "success":
-			print("  Floor {} at height {}".format(floor, z))
-
-		time.sleep(0.1)
+			"z": floor * floor_height
+		}})
+
+	result = send_command("batch", {"commands": slabs, "stop_on_error": False})
+	if result["status"] == "success":
+		for floor, item in enumerate(result["result"]["results"][1:]):
+			if item["status"] == "success":
+				print("  Floor {} at height {}".format(floor, floor * floor_height))
 
 	print("\nBuilding generation complete!")
 	print("Total height: {}".format(floors * floor_height))
@@ -4,17 +4,25 @@ Fractal Tree
 Creates a 3D fractal tree structure using recursive branching
 """
 
-import socket
-import json
+import sys
+import os
 import time
 import math
 import random
 
+# Use the framed protocol from the repository root
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import protocol
+
 RHINO_HOST = "localhost"
 RHINO_PORT = 54321
 
+# Keep-alive connection reused for every branch
+connection = [None]
+
+
 def send_command(command_type, params=None):
-	"""Send command to Rhino and return response"""
+	"""Send command to Rhino over a persistent connection and return response"""
 	if params is None:
 		params = {}
 
@@ -24,15 +32,17 @@ def send_command(command_type, params=None):
 	}
 
 	try:
-		sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-		sock.settimeout(5)
-		sock.connect((RHINO_HOST, RHINO_PORT))
-		sock.sendall(json.dumps(command).encode('utf-8'))
-		response_data = sock.recv(8192)
-		sock.close()
-		response = json.loads(response_data.decode('utf-8'))
+		if connection[0] is None:
+			connection[0] = protocol.connect(RHINO_HOST, RHINO_PORT, 5)
+		connection[0].sendall(protocol.encode_message(command))
+		response = protocol.recv_frame(connection[0])
+		if response is None:
+			raise ConnectionError("Connection closed by Rhino")
 		return response
 	except Exception as e:
+		if connection[0] is not None:
+			connection[0].close()
+			connection[0] = None
 		return {"status": "error", "message": str(e)}
 
 
@@ -11,194 +11,134 @@ if script_dir not in sys.path:
 	sys.path.insert(0, script_dir)
 
 import socket
+import select
+import selectors
+import stat
 import threading
-import json
+import queue
+import collections
+import itertools
+import time
 import rhinoscriptsyntax as rs
 import Rhino
 import System
 
-# Import all command functions from rhino.commands
+# Importing rhino.commands registers every command with rhino.registry
+import rhino.cache as cache
 import rhino.commands as commands
+import rhino.document as document
+import rhino.events as events
+import rhino.layer as layer
+import rhino.registry as registry
+import rhino.scene as scene
+import rhino.spatial as spatial
+import protocol
 
 SERVER_HOST = "localhost"
 SERVER_PORT = 54321
-BUFFER_SIZE = 8192
+COMMAND_TIMEOUT = 30
+CLIENT_IDLE_TIMEOUT = 300
+READ_TIMEOUT = 30
+PIPELINE_POLL_INTERVAL = 0.01
+
+# Connection handling and backpressure
+HANDLER_THREADS = 8
+LISTEN_BACKLOG = 128
+MAX_PENDING_COMMANDS = int(os.environ.get("RHINO_MCP_QUEUE_DEPTH", "256"))
+HANDLER_LINGER = 0.005
+MONITOR_INTERVAL = 1.0
+BUSY_RETRY_MIN_MS = 50
+BUSY_RETRY_MAX_MS = 5000
+LOAD_SMOOTHING = 0.1
+UI_TIME_SLICE = int(os.environ.get("RHINO_MCP_UI_SLICE_MS", "16")) / 1000.0
+STREAM_CHUNK_RECORDS = 1000
+TRANSACTION_IDLE_TIMEOUT = 120
+
+load_lock = threading.Lock()
+load = {
+	"connections": 0,
+	"pending_commands": 0,
+	"peak_pending": 0,
+	"completed": 0,
+	"rejected": 0,
+	"average_ms": 0.0,
+	"ui_drains": 0,
+	"redraws": 0,
+}
+ready_connections = queue.Queue()
+
+# Work waiting for the UI thread, drained by one scheduled callback at a time
+ui_lock = threading.Lock()
+ui_queue = collections.deque()
+ui_scheduled = [False]
+
+# PendingCommand currently executing on the UI thread, for progress reports
+running = [None]
+
+# Connection whose command is executing on the UI thread (None for legacy
+# clients and jobs)
+caller = [None]
+
+# Jobs by id, least recently used first; finished jobs are kept until collected
+MAX_FINISHED_JOBS = 100
+jobs_lock = threading.Lock()
+jobs = collections.OrderedDict()
+job_ids = itertools.count(1)
+
+# Open transaction; Rhino keeps one active undo record per document, so
+# there is at most one transaction. It belongs to the connection that began
+# it (None for legacy clients, which connect once per command)
+transaction = {
+	"serial": None,
+	"owner": None,
+	"name": None,
+	"redraw": None,
+	"commands": 0,
+	"changes": 0,
+	"last_used": 0.0,
+}
+
+# Document events that show the open undo record captured a change
+TRANSACTION_CHANGE_EVENTS = (
+	"AddRhinoObject",
+	"DeleteRhinoObject",
+	"ReplaceRhinoObject",
+	"UndeleteRhinoObject",
+	"ModifyObjectAttributes",
+	"LayerTableEvent",
+)
 
 
 # ============================================================================
 # COMMAND MAPPING AND EXECUTION
 # ============================================================================
 
-def execute_command(command_dict):
-	"""Execute JSON command and return JSON response"""
+def execute_command(command_dict, owner=None):
+	"""
+	Execute JSON command and return JSON response
+	While a transaction is open, mutating commands from other connections
+	are refused so they cannot end up in its undo record.
+	command_dict: decoded request dict
+	owner: Connection the command came from (None for legacy clients and jobs)
+	return: response dict
+	"""
 	try:
 		cmd_type = command_dict.get("type", "")
 		params = command_dict.get("params", {})
 
-		command_map = {
-			# Basic geometry
-			"create_point": commands.create_point,
-			"create_line": commands.create_line,
-			"create_circle": commands.create_circle,
-			"create_arc": commands.create_arc,
-			"create_ellipse": commands.create_ellipse,
-			"create_polyline": commands.create_polyline,
-			"create_curve": commands.create_curve,
-			# 3D solids
-			"create_box": commands.create_box,
-			"create_sphere": commands.create_sphere,
-			"create_cylinder": commands.create_cylinder,
-			"create_cone": commands.create_cone,
-			"create_torus": commands.create_torus,
-			# Transformations
-			"move_objects": commands.move_objects,
-			"rotate_objects": commands.rotate_objects,
-			"scale_objects": commands.scale_objects,
-			"mirror_objects": commands.mirror_objects,
-			"copy_objects": commands.copy_objects,
-			"array_linear": commands.array_linear,
-			"array_polar": commands.array_polar,
-			"orient_objects": commands.orient_objects,
-			# Boolean operations
-			"boolean_union": commands.boolean_union,
-			"boolean_difference": commands.boolean_difference,
-			"boolean_intersection": commands.boolean_intersection,
-			# Curve operations
-			"join_curves": commands.join_curves,
-			"explode_curves": commands.explode_curves,
-			"offset_curve": commands.offset_curve,
-			"fillet_curves": commands.fillet_curves,
-			"extend_curve": commands.extend_curve,
-			"create_rectangle": commands.create_rectangle,
-			"create_spiral": commands.create_spiral,
-			"create_nurbs_curve": commands.create_nurbs_curve,
-			"create_blend_curve": commands.create_blend_curve,
-			"divide_curve": commands.divide_curve_cmd,
-			"divide_curve_length": commands.divide_curve_length_cmd,
-			"split_curve": commands.split_curve,
-			"close_curve": commands.close_curve,
-			"reverse_curve": commands.reverse_curve,
-			"rebuild_curve": commands.rebuild_curve,
-			"project_curve_to_surface": commands.project_curve_to_surface,
-			# Curve analysis
-			"curve_closest_point": commands.curve_closest_point,
-			"evaluate_curve": commands.evaluate_curve,
-			"curve_start_end_points": commands.curve_start_end_points,
-			"curve_curve_intersection": commands.curve_curve_intersection,
-			# Surface operations
-			"extrude_curve_straight": commands.extrude_curve_straight,
-			"revolve_curve": commands.revolve_curve,
-			"loft_curves": commands.loft_curves,
-			"create_pipe": commands.create_pipe,
-			"sweep1": commands.sweep1,
-			"sweep2": commands.sweep2,
-			"create_planar_surface": commands.create_planar_surface,
-			"create_edge_surface": commands.create_edge_surface,
-			"create_network_surface": commands.create_network_surface,
-			"create_patch": commands.create_patch,
-			"offset_surface": commands.offset_surface,
-			"split_brep": commands.split_brep,
-			"fillet_surfaces": commands.fillet_surfaces,
-			"cap_planar_holes": commands.cap_planar_holes,
-			"extrude_curve_along_curve": commands.extrude_curve_along_curve,
-			"extrude_curve_to_point": commands.extrude_curve_to_point,
-			"duplicate_edge_curves": commands.duplicate_edge_curves,
-			"duplicate_surface_border": commands.duplicate_surface_border,
-			"join_surfaces": commands.join_surfaces,
-			"explode_polysurfaces": commands.explode_polysurfaces,
-			"unroll_surface": commands.unroll_surface,
-			# Mesh operations
-			"create_mesh": commands.create_mesh,
-			"create_planar_mesh": commands.create_planar_mesh,
-			"mesh_from_surface": commands.mesh_from_surface,
-			"mesh_boolean_union": commands.mesh_boolean_union,
-			"mesh_boolean_difference": commands.mesh_boolean_difference,
-			"mesh_boolean_intersection": commands.mesh_boolean_intersection,
-			"join_meshes": commands.join_meshes,
-			"mesh_to_nurb": commands.mesh_to_nurb,
-			"mesh_offset": commands.mesh_offset,
-			# Group operations
-			"create_group": commands.create_group,
-			"delete_group": commands.delete_group,
-			"add_to_group": commands.add_to_group,
-			"remove_from_group": commands.remove_from_group,
-			"list_groups": commands.list_groups,
-			"select_by_group": commands.select_by_group,
-			# View operations
-			"set_view_camera": commands.set_view_camera,
-			"zoom_extents": commands.zoom_extents,
-			"zoom_selected": commands.zoom_selected,
-			"get_view_info": commands.get_view_info,
-			"set_display_mode": commands.set_display_mode,
-			"add_named_view": commands.add_named_view,
-			"restore_named_view": commands.restore_named_view,
-			"capture_viewport": commands.capture_viewport,
-			# Block operations
-			"create_block": commands.create_block,
-			"insert_block": commands.insert_block,
-			"explode_block": commands.explode_block,
-			"delete_block": commands.delete_block,
-			"list_blocks": commands.list_blocks,
-			# Material operations
-			"add_material_to_object": commands.add_material_to_object,
-			"add_material_to_layer": commands.add_material_to_layer,
-			"set_material_color": commands.set_material_color,
-			"set_material_transparency": commands.set_material_transparency,
-			"set_material_shine": commands.set_material_shine,
-			# Object operations
-			"hide_objects": commands.hide_objects,
-			"show_objects": commands.show_objects,
-			"lock_objects": commands.lock_objects,
-			"unlock_objects": commands.unlock_objects,
-			"is_object_solid": commands.is_object_solid,
-			# Selection operations
-			"select_by_name": commands.select_by_name,
-			"last_created_objects": commands.last_created_objects,
-			"invert_selection": commands.invert_selection,
-			# Document operations
-			"get_document_info": commands.get_document_info,
-			"set_unit_system": commands.set_unit_system,
-			"enable_redraw": commands.enable_redraw,
-			# Annotation operations
-			"add_text": commands.add_text,
-			"add_text_dot": commands.add_text_dot,
-			"add_leader": commands.add_leader,
-			# User data operations
-			"set_user_text": commands.set_user_text,
-			"get_user_text": commands.get_user_text,
-			"set_document_user_text": commands.set_document_user_text,
-			"get_document_user_text": commands.get_document_user_text,
-			# Layer operations
-			"create_layer": commands.create_layer,
-			"delete_layer": commands.delete_layer,
-			"set_current_layer": commands.set_current_layer,
-			"set_layer_color": commands.set_layer_color,
-			"set_layer_visibility": commands.set_layer_visibility,
-			"list_layers": commands.list_layers,
-			# Analysis
-			"measure_distance": commands.measure_distance,
-			"measure_curve_length": commands.measure_curve_length,
-			"measure_area": commands.measure_area,
-			"measure_volume": commands.measure_volume,
-			# Object properties
-			"set_object_name": commands.set_object_name,
-			"set_object_color": commands.set_object_color,
-			"set_object_layer": commands.set_object_layer,
-			# Selection
-			"select_all": commands.select_all,
-			"select_by_type": commands.select_by_type,
-			"select_by_layer": commands.select_by_layer,
-			"unselect_all": commands.unselect_all,
-			"delete_selected": commands.delete_selected,
-			"get_selected_objects": commands.get_selected_objects,
-			"get_scene_info": commands.get_scene_info,
-			# Code execution
-			"execute_python_code": commands.execute_python_code,
-		}
-
-		handler = command_map.get(cmd_type)
-		if handler:
-			return handler(params)
+		entry = registry.lookup(cmd_type)
+		if entry:
+			caller[0] = owner
+			if transaction["serial"] is None:
+				return entry["handler"](params)
+			if entry["mutating"] and transaction["owner"] is not owner:
+				message = "Transaction " + transaction["name"] + " is open on another connection"
+				return {"status": "error", "message": message}
+			transaction["last_used"] = time.monotonic()
+			result = entry["handler"](params)
+			if entry["mutating"] and result.get("status") == "success":
+				transaction["commands"] += 1
+			return result
 		else:
 			return {"status": "error", "message": "Unknown command: " + cmd_type}
 
@@ -206,66 +146,958 @@ def execute_command(command_dict):
 		return {"status": "error", "message": "Error: " + str(e)}
 
 
+def report_progress(completed, total):
+	"""
+	Record progress of the command running on the UI thread
+	completed: steps finished so far
+	total: total number of steps
+	"""
+	pending = running[0]
+	if pending is not None:
+		pending.progress = {"completed": completed, "total": total}
+
+
+def batch_redraws(items):
+	"""Check whether any command in a batch redraws the viewport"""
+	for item in items:
+		entry = registry.lookup(item.get("type")) if isinstance(item, dict) else None
+		if entry is None or entry["redraw"]:
+			return True
+	return False
+
+
+@registry.command("batch", cost="heavy")
+def execute_batch(params):
+	"""
+	Run an ordered list of commands inside one UI-thread invocation
+	Redraw is suspended while the batch runs and performed once at the end,
+	unless no command in the batch redraws.
+	An atomic batch runs in its own transaction and is rolled back in one
+	undo step if any item fails.
+	params: {"commands": [{"type": ..., "params": {...}}, ...],
+		"stop_on_error": stop at the first failed item (default True),
+		"atomic": undo the whole batch if an item fails (default False)}
+	return: response dict with one result per executed item
+	"""
+	items = params.get("commands", [])
+	stop_on_error = params.get("stop_on_error", True)
+	atomic = params.get("atomic", False)
+
+	if not isinstance(items, list):
+		return {"status": "error", "message": "commands must be a list"}
+
+	if atomic:
+		started = begin_transaction({"name": "RhinoMCP batch"})
+		if started["status"] != "success":
+			return started
+		stop_on_error = True
+
+	results = []
+	failed = 0
+	redraws = batch_redraws(items)
+	if redraws:
+		previous = document.suspend_redraw()
+	try:
+		for item in items:
+			if not isinstance(item, dict):
+				result = {"status": "error", "message": "Batch item must be an object"}
+			elif item.get("type") == "batch":
+				result = {"status": "error", "message": "Nested batch is not supported"}
+			else:
+				result = execute_command(item, caller[0])
+			results.append(result)
+			report_progress(len(results), len(items))
+			if result.get("status") != "success":
+				failed += 1
+				if stop_on_error:
+					break
+	finally:
+		if redraws:
+			document.resume_redraw(previous)
+		if atomic:
+			if failed:
+				rollback_transaction({})
+			else:
+				commit_transaction({})
+
+	result = {
+		"count": len(items),
+		"completed": len(results),
+		"failed": failed,
+		"results": results
+	}
+	if atomic:
+		result["rolled_back"] = failed > 0
+	return {"status": "success", "result": result}
+
+
+# ============================================================================
+# TRANSACTIONS
+# ============================================================================
+
+@registry.command(mutating=False, redraw=False)
+def begin_transaction(params):
+	"""
+	Group the following commands into one undo record with redraw suspended
+	Only the connection that began it may commit or roll it back, and other
+	connections' mutating commands are refused until it is closed. A
+	transaction left idle for TRANSACTION_IDLE_TIMEOUT seconds, or whose
+	connection closes, is committed so the undo record is not held open.
+	params: {"name": description shown in Rhino's undo list (optional)}
+	return: response dict
+	"""
+	if transaction["serial"] is not None:
+		return {"status": "error", "message": "Transaction already open: " + transaction["name"]}
+
+	name = params.get("name", "RhinoMCP transaction")
+	serial = document.begin_undo_record(name)
+	if not serial:
+		return {"status": "error", "message": "Could not start an undo record"}
+
+	transaction["serial"] = serial
+	transaction["owner"] = caller[0]
+	transaction["name"] = name
+	transaction["redraw"] = document.suspend_redraw()
+	transaction["commands"] = 0
+	transaction["changes"] = 0
+	transaction["last_used"] = time.monotonic()
+	return {"status": "success", "result": {"name": name}}
+
+
+def note_transaction_change(args):
+	"""Count a document change made while a transaction is open (event callback)"""
+	if transaction["serial"] is not None:
+		transaction["changes"] += 1
+
+
+def close_transaction():
+	"""
+	End the open undo record and restore redraw
+	return: dict with the closed transaction's name, successful mutating
+		command count and number of document changes seen
+	"""
+	closed = {
+		"name": transaction["name"],
+		"commands": transaction["commands"],
+		"changes": transaction["changes"],
+	}
+	serial = transaction["serial"]
+	transaction["serial"] = None
+	transaction["owner"] = None
+	try:
+		document.end_undo_record(serial)
+	finally:
+		document.resume_redraw(transaction["redraw"])
+	return closed
+
+
+def transaction_error():
+	"""
+	Check the open transaction may be closed by the calling connection
+	return: error response dict, or None if it may
+	"""
+	if transaction["serial"] is None:
+		return {"status": "error", "message": "No transaction is open"}
+	if transaction["owner"] is not caller[0]:
+		message = "Transaction " + transaction["name"] + " belongs to another connection"
+		return {"status": "error", "message": message}
+	return None
+
+
+@registry.command(mutating=False, redraw=True)
+def commit_transaction(params):
+	"""
+	Close the open transaction, keeping its changes as one undo step
+	params: {}
+	return: response dict with the transaction name and mutating command count
+	"""
+	error = transaction_error()
+	if error is not None:
+		return error
+	return {"status": "success", "result": close_transaction()}
+
+
+@registry.command(mutating=False, redraw=True)
+def rollback_transaction(params):
+	"""
+	Close the open transaction and undo all of its changes in one step
+	params: {}
+	return: response dict with the transaction name, command and change
+		counts and whether anything was undone
+	"""
+	error = transaction_error()
+	if error is not None:
+		return error
+	closed = close_transaction()
+	# Rhino discards an undo record without changes, so Undo would then
+	# revert the user's previous record. Only undo when a mutating command
+	# succeeded and the document reported a change while the record was open.
+	closed["undone"] = bool(closed["commands"] and closed["changes"] and document.undo())
+	return {"status": "success", "result": closed}
+
+
+def expire_transaction():
+	"""Commit the open transaction if it has been idle too long (UI thread)"""
+	if transaction["serial"] is None:
+		return
+	if time.monotonic() - transaction["last_used"] > TRANSACTION_IDLE_TIMEOUT:
+		closed = close_transaction()
+		print("Committed idle transaction: " + closed["name"])
+
+
+def abandon_transaction(conn):
+	"""
+	Commit the open transaction if it belongs to a closed connection (UI thread)
+	conn: Connection that was closed
+	"""
+	if transaction["serial"] is not None and transaction["owner"] is conn:
+		closed = close_transaction()
+		print("Committed transaction of closed connection: " + closed["name"])
+
+
 # ============================================================================
 # SOCKET SERVER
 # ============================================================================
 
-def handle_client(client_socket):
-	"""Handle incoming client connection"""
-	incomplete_data = b""
+class PendingCommand:
+	"""A command scheduled on the UI thread whose result may not be ready yet"""
+
+	def __init__(self, command):
+		self.request_id = command.get("id")
+		self.type = command.get("type", "")
+		self.compress = command.get("compress")
+		self.compress_min = command.get("compress_min", protocol.COMPRESS_THRESHOLD)
+		self.submitted = time.monotonic()
+		self.deadline = self.submitted + COMMAND_TIMEOUT
+		self.started = None
+		self.finished = None
+		self.progress = None
+		self.result = None
+		self.done = threading.Event()
+
+	def finish(self, result):
+		"""Store the result and wake any waiter"""
+		self.result = result
+		self.finished = time.monotonic()
+		self.done.set()
+
+	def expired(self):
+		"""Check whether the command has run past its timeout"""
+		return time.monotonic() >= self.deadline
+
+	def response(self):
+		"""
+		Build the response for this command, tagged with its request id
+		return: response dict (a timeout error if the result is not ready)
+		"""
+		if self.done.is_set():
+			response = dict(self.result)
+		else:
+			# Keep the result of the still-running command collectable
+			job_id = register_job(self)
+			response = {
+				"status": "error",
+				"job_id": job_id,
+				"message": "Command timed out waiting for UI thread; it continues as job "
+					+ str(job_id) + ", collect it with job_result"
+			}
+		if self.request_id is not None:
+			response["id"] = self.request_id
+		return response
+
+	def encode(self):
+		"""
+		Encode the response, compressed if the client accepts it and it is large
+		A result that cannot be encoded is answered with an error for the same id.
+		return: framed response bytes
+		"""
+		response = self.response()
+		try:
+			return protocol.encode_message(
+				response, compress=self.compress, threshold=self.compress_min)
+		except (TypeError, ValueError) as e:
+			error = {"status": "error", "message": "Cannot encode response: " + str(e)}
+			if self.request_id is not None:
+				error["id"] = self.request_id
+			return protocol.encode_message(error)
+
+
+def admit_command():
+	"""
+	Reserve a slot in the bounded pending-command queue
+	return: True if admitted, False if the queue is full
+	"""
+	with load_lock:
+		if load["pending_commands"] >= MAX_PENDING_COMMANDS:
+			load["rejected"] += 1
+			return False
+		load["pending_commands"] += 1
+		load["peak_pending"] = max(load["peak_pending"], load["pending_commands"])
+		return True
+
 
+def release_command(elapsed):
+	"""
+	Free a pending-command slot and update the average run time
+	elapsed: seconds the command ran on the UI thread
+	"""
+	with load_lock:
+		load["pending_commands"] -= 1
+		load["completed"] += 1
+		load["average_ms"] += (elapsed * 1000 - load["average_ms"]) * LOAD_SMOOTHING
+
+
+def busy_response():
+	"""
+	Build the response for a command rejected because the queue is full
+	The retry delay is the time the queued commands are expected to take.
+	return: error response dict with busy and retry_after_ms
+	"""
+	with load_lock:
+		estimate = load["pending_commands"] * load["average_ms"]
+	retry_after = int(min(max(estimate, BUSY_RETRY_MIN_MS), BUSY_RETRY_MAX_MS))
+	return {
+		"status": "error",
+		"busy": True,
+		"retry_after_ms": retry_after,
+		"message": "Listener busy, retry after " + str(retry_after) + " ms"
+	}
+
+
+def schedule_ui_drain():
+	"""Ask Rhino to run drain_ui_queue on the UI thread"""
+	Rhino.RhinoApp.InvokeOnUiThread(System.Action(drain_ui_queue))
+
+
+def run_on_ui_thread(task):
+	"""
+	Queue a task for the UI thread
+	Only one drain callback is scheduled at a time however many tasks are
+	queued, so a burst of commands does not flood Rhino's message loop.
+	task: callable taking no arguments
+	"""
+	with ui_lock:
+		ui_queue.append(task)
+		if ui_scheduled[0]:
+			return
+		ui_scheduled[0] = True
 	try:
-		while True:
-			data = client_socket.recv(BUFFER_SIZE)
-			if not data:
+		schedule_ui_drain()
+	except Exception:
+		with ui_lock:
+			ui_queue.remove(task)
+			ui_scheduled[0] = False
+		raise
+
+
+def drain_ui_queue():
+	"""
+	Run queued tasks on the UI thread for up to UI_TIME_SLICE seconds
+	The viewport is redrawn once at the end of the slice if any task marked
+	it dirty. If work remains, yield to Rhino so the UI stays responsive and
+	reschedule for the next message loop iteration.
+	"""
+	deadline = time.monotonic() + UI_TIME_SLICE
+	with load_lock:
+		load["ui_drains"] += 1
+	while True:
+		with ui_lock:
+			if not ui_queue:
 				break
+			task = ui_queue.popleft()
+		try:
+			task()
+		except Exception as e:
+			print("UI task error: " + str(e))
+		if time.monotonic() >= deadline:
+			break
+
+	try:
+		if document.flush_redraw():
+			with load_lock:
+				load["redraws"] += 1
+	except Exception as e:
+		print("Redraw error: " + str(e))
+
+	with ui_lock:
+		if not ui_queue:
+			ui_scheduled[0] = False
+			return
+	schedule_ui_drain()
+
+
+def submit_command(command, owner=None):
+	"""
+	Schedule a command on the UI thread without waiting for it
+	command: decoded request dict
+	owner: Connection the command came from (None for legacy clients and jobs)
+	return: PendingCommand (already finished with a busy error if the queue is full)
+	"""
+	pending = PendingCommand(command)
+	if not admit_command():
+		pending.finish(busy_response())
+		return pending
+
+	# Execute command on UI thread to avoid macOS threading crashes
+	# Rhino requires all object modifications to happen on the main thread
+	def run_on_ui():
+		pending.started = time.monotonic()
+		running[0] = pending
+		try:
+			result = execute_command(command, owner)
+		except Exception as e:
+			result = {"status": "error", "message": "Error: " + str(e)}
+		running[0] = None
+		caller[0] = None
+		release_command(time.monotonic() - pending.started)
+		pending.finish(result)
+
+	try:
+		run_on_ui_thread(run_on_ui)
+	except Exception:
+		release_command(0)
+		raise
+	return pending
+
+
+@registry.command(mutating=False, control=True)
+def listener_status(params):
+	"""
+	Report listener load, answered on the handler thread
+	params: unused
+	return: response dict with queue depth and handler pool state
+	"""
+	with load_lock:
+		result = dict(load)
+	result["average_ms"] = round(result["average_ms"], 3)
+	result["max_pending_commands"] = MAX_PENDING_COMMANDS
+	result["handler_threads"] = HANDLER_THREADS
+	result["ui_queue"] = len(ui_queue)
+	result["ui_time_slice_ms"] = UI_TIME_SLICE * 1000
+	result["ready_connections"] = ready_connections.qsize()
+	result["jobs"] = len(jobs)
+	result["transaction"] = transaction["name"] if transaction["serial"] is not None else None
+	result["result_cache"] = cache.status()
+	return {"status": "success", "result": result}
+
+
+def register_job(pending):
+	"""
+	Track a submitted command as a job, evicting the oldest finished jobs
+	pending: PendingCommand
+	return: job id
+	"""
+	with jobs_lock:
+		job_id = next(job_ids)
+		jobs[job_id] = pending
+		finished = [key for key, job in jobs.items() if job.done.is_set()]
+		for key in finished[:max(0, len(finished) - MAX_FINISHED_JOBS)]:
+			del jobs[key]
+	return job_id
+
+
+def find_job(params):
+	"""
+	Look up a job and mark it recently used
+	params: {"job_id": id returned by submit_job}
+	return: PendingCommand, or None if unknown or evicted
+	"""
+	with jobs_lock:
+		job = jobs.get(params.get("job_id"))
+		if job is not None:
+			jobs.move_to_end(params.get("job_id"))
+	return job
+
+
+def job_state(job):
+	"""Describe where a job is: queued, running, done or failed"""
+	if job.done.is_set():
+		return "done" if job.result.get("status") == "success" else "failed"
+	if job.started is None:
+		return "queued"
+	return "running"
+
+
+@registry.command(mutating=False, control=True)
+def submit_job(params):
+	"""
+	Start a command as a job and return its id without waiting
+	params: {"type": command type, "params": command params}
+	return: response dict with job_id
+	"""
+	command = {"type": params.get("type", ""), "params": params.get("params", {})}
+	entry = registry.lookup(command["type"])
+	if entry is not None and entry["control"]:
+		return {"status": "error", "message": "Cannot run " + command["type"] + " as a job"}
+	pending = submit_command(command)
+	if pending.done.is_set() and pending.result.get("busy"):
+		return pending.result
+	job_id = register_job(pending)
+	return {"status": "success", "result": {"job_id": job_id, "state": job_state(pending)}}
+
+
+@registry.command(mutating=False, control=True)
+def job_status(params):
+	"""
+	Report a job's state, elapsed time and progress
+	params: {"job_id": id}
+	return: response dict with state, elapsed seconds and progress (batches)
+	"""
+	job = find_job(params)
+	if job is None:
+		return {"status": "error", "message": "Unknown job: " + str(params.get("job_id"))}
+	end = job.finished if job.finished is not None else time.monotonic()
+	return {
+		"status": "success",
+		"result": {
+			"job_id": params.get("job_id"),
+			"type": job.type,
+			"state": job_state(job),
+			"elapsed": round(end - job.submitted, 3),
+			"progress": job.progress
+		}
+	}
 
-			incomplete_data += data
 
+@registry.command(mutating=False, control=True)
+def job_result(params):
+	"""
+	Collect a finished job's response and forget the job
+	params: {"job_id": id}
+	return: the command's own response, or an error if it is not finished
+	"""
+	job = find_job(params)
+	if job is None:
+		return {"status": "error", "message": "Unknown job: " + str(params.get("job_id"))}
+	if not job.done.is_set():
+		message = "Job " + str(params.get("job_id")) + " is still " + job_state(job)
+		return {"status": "error", "message": message}
+	with jobs_lock:
+		jobs.pop(params.get("job_id"), None)
+	response = dict(job.result)
+	response["job_id"] = params.get("job_id")
+	return response
+
+
+@registry.command(mutating=False, control=True)
+def list_commands(params):
+	"""
+	Describe every command the listener accepts, answered on the handler thread
+	params: unused
+	return: response dict with name, mutating, cost, needs_selection, redraw,
+		streaming and thread for each command
+	"""
+	return {"status": "success", "result": {"commands": registry.list_commands()}}
+
+
+def dispatch_command(command, earlier=(), owner=None):
+	"""
+	Start a command: control commands run immediately, others go to the UI thread
+	A control command pipelined behind unfinished commands of the same
+	connection is queued on the UI thread after them instead, so it sees
+	the document as they leave it.
+	command: decoded request dict
+	earlier: PendingCommands sent before it on the same connection
+	owner: Connection the command came from (None for legacy clients)
+	return: PendingCommand
+	"""
+	entry = registry.lookup(command.get("type"))
+	if entry is None or not entry["control"]:
+		return submit_command(command, owner)
+	if any(not pending.done.is_set() for pending in earlier):
+		return submit_command(command, owner)
+	pending = PendingCommand(command)
+	try:
+		result = entry["handler"](command.get("params", {}))
+	except Exception as e:
+		result = {"status": "error", "message": "Error: " + str(e)}
+	pending.finish(result)
+	return pending
+
+
+def run_command(command):
+	"""
+	Execute a command and wait for its result
+	command: decoded request dict
+	return: response dict
+	"""
+	pending = dispatch_command(command)
+	pending.done.wait(timeout=COMMAND_TIMEOUT)
+	return pending.response()
+
+
+def encode_response(response, framed):
+	"""Encode a response in the same mode the client used"""
+	if framed:
+		return protocol.encode_message(response)
+	return protocol.encode_legacy(response)
+
+
+def is_readable(client_socket, timeout=0):
+	"""Check whether the client has sent more data, waiting up to timeout seconds"""
+	readable, _, _ = select.select([client_socket], [], [], timeout)
+	return bool(readable)
+
+
+def send_finished(client_socket, pending):
+	"""
+	Send responses for pipelined commands in request order
+	Waits briefly on the oldest command so new requests keep being read.
+	client_socket: connected client socket
+	pending: deque of PendingCommand, oldest first
+	"""
+	oldest = pending[0]
+	if not oldest.done.wait(PIPELINE_POLL_INTERVAL) and not oldest.expired():
+		return
+	while pending and (pending[0].done.is_set() or pending[0].expired()):
+		client_socket.sendall(pending.popleft().encode())
+
+
+class CommandStream:
+	"""
+	A streamed listing command whose records are produced on the UI thread
+	Records are pulled from the command's generator one chunk per UI
+	callback, so the UI stays responsive and memory holds at most two chunks.
+	"""
+
+	def __init__(self, command, factory):
+		self.params = command.get("params", {})
+		self.factory = factory
+		self.records = None
+		self.chunks = queue.Queue()
+
+	def request_chunk(self):
+		"""Schedule production of the next chunk on the UI thread"""
+		run_on_ui_thread(self.produce)
+
+	def produce(self):
+		"""
+		Pull records for up to one time slice (runs on the UI thread)
+		Queues (records, end) where end is None while more records follow,
+		or the final response once the generator is exhausted or failed.
+		"""
+		deadline = time.monotonic() + UI_TIME_SLICE
+		chunk = []
+		try:
+			if self.records is None:
+				self.records = self.factory(self.params)
+			while len(chunk) < STREAM_CHUNK_RECORDS and time.monotonic() < deadline:
+				chunk.append(next(self.records))
+		except StopIteration as stop:
+			self.chunks.put((chunk, {"status": "success", "result": stop.value or {}}))
+			return
+		except Exception as e:
+			self.chunks.put((chunk, {"status": "error", "message": "Error: " + str(e)}))
+			return
+		self.chunks.put((chunk, None))
+
+
+def stream_factory(command):
+	"""
+	Get the record generator for a request that asked to be streamed
+	command: decoded request dict
+	return: generator function, or None to answer with a single response
+	"""
+	if not command.get("stream"):
+		return None
+	entry = registry.lookup(command.get("type"))
+	return entry["stream"] if entry is not None else None
+
+
+def serve_stream(conn, command, factory):
+	"""
+	Send a streamed response: NDJSON chunks, then a trailer with the count
+	Earlier pipelined responses are flushed first so order is preserved.
+	The next chunk is produced on the UI thread while the current one is sent.
+	conn: Connection
+	command: decoded request dict
+	factory: generator function registered as the command's stream
+	"""
+	client_socket = conn.sock
+	while conn.pending:
+		send_finished(client_socket, conn.pending)
+
+	pending = PendingCommand(command)
+	if not admit_command():
+		pending.finish(busy_response())
+		client_socket.sendall(pending.encode())
+		return
+
+	stream = CommandStream(command, factory)
+	start = time.monotonic()
+	count = 0
+	end = None
+	try:
+		stream.request_chunk()
+		while end is None:
 			try:
-				command = json.loads(incomplete_data.decode("utf-8"))
-				incomplete_data = b""
+				records, end = stream.chunks.get(timeout=COMMAND_TIMEOUT)
+			except queue.Empty:
+				records = []
+				end = {"status": "error", "message": "Stream timed out waiting for UI thread"}
+			if end is None:
+				stream.request_chunk()
+			if records:
+				count += len(records)
+				client_socket.sendall(protocol.encode_records(
+					records, compress=pending.compress, threshold=pending.compress_min))
+	finally:
+		release_command(time.monotonic() - start)
 
-				# Execute command on UI thread to avoid macOS threading crashes
-				# Rhino requires all object modifications to happen on the main thread
-				result_holder = [None]
-				done_event = threading.Event()
+	if end.get("status") == "success":
+		end["result"] = dict(end["result"], count=count)
+	pending.finish(end)
+	client_socket.sendall(pending.encode())
+
+
+class Connection:
+	"""A client connection and the commands it has in flight"""
+
+	def __init__(self, client_socket):
+		self.sock = client_socket
+		self.framed = False
+		self.pending = collections.deque()
+		self.last_active = time.monotonic()
 
-				def run_on_ui():
-					try:
-						result_holder[0] = execute_command(command)
-					except Exception as e:
-						result_holder[0] = {"status": "error", "message": "Error: " + str(e)}
-					finally:
-						done_event.set()
-
-				Rhino.RhinoApp.InvokeOnUiThread(System.Action(run_on_ui))
-				done_event.wait(timeout=30)
-
-				if result_holder[0] is None:
-					response = {"status": "error", "message": "Command timed out waiting for UI thread"}
-				else:
-					response = result_holder[0]
-
-				response_json = json.dumps(response)
-				client_socket.sendall(response_json.encode("utf-8"))
-				break
 
-			except ValueError:
+def close_connection(conn):
+	"""
+	Close a client connection and update the connection count
+	A transaction the connection left open is committed on the UI thread.
+	"""
+	with load_lock:
+		load["connections"] -= 1
+	try:
+		conn.sock.close()
+	except:
+		pass
+	if transaction["owner"] is conn:
+		run_on_ui_thread(lambda: abandon_transaction(conn))
+
+
+def serve_connection(conn):
+	"""
+	Serve a connection while it has requests or responses in flight
+	Framed clients may pipeline any number of requests over one connection;
+	each is scheduled as soon as it arrives and responses are sent back in
+	request order, tagged with the client-supplied "id". Responses of at least
+	"compress_min" bytes are compressed with the first codec in "compress".
+	Requests with "stream": true for a command registered with a stream are
+	answered with NDJSON chunks followed by a trailer (see serve_stream).
+	Legacy clients get one response and the connection is closed, as before.
+	Once a framed connection goes quiet it is handed back to the monitor, so
+	idle keep-alive connections do not hold a handler thread.
+	conn: Connection with data ready to read
+	return: True if the connection stays open
+	"""
+	client_socket = conn.sock
+	command = None
+	try:
+		while True:
+			if conn.pending and not is_readable(client_socket):
+				send_finished(client_socket, conn.pending)
 				continue
+			if not conn.pending and not is_readable(client_socket, HANDLER_LINGER):
+				conn.last_active = time.monotonic()
+				return True
+			command, conn.framed = protocol.recv_message(client_socket)
+			if command is None:
+				break
+			if not conn.framed:
+				client_socket.sendall(protocol.encode_legacy(run_command(command)))
+				break
+			factory = stream_factory(command)
+			if factory is not None:
+				serve_stream(conn, command, factory)
+				continue
+			conn.pending.append(dispatch_command(command, conn.pending, conn))
+
+		# Client finished sending, deliver what is still in flight
+		while conn.pending:
+			send_finished(client_socket, conn.pending)
 
+	except socket.timeout:
+		pass
 	except Exception as e:
-		error_msg = json.dumps({"status": "error", "message": "Connection error: " + str(e)})
+		error = {"status": "error", "message": "Connection error: " + str(e)}
+		# Tag the error with the request the client is waiting on: the oldest
+		# pipelined one, else the one being read or streamed
+		if conn.pending:
+			error["id"] = conn.pending[0].request_id
+		elif command is not None and command.get("id") is not None:
+			error["id"] = command.get("id")
+		else:
+			error["id"] = protocol.CONNECTION_ERROR_ID
 		try:
-			client_socket.send(error_msg.encode("utf-8"))
+			client_socket.sendall(encode_response(error, conn.framed))
 		except:
 			pass
-	finally:
+	return False
+
+
+class ConnectionMonitor:
+	"""
+	Watches idle keep-alive connections on a single thread
+	A connection is handed to the handler pool as soon as it has data to
+	read, and closed after CLIENT_IDLE_TIMEOUT seconds without a request.
+	"""
+
+	def __init__(self):
+		self.selector = selectors.DefaultSelector()
+		self.incoming = queue.Queue()
+		self.wake_recv, self.wake_send = socket.socketpair()
+		self.wake_recv.setblocking(False)
+		self.wake_send.setblocking(False)
+		self.selector.register(self.wake_recv, selectors.EVENT_READ, None)
+		self.next_sweep = time.monotonic() + MONITOR_INTERVAL
+
+	def watch(self, conn):
+		"""Start watching a connection (callable from any thread)"""
+		self.incoming.put(conn)
 		try:
-			client_socket.close()
-		except:
+			self.wake_send.send(b"\0")
+		except OSError:
+			# Wake buffer is full, the monitor is already awake
 			pass
 
+	def register_incoming(self):
+		"""Register connections queued by watch()"""
+		while True:
+			try:
+				conn = self.incoming.get_nowait()
+			except queue.Empty:
+				return
+			self.selector.register(conn.sock, selectors.EVENT_READ, conn)
+
+	def close_idle(self):
+		"""
+		Close connections that have been idle past CLIENT_IDLE_TIMEOUT and
+		commit a transaction idle past TRANSACTION_IDLE_TIMEOUT
+		"""
+		now = time.monotonic()
+		if now < self.next_sweep:
+			return
+		self.next_sweep = now + MONITOR_INTERVAL
+		for key in list(self.selector.get_map().values()):
+			conn = key.data
+			if conn is not None and now - conn.last_active > CLIENT_IDLE_TIMEOUT:
+				self.selector.unregister(conn.sock)
+				close_connection(conn)
+		idle = now - transaction["last_used"]
+		if transaction["serial"] is not None and idle > TRANSACTION_IDLE_TIMEOUT:
+			run_on_ui_thread(expire_transaction)
+
+	def run(self):
+		"""Monitor loop, runs on its own thread"""
+		while True:
+			for key, mask in self.selector.select(MONITOR_INTERVAL):
+				if key.data is None:
+					try:
+						while self.wake_recv.recv(4096):
+							pass
+					except OSError:
+						pass
+					continue
+				self.selector.unregister(key.fileobj)
+				ready_connections.put(key.data)
+			self.register_incoming()
+			self.close_idle()
+
+
+def handler_worker():
+	"""Serve ready connections from the shared queue, one at a time"""
+	while True:
+		conn = ready_connections.get()
+		if serve_connection(conn):
+			monitor.watch(conn)
+		else:
+			close_connection(conn)
+
+
+def start_handlers():
+	"""Start the fixed handler pool and the idle connection monitor"""
+	threads = [threading.Thread(target=handler_worker) for i in range(HANDLER_THREADS)]
+	threads.append(threading.Thread(target=monitor.run))
+	for thread in threads:
+		thread.daemon = True
+		thread.start()
+
+
+def accept_loop(server_socket):
+	"""
+	Accept connections and queue them for the handler pool
+	A new connection usually has its first request on the way, so it goes
+	straight to the ready queue rather than through the monitor.
+	server_socket: bound, listening socket
+	"""
+	while True:
+		try:
+			client_socket, client_address = server_socket.accept()
+			client_socket.settimeout(READ_TIMEOUT)
+			protocol.set_nodelay(client_socket)
+			with load_lock:
+				load["connections"] += 1
+			ready_connections.put(Connection(client_socket))
+		except Exception as e:
+			print("Connection error: " + str(e))
+			continue
+
+
+def remove_stale_socket(path):
+	"""
+	Remove a socket file left behind by a listener that is no longer running
+	Anything else at the path, or a socket another listener still accepts
+	on, is left alone.
+	path: filesystem path for the socket
+	"""
+	try:
+		mode = os.lstat(path).st_mode
+	except FileNotFoundError:
+		return
+	if not stat.S_ISSOCK(mode):
+		raise OSError("Not a socket, refusing to replace: " + path)
+	probe = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+	try:
+		probe.connect(path)
+	except ConnectionRefusedError:
+		os.unlink(path)
+		return
+	finally:
+		probe.close()
+	raise OSError("Another listener is already serving " + path)
+
+
+def open_unix_listener(path):
+	"""
+	Bind a Unix domain socket listener, replacing a stale socket file
+	path: filesystem path for the socket
+	return: listening socket
+	"""
+	remove_stale_socket(path)
+	server_socket = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+	server_socket.bind(path)
+	os.chmod(path, 0o600)
+	server_socket.listen(LISTEN_BACKLOG)
+	return server_socket
+
+
+def unix_server(path):
+	"""Serve the Unix domain socket listener next to TCP"""
+	server_socket = None
+	try:
+		server_socket = open_unix_listener(path)
+		print("Unix socket active on " + path)
+		accept_loop(server_socket)
+	except Exception as e:
+		print("Failed to start Unix socket listener: " + str(e))
+	finally:
+		if server_socket:
+			try:
+				server_socket.close()
+				os.unlink(path)
+			except:
+				pass
+
 
 def socket_server():
 	"""Main socket server loop"""
@@ -274,26 +1106,27 @@ def socket_server():
 		server_socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
 		server_socket.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
 		server_socket.bind((SERVER_HOST, SERVER_PORT))
-		server_socket.listen(5)
+		server_socket.listen(LISTEN_BACKLOG)
 
 		print("=" * 60)
 		print("RhinoMCP Listener")
 		print("=" * 60)
 		print("Active on " + SERVER_HOST + ":" + str(SERVER_PORT))
-		print("135+ commands available")
-		print("JSON protocol")
+		print(str(len(registry.COMMANDS)) + " commands available")
+		print("Framed JSON protocol with keep-alive (legacy raw JSON accepted)")
+		print(str(HANDLER_THREADS) + " handler threads, queue depth " + str(MAX_PENDING_COMMANDS))
 		print("Ready to receive commands")
 		print("=" * 60)
 
-		while True:
-			try:
-				client_socket, client_address = server_socket.accept()
-				client_thread = threading.Thread(target=handle_client, args=(client_socket,))
-				client_thread.daemon = True
-				client_thread.start()
-			except Exception as e:
-				print("Connection error: " + str(e))
-				continue
+		start_handlers()
+
+		unix_path = protocol.unix_socket_path()
+		if unix_path:
+			unix_thread = threading.Thread(target=unix_server, args=(unix_path,))
+			unix_thread.daemon = True
+			unix_thread.start()
+
+		accept_loop(server_socket)
 
 	except Exception as e:
 		print("Failed to start listener: " + str(e))
@@ -314,10 +1147,20 @@ print("RhinoMCP Listener")
 print("=" * 60)
 print("Starting background listener thread...")
 
+scene.install()
+for event in TRANSACTION_CHANGE_EVENTS:
+	events.subscribe(event, note_transaction_change)
+spatial.install()
+layer.install_table()
+cache.install()
+events.install()
+print("Scene index: " + str(len(scene.entries)) + " objects")
+
+monitor = ConnectionMonitor()
 listener_thread = threading.Thread(target=socket_server)
 listener_thread.daemon = True
 listener_thread.start()
 
 print("Listener started successfully")
-print("135+ commands ready")
+print(str(len(registry.COMMANDS)) + " commands ready")
 print("=" * 60)
@@ -9,9 +9,12 @@ import json
 import time
 import base64
 
+import protocol
+
 RHINO_HOST = "localhost"
 RHINO_PORT = 54321
 TEST_DELAY = 0.3
+TRANSPORT_ROUND_TRIPS = 200
 
 test_results = {
 	"passed": [],
@@ -103,6 +106,275 @@ def test_command(name, command_type, params=None, expect_error=False, store_id=N
 			return response
 
 
+def time_round_trips(sock, count):
+	"""Average seconds per framed round trip over one keep-alive connection"""
+	command = {"type": "measure_distance", "params": {"point1": [0, 0, 0], "point2": [1, 1, 1]}}
+	start = time.perf_counter()
+	for i in range(count):
+		sock.sendall(protocol.encode_message(command))
+		response = protocol.recv_frame(sock)
+		if response is None or response.get("status") != "success":
+			raise RuntimeError("Round trip failed: " + str(response))
+	return (time.perf_counter() - start) / count
+
+
+def benchmark_transport(name, family, address):
+	"""Time framed round trips on one transport and record it as a test"""
+	try:
+		sock = socket.socket(family, socket.SOCK_STREAM)
+		sock.settimeout(10)
+		try:
+			sock.connect(address)
+			protocol.set_nodelay(sock)
+			elapsed = time_round_trips(sock, TRANSPORT_ROUND_TRIPS)
+		finally:
+			sock.close()
+	except Exception as e:
+		test_results["failed"].append({"name": name, "error": str(e)})
+		print(f"  FAIL: {name} - {e}")
+		return None
+	test_results["passed"].append(name)
+	print(f"  PASS: {name} - {elapsed * 1000000:.0f} us per round trip")
+	return elapsed
+
+
+def test_stream(name, command_type):
+	"""Request a streamed listing and check the record count matches the trailer"""
+	time.sleep(TEST_DELAY)
+	try:
+		sock = socket.create_connection((RHINO_HOST, RHINO_PORT), timeout=10)
+		try:
+			request = {"type": command_type, "params": {}, "stream": True}
+			sock.sendall(protocol.encode_message(request))
+			records = 0
+			while True:
+				flags, payload = protocol.recv_payload(sock)
+				if not flags & protocol.FLAG_STREAM:
+					break
+				records += len(protocol.decode_records(payload))
+			trailer = protocol.decode_payload(flags, payload)
+		finally:
+			sock.close()
+		if trailer.get("status") != "success":
+			raise RuntimeError(trailer.get("message", "Unknown error"))
+		expected = trailer["result"].get("count")
+		if expected != records:
+			raise RuntimeError(f"Received {records} records, trailer says {expected}")
+	except Exception as e:
+		test_results["failed"].append({"name": name, "error": str(e)})
+		print(f"  FAIL: {name} - {e}")
+		return
+	test_results["passed"].append(name)
+	print(f"  PASS: {name} - {records} records")
+
+
+def test_spatial(name, command_type, params, expected, ordered=True):
+	"""
+	Run a spatial query and check it returns exactly the expected ids
+	expected: ids in the order they must come back (nearest first)
+	ordered: False if the query returns ids in no particular order
+	"""
+	time.sleep(TEST_DELAY)
+	response = send_command(command_type, params) or {}
+	result = response.get("result", {})
+	hits = result.get("objects", [])
+	ids = [hit["id"] for hit in hits] if "objects" in result else result.get("ids", [])
+	distances = [hit["distance"] for hit in hits]
+	if response.get("status") != "success":
+		error = response.get("message", "Unknown error")
+	elif (ids if ordered else sorted(ids)) != (expected if ordered else sorted(expected)):
+		error = f"returned {ids}, expected {expected}"
+	elif distances != sorted(distances):
+		error = f"not nearest first: {distances}"
+	else:
+		test_results["passed"].append(name)
+		print(f"  PASS: {name}")
+		return
+	test_results["failed"].append({"name": name, "error": error})
+	print(f"  FAIL: {name} - {error}")
+
+
+def test_pipelined_query(name):
+	"""Pipeline a create and a spatial query on one connection and check the query finds it"""
+	time.sleep(TEST_DELAY)
+	create = {"id": 1, "type": "create_sphere", "params": {"center": [300, 300, 0], "radius": 1}}
+	query = {"id": 2, "type": "objects_in_sphere", "params": {"center": [300, 300, 0], "radius": 2}}
+	try:
+		sock = socket.create_connection((RHINO_HOST, RHINO_PORT), timeout=10)
+		try:
+			sock.sendall(protocol.encode_message(create) + protocol.encode_message(query))
+			created = protocol.recv_frame(sock) or {}
+			found = protocol.recv_frame(sock) or {}
+		finally:
+			sock.close()
+		new_id = created.get("result", {}).get("id")
+		ids = [hit["id"] for hit in found.get("result", {}).get("objects", [])]
+		if new_id is None or new_id not in ids:
+			error = created.get("message") or found.get("message")
+			raise RuntimeError(error or f"query returned {ids}, not the new sphere {new_id}")
+	except Exception as e:
+		test_results["failed"].append({"name": name, "error": str(e)})
+		print(f"  FAIL: {name} - {e}")
+		return
+	test_results["passed"].append(name)
+	print(f"  PASS: {name}")
+
+
+def test_bulk(name, command_type, params, total, failed=0):
+	"""Run a bulk creator and check its count, failed count and ids add up to the input"""
+	time.sleep(TEST_DELAY)
+	response = send_command(command_type, params) or {}
+	result = response.get("result", {})
+	count = result.get("count")
+	ids = result.get("ids", [])
+	if response.get("status") != "success":
+		error = response.get("message", "Unknown error")
+	elif count != total - failed or result.get("failed") != failed or len(ids) != count:
+		error = f"count {count}, failed {result.get('failed')}, {len(ids)} ids for {total} items"
+		error += f", expected {failed} failed"
+	else:
+		test_results["passed"].append(name)
+		print(f"  PASS: {name} - {count} created")
+		return
+	test_results["failed"].append({"name": name, "error": error})
+	print(f"  FAIL: {name} - {error}")
+
+
+def test_scene_index(name):
+	"""Check the event-maintained scene index matches a full rescan"""
+	time.sleep(TEST_DELAY)
+	response = send_command("check_scene_index")
+	result = response.get("result", {})
+	if response.get("status") != "success" or not result.get("consistent"):
+		counts = f"{result.get('missing')} missing, {result.get('stale')} stale, "
+		counts += f"{result.get('changed')} changed"
+		error = response.get("message") or counts
+		test_results["failed"].append({"name": name, "error": error})
+		print(f"  FAIL: {name} - {error}")
+		return
+	test_results["passed"].append(name)
+	print(f"  PASS: {name} - {result.get('indexed')} objects")
+
+
+def test_layer_snapshot(name, layer_name, expected):
+	"""Check list_layers reports a layer with the expected properties"""
+	time.sleep(TEST_DELAY)
+	response = send_command("list_layers") or {}
+	layers = response.get("result", {}).get("layers", [])
+	record = next((lyr for lyr in layers if lyr.get("name") == layer_name), None)
+	wrong = [key for key, value in expected.items() if record is None or record.get(key) != value]
+	if response.get("status") != "success" or wrong:
+		problem = f"{layer_name} not listed" if record is None else "wrong " + ", ".join(wrong)
+		error = response.get("message") or problem
+		test_results["failed"].append({"name": name, "error": error})
+		print(f"  FAIL: {name} - {error}")
+		return
+	test_results["passed"].append(name)
+	print(f"  PASS: {name}")
+
+
+def test_paging(name, command_type, key, limit):
+	"""
+	Walk a listing page by page and check the pages are disjoint, end with a
+	next_cursor of None and together match the unpaged listing
+	"""
+	time.sleep(TEST_DELAY)
+
+	def names(response):
+		items = response.get("result", {}).get(key, [])
+		return [item["name"] if isinstance(item, dict) else item for item in items]
+
+	full = send_command(command_type) or {}
+	expected = names(full)
+	error = full.get("message")
+	seen = []
+	params = {"limit": limit}
+	pages = 0
+	while error is None:
+		page = send_command(command_type, params) or {}
+		items = names(page)
+		pages += 1
+		if page.get("status") != "success":
+			error = page.get("message", "Unknown error")
+		elif len(items) > limit or set(items) & set(seen):
+			error = f"page {pages} {items} overlaps earlier pages or exceeds the limit"
+		elif page["result"].get("next_cursor") is None:
+			seen.extend(items)
+			break
+		elif pages > len(expected):
+			error = "next_cursor is never None"
+		seen.extend(items)
+		params = {"limit": limit, "cursor": page["result"]["next_cursor"]}
+	if error is None and seen != expected:
+		error = f"pages list {seen}, the full listing {expected}"
+	if error is None and pages < 2:
+		error = f"only {len(expected)} items, nothing to page"
+	if error is not None:
+		test_results["failed"].append({"name": name, "error": error})
+		print(f"  FAIL: {name} - {error}")
+		return
+	test_results["passed"].append(name)
+	print(f"  PASS: {name} - {pages} pages")
+
+
+def test_empty_rollback(name):
+	"""Roll back a transaction whose only mutating command failed and check nothing was undone"""
+	time.sleep(TEST_DELAY)
+	send_command("begin_transaction", {"name": "failed mutation"})
+	send_command("delete_layer", {"name": "NoSuchLayer_xyz"})
+	response = send_command("rollback_transaction") or {}
+	result = response.get("result", {})
+	if response.get("status") != "success" or result.get("undone") is not False:
+		error = response.get("message") or "undo ran for a transaction without changes"
+		test_results["failed"].append({"name": name, "error": error})
+		print(f"  FAIL: {name} - {error}")
+		return
+	test_results["passed"].append(name)
+	print(f"  PASS: {name}")
+
+
+def test_rolled_back(name, command_type, params, flag, created=None):
+	"""
+	Run a rollback, check its result sets flag and the object it should remove is gone
+	created: id of the object the rollback must remove (default: the first batch item's)
+	"""
+	time.sleep(TEST_DELAY)
+	response = send_command(command_type, params) or {}
+	result = response.get("result", {})
+	if created is None:
+		created = (result.get("results") or [{}])[0].get("result", {}).get("id")
+	lookup = send_command("get_user_text", {"object_id": created}) if created else {}
+	if response.get("status") != "success":
+		error = response.get("message", "Unknown error")
+	elif result.get(flag) is not True:
+		error = f"{flag} is {result.get(flag)}"
+	elif created is None or lookup.get("status") != "error":
+		error = f"created object {created} still exists"
+	else:
+		test_results["passed"].append(name)
+		print(f"  PASS: {name}")
+		return
+	test_results["failed"].append({"name": name, "error": error})
+	print(f"  FAIL: {name} - {error}")
+
+
+def test_cached(name, command_type, params=None, hit=True):
+	"""Run a command and check whether the listener answered it from the result cache"""
+	time.sleep(TEST_DELAY)
+	before = (send_command("listener_status") or {}).get("result", {}).get("result_cache", {})
+	response = send_command(command_type, params) or {}
+	after = (send_command("listener_status") or {}).get("result", {}).get("result_cache", {})
+	hits = after.get("hits", 0) - before.get("hits", 0)
+	if response.get("status") != "success" or hits != (1 if hit else 0):
+		expected = "hit" if hit else "miss"
+		error = response.get("message") or f"expected a cache {expected}, got {hits} hits"
+		test_results["failed"].append({"name": name, "error": error})
+		print(f"  FAIL: {name} - {error}")
+		return
+	test_results["passed"].append(name)
+	print(f"  PASS: {name} - {response.get('result')}")
+
+
 def cleanup():
 	"""Clean up: select all, delete all"""
 	send_command("select_all")
@@ -145,11 +417,13 @@ def run_tests():
 		print("-" * 70)
 
 	# ================================================================
-	# SCENE UNDERSTANDING (2 tests)
+	# SCENE UNDERSTANDING (3 tests)
 	# ================================================================
-	header("SCENE UNDERSTANDING", 2)
+	header("SCENE UNDERSTANDING", 3)
 	test_command("get_scene_info", "get_scene_info")
 	test_command("get_selected_objects", "get_selected_objects")
+	test_command("get_selected_objects_page", "get_selected_objects",
+		{"fields": ["type", "layer"], "limit": 10})
 
 	# ================================================================
 	# BASIC GEOMETRY (7 tests)
@@ -174,9 +448,26 @@ def run_tests():
 	test_command("create_torus", "create_torus", {"center": [70, 10, 5], "major_radius": 8, "minor_radius": 2})
 
 	# ================================================================
-	# TRANSFORMATIONS (8 tests)
+	# BULK CREATION (6 tests)
 	# ================================================================
-	header("TRANSFORMATIONS", 8)
+	header("BULK CREATION", 6)
+	grid = [[x * 2, y * 2, 40] for x in range(10) for y in range(10)]
+	test_bulk("create_points", "create_points", {"points": grid}, len(grid))
+	test_bulk("create_lines", "create_lines",
+		{"starts": grid, "ends": [[x, y, z + 1] for x, y, z in grid]}, len(grid))
+	test_bulk("create_circles", "create_circles", {"centers": grid, "radii": 0.5}, len(grid))
+	test_bulk("create_spheres", "create_spheres",
+		{"centers": grid, "radii": [0.2 + i * 0.005 for i in range(len(grid))]}, len(grid))
+	heights = [1 + i % 3 for i in range(len(grid))]
+	test_bulk("create_boxes", "create_boxes",
+		{"corners": grid, "widths": 1, "depths": 1, "heights": heights}, len(grid))
+	test_bulk("create_boxes_degenerate", "create_boxes",
+		{"corners": grid[:3], "widths": 1, "depths": 1, "heights": [1, 0, 1]}, 3, failed=1)
+
+	# ================================================================
+	# TRANSFORMATIONS (11 tests)
+	# ================================================================
+	header("TRANSFORMATIONS", 11)
 	cleanup()
 	send_command("create_box", {"width": 5, "depth": 5, "height": 5, "x": 0, "y": 50, "z": 0})
 	time.sleep(TEST_DELAY)
@@ -190,8 +481,16 @@ def run_tests():
 	test_command("copy_objects", "copy_objects", {"displacement": [10, 0, 0]})
 	test_command("array_linear", "array_linear", {"displacement": [5, 0, 0], "count": 3})
 	test_command("array_polar", "array_polar", {"center": [0, 50, 0], "count": 4, "angle": 360})
+	test_command("array_polar_blocks", "array_polar",
+		{"center": [0, 50, 0], "count": 4, "angle": 90, "as_blocks": True})
 	test_command("orient_objects", "orient_objects", {"reference": [0, 0, 0], "target": [10, 0, 0]})
+	test_command("transform_objects", "transform_objects",
+		{"matrix": [[1, 0, 0, 0], [0, 1, 0, 5], [0, 0, 1, 0], [0, 0, 0, 1]]})
 	send_command("unselect_all")
+	box = send_command("create_box", {"width": 2, "depth": 2, "height": 2, "x": 0, "y": 70, "z": 0})
+	box_id = box.get("result", {}).get("id")
+	test_command("move_objects_by_id", "move_objects",
+		{"displacement": [0, 0, 5], "object_ids": [box_id]})
 
 	# ================================================================
 	# BOOLEAN OPERATIONS (3 tests)
@@ -898,17 +1197,20 @@ def run_tests():
 	send_command("unselect_all")
 
 	# ================================================================
-	# LAYER MANAGEMENT (6 tests)
+	# LAYER MANAGEMENT (8 tests)
 	# ================================================================
-	header("LAYER MANAGEMENT", 6)
+	header("LAYER MANAGEMENT", 8)
 	test_command("create_layer", "create_layer", {"name": "TestLayer1", "color": [255, 0, 0]})
 	test_command("create_layer", "create_layer", {"name": "TestLayer2", "color": [0, 255, 0]})
 	test_command("set_current_layer", "set_current_layer", {"name": "TestLayer1"})
 	test_command("set_layer_color", "set_layer_color", {"name": "TestLayer1", "color": [255, 255, 0]})
+	test_layer_snapshot("list_layers_after_change", "TestLayer1",
+		{"color": [255, 255, 0], "current": True})
 	test_command("set_layer_visibility", "set_layer_visibility", {"name": "TestLayer1", "visible": False})
 	time.sleep(TEST_DELAY)
 	send_command("set_layer_visibility", {"name": "TestLayer1", "visible": True})
 	test_command("list_layers", "list_layers")
+	test_paging("list_layers_page", "list_layers", "layers", 1)
 	# Reset to default
 	send_command("set_current_layer", {"name": "Default"})
 
@@ -1028,6 +1330,118 @@ def run_tests():
 	header("CODE EXECUTION", 1)
 	test_command("execute_python_code", "execute_python_code", {"code": "print('Hello from RhinoMCP test')"})
 
+	# ================================================================
+	# BATCHING (2 tests)
+	# ================================================================
+	header("BATCHING", 2)
+	test_command("batch", "batch", {"commands": [
+		{"type": "create_point", "params": {"x": 0, "y": 0, "z": 0}},
+		{"type": "create_point", "params": {"x": 1, "y": 0, "z": 0}}
+	]})
+	test_command("batch_continue_on_error", "batch", {"stop_on_error": False, "commands": [
+		{"type": "invalid_command_xyz", "params": {}},
+		{"type": "create_point", "params": {"x": 2, "y": 0, "z": 0}}
+	]})
+
+	# ================================================================
+	# TRANSPORT (2 tests)
+	# ================================================================
+	header("TRANSPORT", 2)
+	tcp_time = benchmark_transport("transport_tcp", socket.AF_INET, (RHINO_HOST, RHINO_PORT))
+	unix_path = protocol.unix_socket_path()
+	if unix_path:
+		unix_time = benchmark_transport("transport_unix", socket.AF_UNIX, unix_path)
+		if tcp_time and unix_time:
+			print(f"  AF_UNIX round trip is {tcp_time / unix_time:.2f}x faster than TCP")
+	else:
+		print(f"  SKIP: transport_unix - set {protocol.SOCKET_PATH_ENV} for Rhino and this shell")
+
+	# ================================================================
+	# STREAMING (2 tests)
+	# ================================================================
+	header("STREAMING", 2)
+	test_stream("stream_scene_objects", "get_scene_info")
+	test_stream("stream_layers", "list_layers")
+
+	# ================================================================
+	# LISTENER (2 tests)
+	# ================================================================
+	header("LISTENER", 2)
+	test_command("listener_status", "listener_status")
+	test_command("list_commands", "list_commands")
+
+	# ================================================================
+	# JOBS (3 tests)
+	# ================================================================
+	header("JOBS", 3)
+	response = test_command("submit_job", "submit_job", {"type": "get_document_info"})
+	job_id = response.get("result", {}).get("job_id") if response else None
+	test_command("job_status", "job_status", {"job_id": job_id})
+	test_command("job_result", "job_result", {"job_id": job_id})
+
+	# ================================================================
+	# SCENE INDEX (3 tests)
+	# ================================================================
+	header("SCENE INDEX", 3)
+	test_scene_index("scene_index_after_tests")
+	send_command("begin_transaction", {"name": "scene index"})
+	send_command("create_points", {"points": [[i, 0, 60] for i in range(50)]})
+	send_command("rollback_transaction")
+	send_command("select_by_type", {"type": "point"})
+	send_command("delete_selected")
+	test_scene_index("scene_index_after_delete")
+	test_command("get_scene_info_indexed", "get_scene_info")
+
+	# ================================================================
+	# SPATIAL QUERIES (5 tests)
+	# ================================================================
+	header("SPATIAL QUERIES", 5)
+	cleanup()
+	# Unit spheres centered at x = 100, 103, ..., 127
+	spheres = send_command("create_spheres",
+		{"centers": [[100 + i * 3, 100, 0] for i in range(10)], "radii": 1})
+	ids = spheres.get("result", {}).get("ids", [])
+	box = {"min": [99, 99, -1], "max": [109.5, 101, 1]}
+	test_spatial("objects_in_box", "objects_in_box", box, ids[:4], ordered=False)
+	test_spatial("objects_in_box_contained", "objects_in_box", dict(box, contained=True),
+		ids[:3], ordered=False)
+	test_spatial("objects_in_sphere", "objects_in_sphere",
+		{"center": [100, 100, 0], "radius": 6}, ids[:3])
+	test_spatial("nearest_objects", "nearest_objects",
+		{"point": [115.5, 100, 0], "count": 3}, [ids[5], ids[6], ids[4]])
+	test_pipelined_query("objects_in_sphere_pipelined")
+
+	# ================================================================
+	# TRANSACTIONS (5 tests)
+	# ================================================================
+	header("TRANSACTIONS", 5)
+	test_command("begin_transaction", "begin_transaction", {"name": "test transaction"})
+	send_command("create_point", {"x": 3, "y": 0, "z": 0})
+	test_command("commit_transaction", "commit_transaction")
+	send_command("begin_transaction", {"name": "test rollback"})
+	point = send_command("create_point", {"x": 4, "y": 0, "z": 0}).get("result", {})
+	test_rolled_back("rollback_transaction", "rollback_transaction", None, "undone",
+		point.get("id"))
+	test_empty_rollback("rollback_failed_mutation")
+	test_rolled_back("batch_atomic_rollback", "batch", {"atomic": True, "commands": [
+		{"type": "create_point", "params": {"x": 5, "y": 0, "z": 0}},
+		{"type": "invalid_command_xyz", "params": {}}
+	]}, "rolled_back")
+
+	# ================================================================
+	# RESULT CACHE (3 tests)
+	# ================================================================
+	header("RESULT CACHE", 3)
+	cleanup()
+	send_command("create_box", {"width": 10, "depth": 10, "height": 10, "x": 0, "y": 0, "z": 0})
+	send_command("select_all")
+	send_command("measure_volume")
+	test_cached("measure_volume_cached", "measure_volume")
+	send_command("scale_objects", {"center": [0, 0, 0], "scale": 2})
+	test_cached("measure_volume_after_scale", "measure_volume", hit=False)
+	test_command("flush_result_cache", "flush_result_cache")
+	send_command("unselect_all")
+
 	# ================================================================
 	# ERROR HANDLING (1 test)
 	# ================================================================
@@ -2,14 +2,14 @@
 MCP tools for annotation operations
 """
 
-from .utils import send_to_rhino
+from .utils import send_to_rhino_async
 
 
 def register_tools(mcp):
 	"""Register all annotation tools with the MCP server"""
 
 	@mcp.tool()
-	def add_text(text: str, point_x: float, point_y: float, point_z: float,
+	async def add_text(text: str, point_x: float, point_y: float, point_z: float,
 				 height: float = 1.0, font: str = "") -> str:
 		"""
 		Add a text object in Rhino
@@ -26,13 +26,13 @@ def register_tools(mcp):
 			}
 			if font:
 				params["font"] = font
-			result = send_to_rhino("add_text", params)
+			result = await send_to_rhino_async("add_text", params)
 			return f"Added text '{text}' at ({point_x}, {point_y}, {point_z})"
 		except Exception as e:
 			return f"Error: {e}"
 
 	@mcp.tool()
-	def add_text_dot(text: str, point_x: float, point_y: float, point_z: float) -> str:
+	async def add_text_dot(text: str, point_x: float, point_y: float, point_z: float) -> str:
 		"""
 		Add a text dot (always faces camera, constant screen size)
 		text: The text to display in the dot
@@ -40,13 +40,13 @@ def register_tools(mcp):
 		"""
 		try:
 			params = {"text": text, "point": [point_x, point_y, point_z]}
-			result = send_to_rhino("add_text_dot", params)
+			result = await send_to_rhino_async("add_text_dot", params)
 			return f"Added text dot '{text}'"
 		except Exception as e:
 			return f"Error: {e}"
 
 	@mcp.tool()
-	def add_leader(points: str, text: str = "") -> str:
+	async def add_leader(points: str, text: str = "") -> str:
 		"""
 		Add a leader annotation (arrow with optional text)
 		points: Semicolon-separated points, each as 'x,y,z' (min 2 points, e.g. '0,0,0;10,10,0')
@@ -57,7 +57,7 @@ def register_tools(mcp):
 			params = {"points": pts}
 			if text:
 				params["text"] = text
-			result = send_to_rhino("add_leader", params)
+			result = await send_to_rhino_async("add_leader", params)
 			return f"Added leader annotation"
 		except Exception as e:
 			return f"Error: {e}"
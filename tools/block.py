@@ -3,14 +3,14 @@ MCP tools for block (instance definition) operations
 """
 
 import json
-from .utils import send_to_rhino
+from .utils import send_to_rhino_async, list_from_rhino_async
 
 
 def register_tools(mcp):
 	"""Register all block tools with the MCP server"""
 
 	@mcp.tool()
-	def create_block(object_ids: str, base_x: float, base_y: float, base_z: float,
+	async def create_block(object_ids: str, base_x: float, base_y: float, base_z: float,
 					 block_name: str) -> str:
 		"""
 		Create a block definition from objects
@@ -25,13 +25,13 @@ def register_tools(mcp):
 				"base_point": [base_x, base_y, base_z],
 				"name": block_name
 			}
-			send_to_rhino("create_block", params)
+			await send_to_rhino_async("create_block", params)
 			return f"Created block '{block_name}'"
 		except Exception as e:
 			return f"Error: {e}"
 
 	@mcp.tool()
-	def insert_block(block_name: str, x: float, y: float, z: float,
+	async def insert_block(block_name: str, x: float, y: float, z: float,
 					 scale: float = 1.0, rotation: float = 0) -> str:
 		"""
 		Insert a block instance into the document
@@ -47,43 +47,51 @@ def register_tools(mcp):
 				"scale": [scale, scale, scale],
 				"rotation": rotation
 			}
-			result = send_to_rhino("insert_block", params)
+			result = await send_to_rhino_async("insert_block", params)
 			return f"Inserted block '{block_name}' at ({x}, {y}, {z})"
 		except Exception as e:
 			return f"Error: {e}"
 
 	@mcp.tool()
-	def explode_block(block_id: str) -> str:
+	async def explode_block(block_id: str) -> str:
 		"""
 		Explode a block instance into individual objects
 		block_id: ID of the block instance to explode
 		"""
 		try:
-			result = send_to_rhino("explode_block", {"block_id": block_id})
+			result = await send_to_rhino_async("explode_block", {"block_id": block_id})
 			count = result.get("count", 0)
 			return f"Exploded block into {count} objects"
 		except Exception as e:
 			return f"Error: {e}"
 
 	@mcp.tool()
-	def delete_block(block_name: str) -> str:
+	async def delete_block(block_name: str) -> str:
 		"""
 		Delete a block definition
 		block_name: Name of the block definition to delete
 		"""
 		try:
-			send_to_rhino("delete_block", {"name": block_name})
+			await send_to_rhino_async("delete_block", {"name": block_name})
 			return f"Deleted block '{block_name}'"
 		except Exception as e:
 			return f"Error: {e}"
 
 	@mcp.tool()
-	def list_blocks() -> str:
+	async def list_blocks(limit: int = 0, cursor: str = "") -> str:
 		"""
-		List all block definitions in the document
+		List all block definitions in the document, ordered by name
+		limit: Maximum number of blocks to return (default 0 = all)
+		cursor: next_cursor from the previous page, to continue a paged listing
 		"""
 		try:
-			result = send_to_rhino("list_blocks")
+			params = {}
+			if limit > 0:
+				params["limit"] = limit
+			if cursor:
+				params["cursor"] = cursor
+			result = await list_from_rhino_async("list_blocks", "blocks", params,
+				lambda record: record["name"])
 			return json.dumps(result, indent=2)
 		except Exception as e:
 			return f"Error: {e}"
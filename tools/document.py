@@ -3,56 +3,66 @@ MCP tools for document/scene operations
 """
 
 import json
-from .utils import send_to_rhino
+from .utils import send_to_rhino_async, list_from_rhino_async
 
 
 def register_tools(mcp):
 	"""Register all document tools with the MCP server"""
 
 	@mcp.tool()
-	def get_scene_info() -> str:
+	async def get_scene_info() -> str:
 		"""
 		Get comprehensive information about the current Rhino scene.
 		Returns details about all objects, layers, units, and object counts.
 		This should be called first to understand what's already in the scene.
 		"""
 		try:
-			result = send_to_rhino("get_scene_info")
+			result = await send_to_rhino_async("get_scene_info")
 			return json.dumps(result, indent=2)
 		except Exception as e:
 			return f"Error: {e}"
 
 	@mcp.tool()
-	def get_selected_objects() -> str:
+	async def get_selected_objects(fields: str = "", limit: int = 0, cursor: int = -1) -> str:
 		"""
 		Get information about currently selected objects in Rhino.
 		Returns details about each selected object including type, layer, and location.
+		fields: Comma-separated subset of type, layer, name, bounding_box (default all)
+		limit: Maximum number of objects to return (default 0 = all)
+		cursor: next_cursor from the previous page, to continue a paged listing
 		"""
 		try:
-			result = send_to_rhino("get_selected_objects")
+			params = {}
+			if fields:
+				params["fields"] = [f.strip() for f in fields.split(",") if f.strip()]
+			if limit > 0:
+				params["limit"] = limit
+			if cursor >= 0:
+				params["cursor"] = cursor
+			result = await list_from_rhino_async("get_selected_objects", "objects", params)
 			return json.dumps(result, indent=2)
 		except Exception as e:
 			return f"Error: {e}"
 
 	@mcp.tool()
-	def get_document_info() -> str:
+	async def get_document_info() -> str:
 		"""
 		Get document information including name, path, and units
 		"""
 		try:
-			result = send_to_rhino("get_document_info")
+			result = await send_to_rhino_async("get_document_info")
 			return json.dumps(result, indent=2)
 		except Exception as e:
 			return f"Error: {e}"
 
 	@mcp.tool()
-	def set_unit_system(unit_system: int) -> str:
+	async def set_unit_system(unit_system: int) -> str:
 		"""
 		Set the document unit system
 		unit_system: Unit system number (0=None, 1=Microns, 2=Millimeters, 3=Centimeters, 4=Meters, 8=Inches, 9=Feet)
 		"""
 		try:
-			send_to_rhino("set_unit_system", {"system": unit_system})
+			await send_to_rhino_async("set_unit_system", {"system": unit_system})
 			unit_names = {0: "None", 1: "Microns", 2: "Millimeters", 3: "Centimeters", 4: "Meters", 8: "Inches", 9: "Feet"}
 			name = unit_names.get(unit_system, str(unit_system))
 			return f"Set unit system to {name}"
@@ -60,13 +70,13 @@ def register_tools(mcp):
 			return f"Error: {e}"
 
 	@mcp.tool()
-	def enable_redraw(enable: bool = True) -> str:
+	async def enable_redraw(enable: bool = True) -> str:
 		"""
 		Enable or disable viewport redraw (disable for batch operations)
 		enable: True to enable redraw, False to disable
 		"""
 		try:
-			send_to_rhino("enable_redraw", {"enable": enable})
+			await send_to_rhino_async("enable_redraw", {"enable": enable})
 			return f"Redraw {'enabled' if enable else 'disabled'}"
 		except Exception as e:
 			return f"Error: {e}"
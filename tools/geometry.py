@@ -2,14 +2,14 @@
 MCP tools for basic geometry creation
 """
 
-from .utils import send_to_rhino
+from .utils import send_to_rhino_async, pack_points, pack_values
 
 
 def register_tools(mcp):
 	"""Register all geometry tools with the MCP server"""
 
 	@mcp.tool()
-	def create_point(x: float, y: float, z: float = 0) -> str:
+	async def create_point(x: float, y: float, z: float = 0) -> str:
 		"""
 		Create a point in Rhino
 		x: X coordinate
@@ -17,13 +17,13 @@ def register_tools(mcp):
 		z: Z coordinate (default 0)
 		"""
 		try:
-			send_to_rhino("create_point", {"x": x, "y": y, "z": z})
+			await send_to_rhino_async("create_point", {"x": x, "y": y, "z": z})
 			return f"Created point at ({x}, {y}, {z})"
 		except Exception as e:
 			return f"Error: {e}"
 
 	@mcp.tool()
-	def create_line(start_x: float, start_y: float, start_z: float,
+	async def create_line(start_x: float, start_y: float, start_z: float,
 					end_x: float, end_y: float, end_z: float) -> str:
 		"""
 		Create a line in Rhino between two points
@@ -35,13 +35,14 @@ def register_tools(mcp):
 				"start": [start_x, start_y, start_z],
 				"end": [end_x, end_y, end_z]
 			}
-			send_to_rhino("create_line", params)
+			await send_to_rhino_async("create_line", params)
 			return f"Created line from ({start_x}, {start_y}, {start_z}) to ({end_x}, {end_y}, {end_z})"
 		except Exception as e:
 			return f"Error: {e}"
 
 	@mcp.tool()
-	def create_circle(center_x: float, center_y: float, center_z: float, radius: float) -> str:
+	async def create_circle(center_x: float, center_y: float, center_z: float,
+						radius: float) -> str:
 		"""
 		Create a circle in Rhino
 		center_x, center_y, center_z: Center point coordinates
@@ -52,13 +53,13 @@ def register_tools(mcp):
 				"center": [center_x, center_y, center_z],
 				"radius": radius
 			}
-			send_to_rhino("create_circle", params)
+			await send_to_rhino_async("create_circle", params)
 			return f"Created circle with radius {radius} at ({center_x}, {center_y}, {center_z})"
 		except Exception as e:
 			return f"Error: {e}"
 
 	@mcp.tool()
-	def create_arc(center_x: float, center_y: float, center_z: float,
+	async def create_arc(center_x: float, center_y: float, center_z: float,
 				   radius: float, start_angle: float, end_angle: float) -> str:
 		"""
 		Create an arc in Rhino
@@ -74,13 +75,13 @@ def register_tools(mcp):
 				"start_angle": start_angle,
 				"end_angle": end_angle
 			}
-			send_to_rhino("create_arc", params)
+			await send_to_rhino_async("create_arc", params)
 			return f"Created arc with radius {radius} from {start_angle} to {end_angle} degrees"
 		except Exception as e:
 			return f"Error: {e}"
 
 	@mcp.tool()
-	def create_ellipse(center_x: float, center_y: float, center_z: float,
+	async def create_ellipse(center_x: float, center_y: float, center_z: float,
 					   x_radius: float, y_radius: float) -> str:
 		"""
 		Create an ellipse in Rhino
@@ -94,33 +95,77 @@ def register_tools(mcp):
 				"x_radius": x_radius,
 				"y_radius": y_radius
 			}
-			send_to_rhino("create_ellipse", params)
+			await send_to_rhino_async("create_ellipse", params)
 			return f"Created ellipse with radii {x_radius}x{y_radius}"
 		except Exception as e:
 			return f"Error: {e}"
 
 	@mcp.tool()
-	def create_polyline(points: list[list[float]]) -> str:
+	async def create_polyline(points: list[list[float]]) -> str:
 		"""
 		Create a polyline through multiple points
 		points: List of points, each point is [x, y, z]
 		Example: [[0,0,0], [10,0,0], [10,10,0], [0,10,0]]
 		"""
 		try:
-			send_to_rhino("create_polyline", {"points": points})
+			await send_to_rhino_async("create_polyline", {"points": pack_points(points)})
 			return f"Created polyline with {len(points)} points"
 		except Exception as e:
 			return f"Error: {e}"
 
 	@mcp.tool()
-	def create_curve(points: list[list[float]], degree: int = 3) -> str:
+	async def create_curve(points: list[list[float]], degree: int = 3) -> str:
 		"""
 		Create a smooth interpolated curve through points
 		points: List of points, each point is [x, y, z]
 		degree: Curve degree (3 for cubic, higher for smoother)
 		"""
 		try:
-			send_to_rhino("create_curve", {"points": points, "degree": degree})
+			await send_to_rhino_async(
+				"create_curve", {"points": pack_points(points), "degree": degree})
 			return f"Created curve with {len(points)} points, degree {degree}"
 		except Exception as e:
 			return f"Error: {e}"
+
+	@mcp.tool()
+	async def create_points(points: list[list[float]]) -> str:
+		"""
+		Create many points in one call, much faster than repeated create_point
+		points: List of points, each point is [x, y, z]
+		"""
+		try:
+			result = await send_to_rhino_async("create_points", {"points": pack_points(points)})
+			return f"Created {result.get('count', 0)} points"
+		except Exception as e:
+			return f"Error: {e}"
+
+	@mcp.tool()
+	async def create_lines(starts: list[list[float]], ends: list[list[float]]) -> str:
+		"""
+		Create many lines in one call, much faster than repeated create_line
+		starts: List of start points, each [x, y, z]
+		ends: List of end points, one per start point
+		"""
+		try:
+			params = {"starts": pack_points(starts), "ends": pack_points(ends)}
+			result = await send_to_rhino_async("create_lines", params)
+			return f"Created {result.get('count', 0)} lines"
+		except Exception as e:
+			return f"Error: {e}"
+
+	@mcp.tool()
+	async def create_circles(centers: list[list[float]], radii: list[float]) -> str:
+		"""
+		Create many circles in one call, much faster than repeated create_circle
+		centers: List of center points, each [x, y, z]
+		radii: List of radii, one per center (or a single radius for all)
+		"""
+		try:
+			params = {
+				"centers": pack_points(centers),
+				"radii": radii[0] if len(radii) == 1 else pack_values(radii)
+			}
+			result = await send_to_rhino_async("create_circles", params)
+			return f"Created {result.get('count', 0)} circles"
+		except Exception as e:
+			return f"Error: {e}"
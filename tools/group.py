@@ -3,14 +3,14 @@ MCP tools for group operations
 """
 
 import json
-from .utils import send_to_rhino
+from .utils import send_to_rhino_async, list_from_rhino_async
 
 
 def register_tools(mcp):
 	"""Register all group tools with the MCP server"""
 
 	@mcp.tool()
-	def create_group(group_name: str, object_ids: str = "") -> str:
+	async def create_group(group_name: str, object_ids: str = "") -> str:
 		"""
 		Create a new group, optionally adding objects to it
 		group_name: Name for the new group
@@ -20,25 +20,25 @@ def register_tools(mcp):
 			params = {"name": group_name}
 			if object_ids:
 				params["object_ids"] = [s.strip() for s in object_ids.split(",")]
-			result = send_to_rhino("create_group", params)
+			result = await send_to_rhino_async("create_group", params)
 			return f"Created group '{group_name}'"
 		except Exception as e:
 			return f"Error: {e}"
 
 	@mcp.tool()
-	def delete_group(group_name: str) -> str:
+	async def delete_group(group_name: str) -> str:
 		"""
 		Delete a group (does not delete the objects in it)
 		group_name: Name of the group to delete
 		"""
 		try:
-			send_to_rhino("delete_group", {"name": group_name})
+			await send_to_rhino_async("delete_group", {"name": group_name})
 			return f"Deleted group '{group_name}'"
 		except Exception as e:
 			return f"Error: {e}"
 
 	@mcp.tool()
-	def add_to_group(group_name: str, object_ids: str) -> str:
+	async def add_to_group(group_name: str, object_ids: str) -> str:
 		"""
 		Add objects to an existing group
 		group_name: Name of the target group
@@ -46,14 +46,15 @@ def register_tools(mcp):
 		"""
 		try:
 			ids = [s.strip() for s in object_ids.split(",")]
-			result = send_to_rhino("add_to_group", {"name": group_name, "object_ids": ids})
+			result = await send_to_rhino_async(
+				"add_to_group", {"name": group_name, "object_ids": ids})
 			count = result.get("count", 0)
 			return f"Added {count} objects to group '{group_name}'"
 		except Exception as e:
 			return f"Error: {e}"
 
 	@mcp.tool()
-	def remove_from_group(group_name: str, object_ids: str) -> str:
+	async def remove_from_group(group_name: str, object_ids: str) -> str:
 		"""
 		Remove objects from a group
 		group_name: Name of the group
@@ -61,31 +62,40 @@ def register_tools(mcp):
 		"""
 		try:
 			ids = [s.strip() for s in object_ids.split(",")]
-			result = send_to_rhino("remove_from_group", {"name": group_name, "object_ids": ids})
+			result = await send_to_rhino_async(
+				"remove_from_group", {"name": group_name, "object_ids": ids})
 			count = result.get("count", 0)
 			return f"Removed {count} objects from group '{group_name}'"
 		except Exception as e:
 			return f"Error: {e}"
 
 	@mcp.tool()
-	def list_groups() -> str:
+	async def list_groups(limit: int = 0, cursor: str = "") -> str:
 		"""
-		List all groups in the document
+		List all groups in the document, ordered by name
+		limit: Maximum number of groups to return (default 0 = all)
+		cursor: next_cursor from the previous page, to continue a paged listing
 		"""
 		try:
-			result = send_to_rhino("list_groups")
+			params = {}
+			if limit > 0:
+				params["limit"] = limit
+			if cursor:
+				params["cursor"] = cursor
+			result = await list_from_rhino_async("list_groups", "groups", params,
+				lambda record: record["name"])
 			return json.dumps(result, indent=2)
 		except Exception as e:
 			return f"Error: {e}"
 
 	@mcp.tool()
-	def select_by_group(group_name: str) -> str:
+	async def select_by_group(group_name: str) -> str:
 		"""
 		Select all objects in a group
 		group_name: Name of the group
 		"""
 		try:
-			result = send_to_rhino("select_by_group", {"name": group_name})
+			result = await send_to_rhino_async("select_by_group", {"name": group_name})
 			count = result.get("count", 0)
 			return f"Selected {count} objects from group '{group_name}'"
 		except Exception as e:
@@ -3,14 +3,14 @@ MCP tools for layer management
 """
 
 import json
-from .utils import send_to_rhino
+from .utils import send_to_rhino_async, list_from_rhino_async
 
 
 def register_tools(mcp):
 	"""Register all layer management tools with the MCP server"""
 
 	@mcp.tool()
-	def create_layer(name: str, color_r: int = 0, color_g: int = 0, color_b: int = 0) -> str:
+	async def create_layer(name: str, color_r: int = 0, color_g: int = 0, color_b: int = 0) -> str:
 		"""
 		Create a new layer in Rhino
 		name: Layer name
@@ -21,39 +21,39 @@ def register_tools(mcp):
 				"name": name,
 				"color": [color_r, color_g, color_b]
 			}
-			send_to_rhino("create_layer", params)
+			await send_to_rhino_async("create_layer", params)
 			return f"Created layer '{name}'"
 		except Exception as e:
 			return f"Error: {e}"
 
 	@mcp.tool()
-	def delete_layer(name: str) -> str:
+	async def delete_layer(name: str) -> str:
 		"""
 		Delete a layer from Rhino
 		name: Layer name to delete
 		Layer must be empty (no objects on it)
 		"""
 		try:
-			send_to_rhino("delete_layer", {"name": name})
+			await send_to_rhino_async("delete_layer", {"name": name})
 			return f"Deleted layer '{name}'"
 		except Exception as e:
 			return f"Error: {e}"
 
 	@mcp.tool()
-	def set_current_layer(name: str) -> str:
+	async def set_current_layer(name: str) -> str:
 		"""
 		Set the current active layer in Rhino
 		name: Layer name to make current
 		New objects will be created on this layer
 		"""
 		try:
-			send_to_rhino("set_current_layer", {"name": name})
+			await send_to_rhino_async("set_current_layer", {"name": name})
 			return f"Set current layer to '{name}'"
 		except Exception as e:
 			return f"Error: {e}"
 
 	@mcp.tool()
-	def set_layer_color(name: str, color_r: int, color_g: int, color_b: int) -> str:
+	async def set_layer_color(name: str, color_r: int, color_g: int, color_b: int) -> str:
 		"""
 		Set the color of a layer
 		name: Layer name
@@ -64,13 +64,13 @@ def register_tools(mcp):
 				"name": name,
 				"color": [color_r, color_g, color_b]
 			}
-			send_to_rhino("set_layer_color", params)
+			await send_to_rhino_async("set_layer_color", params)
 			return f"Set layer '{name}' color to RGB({color_r}, {color_g}, {color_b})"
 		except Exception as e:
 			return f"Error: {e}"
 
 	@mcp.tool()
-	def set_layer_visibility(name: str, visible: bool) -> str:
+	async def set_layer_visibility(name: str, visible: bool) -> str:
 		"""
 		Set layer visibility (show/hide)
 		name: Layer name
@@ -81,20 +81,27 @@ def register_tools(mcp):
 				"name": name,
 				"visible": visible
 			}
-			send_to_rhino("set_layer_visibility", params)
+			await send_to_rhino_async("set_layer_visibility", params)
 			status = "visible" if visible else "hidden"
 			return f"Set layer '{name}' to {status}"
 		except Exception as e:
 			return f"Error: {e}"
 
 	@mcp.tool()
-	def list_layers() -> str:
+	async def list_layers(limit: int = 0, cursor: str = "") -> str:
 		"""
 		Get list of all layers in the document
-		Returns layer names and their properties
+		Returns layer names and their properties, ordered by full path
+		limit: Maximum number of layers to return (default 0 = all)
+		cursor: next_cursor from the previous page, to continue a paged listing
 		"""
 		try:
-			result = send_to_rhino("list_layers")
+			params = {}
+			if limit > 0:
+				params["limit"] = limit
+			if cursor:
+				params["cursor"] = cursor
+			result = await list_from_rhino_async("list_layers", "layers", params)
 			return json.dumps(result, indent=2)
 		except Exception as e:
 			return f"Error: {e}"
@@ -2,109 +2,175 @@
 MCP tools for object selection
 """
 
-from .utils import send_to_rhino
+import json
+from .utils import send_to_rhino_async
 
 
 def register_tools(mcp):
 	"""Register all selection tools with the MCP server"""
 
 	@mcp.tool()
-	def select_all() -> str:
+	async def select_all() -> str:
 		"""
 		Select all objects in the Rhino document
 		"""
 		try:
-			result = send_to_rhino("select_all")
+			result = await send_to_rhino_async("select_all")
 			count = result.get("count", 0)
 			return f"Selected {count} objects"
 		except Exception as e:
 			return f"Error: {e}"
 
 	@mcp.tool()
-	def select_by_type(object_type: str) -> str:
+	async def select_by_type(object_type: str) -> str:
 		"""
 		Select objects by type
 		object_type: Type to select - 'point', 'curve', 'surface', 'polysurface', 'mesh'
 		"""
 		try:
-			result = send_to_rhino("select_by_type", {"type": object_type})
+			result = await send_to_rhino_async("select_by_type", {"type": object_type})
 			count = result.get("count", 0)
 			return f"Selected {count} {object_type} objects"
 		except Exception as e:
 			return f"Error: {e}"
 
 	@mcp.tool()
-	def select_by_layer(layer_name: str) -> str:
+	async def select_by_layer(layer_name: str) -> str:
 		"""
 		Select all objects on a specific layer
 		layer_name: Layer name to select objects from
 		"""
 		try:
-			result = send_to_rhino("select_by_layer", {"layer": layer_name})
+			result = await send_to_rhino_async("select_by_layer", {"layer": layer_name})
 			count = result.get("count", 0)
 			return f"Selected {count} objects on layer '{layer_name}'"
 		except Exception as e:
 			return f"Error: {e}"
 
 	@mcp.tool()
-	def unselect_all() -> str:
+	async def unselect_all() -> str:
 		"""
 		Deselect all objects in Rhino
 		Clears the current selection
 		"""
 		try:
-			send_to_rhino("unselect_all")
+			await send_to_rhino_async("unselect_all")
 			return "Deselected all objects"
 		except Exception as e:
 			return f"Error: {e}"
 
 	@mcp.tool()
-	def delete_selected() -> str:
+	async def delete_selected() -> str:
 		"""
 		Delete all currently selected objects in Rhino.
 		Use select_all first if you want to delete everything.
 		"""
 		try:
-			result = send_to_rhino("delete_selected")
+			result = await send_to_rhino_async("delete_selected")
 			deleted = result.get("deleted", 0)
 			return f"Deleted {deleted} objects"
 		except Exception as e:
 			return f"Error: {e}"
 
 	@mcp.tool()
-	def select_by_name(name: str) -> str:
+	async def select_by_name(name: str, limit: int = 0, cursor: str = "") -> str:
 		"""
 		Select objects by their name
+		Every match is selected; the ids are returned a page at a time
 		name: Object name to search for
+		limit: Maximum number of ids to return (default 0 = all)
+		cursor: next_cursor from the previous page, to continue a paged listing
 		"""
 		try:
-			result = send_to_rhino("select_by_name", {"name": name})
-			count = result.get("count", 0)
-			return f"Selected {count} objects named '{name}'"
+			params = {}
+			if limit > 0:
+				params["limit"] = limit
+			if cursor:
+				params["cursor"] = cursor
+			params["name"] = name
+			result = await send_to_rhino_async("select_by_name", params)
+			summary = f"Selected {result.get('total', 0)} objects named '{name}'"
+			return summary + "\n" + json.dumps(result, indent=2)
 		except Exception as e:
 			return f"Error: {e}"
 
 	@mcp.tool()
-	def last_created_objects() -> str:
+	async def last_created_objects(limit: int = 0, cursor: str = "") -> str:
 		"""
 		Select the last created objects
+		Every object is selected; the ids are returned a page at a time
+		limit: Maximum number of ids to return (default 0 = all)
+		cursor: next_cursor from the previous page, to continue a paged listing
 		"""
 		try:
-			import json
-			result = send_to_rhino("last_created_objects")
-			count = result.get("count", 0)
-			return f"Selected {count} last created objects"
+			params = {}
+			if limit > 0:
+				params["limit"] = limit
+			if cursor:
+				params["cursor"] = cursor
+			result = await send_to_rhino_async("last_created_objects", params)
+			summary = f"Selected {result.get('total', 0)} last created objects"
+			return summary + "\n" + json.dumps(result, indent=2)
 		except Exception as e:
 			return f"Error: {e}"
 
 	@mcp.tool()
-	def invert_selection() -> str:
+	async def invert_selection() -> str:
 		"""
 		Invert the current selection (select unselected, deselect selected)
 		"""
 		try:
-			result = send_to_rhino("invert_selection")
+			result = await send_to_rhino_async("invert_selection")
 			count = result.get("count", 0)
 			return f"Inverted selection, {count} objects now selected"
 		except Exception as e:
 			return f"Error: {e}"
+
+	@mcp.tool()
+	async def objects_in_box(min_x: float, min_y: float, min_z: float,
+					max_x: float, max_y: float, max_z: float, contained: bool = False) -> str:
+		"""
+		Find objects whose bounding box meets an axis-aligned box, without selecting them
+		min_x, min_y, min_z: Minimum corner of the box
+		max_x, max_y, max_z: Maximum corner of the box
+		contained: Only return objects entirely inside the box
+		"""
+		try:
+			params = {
+				"min": [min_x, min_y, min_z],
+				"max": [max_x, max_y, max_z],
+				"contained": contained
+			}
+			result = await send_to_rhino_async("objects_in_box", params)
+			return json.dumps(result, indent=2)
+		except Exception as e:
+			return f"Error: {e}"
+
+	@mcp.tool()
+	async def objects_in_sphere(center_x: float, center_y: float, center_z: float,
+						radius: float) -> str:
+		"""
+		Find objects within a distance of a point, nearest first, without selecting them
+		center_x, center_y, center_z: Query point
+		radius: Maximum distance from the point to an object's bounding box
+		"""
+		try:
+			params = {"center": [center_x, center_y, center_z], "radius": radius}
+			result = await send_to_rhino_async("objects_in_sphere", params)
+			return json.dumps(result, indent=2)
+		except Exception as e:
+			return f"Error: {e}"
+
+	@mcp.tool()
+	async def nearest_objects(x: float, y: float, z: float, count: int = 1) -> str:
+		"""
+		Find the objects nearest to a point, nearest first
+		x, y, z: Query point
+		count: Number of objects to return
+		"""
+		try:
+			result = await send_to_rhino_async(
+				"nearest_objects", {"point": [x, y, z], "count": count})
+			return json.dumps(result, indent=2)
+		except Exception as e:
+			return f"Error: {e}"
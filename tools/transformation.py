@@ -2,90 +2,115 @@
 MCP tools for object transformations
 """
 
-from .utils import send_to_rhino
+from .utils import send_to_rhino_async
+
+
+def with_object_ids(params, object_ids):
+	"""Add comma-separated object ids to params, if any were given"""
+	ids = [s.strip() for s in object_ids.split(",") if s.strip()]
+	if ids:
+		params["object_ids"] = ids
+	return params
 
 
 def register_tools(mcp):
 	"""Register all transformation tools with the MCP server"""
 
 	@mcp.tool()
-	def move_objects(dx: float, dy: float, dz: float) -> str:
+	async def move_objects(dx: float, dy: float, dz: float, object_ids: str = "") -> str:
 		"""
-		Move selected objects by a displacement vector
+		Move objects by a displacement vector
 		dx: Displacement in X direction
 		dy: Displacement in Y direction
 		dz: Displacement in Z direction
-		Objects must be selected in Rhino first
+		object_ids: Comma-separated IDs of objects to move (default: the selected objects)
 		"""
 		try:
-			result = send_to_rhino("move_objects", {"displacement": [dx, dy, dz]})
+			params = with_object_ids({"displacement": [dx, dy, dz]}, object_ids)
+			result = await send_to_rhino_async("move_objects", params)
 			moved = result.get("moved", 0)
 			return f"Moved {moved} objects by ({dx}, {dy}, {dz})"
 		except Exception as e:
 			return f"Error: {e}"
 
 	@mcp.tool()
-	def rotate_objects(center_x: float, center_y: float, center_z: float,
-					   angle: float) -> str:
+	async def rotate_objects(center_x: float, center_y: float, center_z: float,
+					   angle: float, object_ids: str = "") -> str:
 		"""
-		Rotate selected objects around Z-axis
+		Rotate objects around Z-axis
 		center_x, center_y, center_z: Rotation center point
 		angle: Rotation angle in degrees
-		Objects must be selected in Rhino first
+		object_ids: Comma-separated IDs of objects to rotate (default: the selected objects)
 		"""
 		try:
-			params = {
+			params = with_object_ids({
 				"center": [center_x, center_y, center_z],
 				"angle": angle
-			}
-			result = send_to_rhino("rotate_objects", params)
+			}, object_ids)
+			result = await send_to_rhino_async("rotate_objects", params)
 			count = result.get("count", 0)
 			return f"Rotated {count} objects by {angle} degrees"
 		except Exception as e:
 			return f"Error: {e}"
 
 	@mcp.tool()
-	def scale_objects(center_x: float, center_y: float, center_z: float,
-					  scale_factor: float) -> str:
+	async def scale_objects(center_x: float, center_y: float, center_z: float,
+					  scale_factor: float, object_ids: str = "") -> str:
 		"""
-		Scale selected objects uniformly from a center point
+		Scale objects uniformly from a center point
 		center_x, center_y, center_z: Scale center point
 		scale_factor: Scale factor (2.0 = double size, 0.5 = half size)
-		Objects must be selected in Rhino first
+		object_ids: Comma-separated IDs of objects to scale (default: the selected objects)
 		"""
 		try:
-			params = {
+			params = with_object_ids({
 				"center": [center_x, center_y, center_z],
 				"scale": scale_factor
-			}
-			result = send_to_rhino("scale_objects", params)
+			}, object_ids)
+			result = await send_to_rhino_async("scale_objects", params)
 			scaled = result.get("scaled", 0)
 			return f"Scaled {scaled} objects by factor {scale_factor}"
 		except Exception as e:
 			return f"Error: {e}"
 
 	@mcp.tool()
-	def mirror_objects(start_x: float, start_y: float, start_z: float,
-					   end_x: float, end_y: float, end_z: float) -> str:
+	async def mirror_objects(start_x: float, start_y: float, start_z: float,
+					   end_x: float, end_y: float, end_z: float, object_ids: str = "") -> str:
 		"""
-		Mirror selected objects across a line
+		Mirror objects across a line
 		start_x, start_y, start_z: Start point of mirror line
 		end_x, end_y, end_z: End point of mirror line
-		Objects must be selected in Rhino first
+		object_ids: Comma-separated IDs of objects to mirror (default: the selected objects)
 		"""
 		try:
-			params = {
+			params = with_object_ids({
 				"start": [start_x, start_y, start_z],
 				"end": [end_x, end_y, end_z]
-			}
-			result = send_to_rhino("mirror_objects", params)
+			}, object_ids)
+			result = await send_to_rhino_async("mirror_objects", params)
 			mirrored = result.get("mirrored", 0)
 			return f"Mirrored {mirrored} objects"
 		except Exception as e:
 			return f"Error: {e}"
 
 	@mcp.tool()
-	def copy_objects(dx: float, dy: float, dz: float) -> str:
+	async def transform_objects(matrix: list[list[float]], object_ids: str = "") -> str:
+		"""
+		Apply an arbitrary affine transform given as a 4x4 matrix
+		matrix: Four rows of four numbers, row-major; the last column holds the translation
+		Example: [[1,0,0,10], [0,1,0,0], [0,0,1,0], [0,0,0,1]] moves 10 units in X
+		object_ids: Comma-separated IDs of objects to transform (default: the selected objects)
+		"""
+		try:
+			params = with_object_ids({"matrix": matrix}, object_ids)
+			result = await send_to_rhino_async("transform_objects", params)
+			count = result.get("count", 0)
+			return f"Transformed {count} objects"
+		except Exception as e:
+			return f"Error: {e}"
+
+	@mcp.tool()
+	async def copy_objects(dx: float, dy: float, dz: float) -> str:
 		"""
 		Copy selected objects to a new location
 		dx: Displacement in X direction
@@ -94,55 +119,68 @@ def register_tools(mcp):
 		Objects must be selected in Rhino first
 		"""
 		try:
-			result = send_to_rhino("copy_objects", {"displacement": [dx, dy, dz]})
+			result = await send_to_rhino_async("copy_objects", {"displacement": [dx, dy, dz]})
 			copied = result.get("copied", 0)
 			return f"Copied {copied} objects"
 		except Exception as e:
 			return f"Error: {e}"
 
 	@mcp.tool()
-	def array_linear(dx: float, dy: float, dz: float, count: int) -> str:
+	async def array_linear(dx: float, dy: float, dz: float, count: int,
+						as_blocks: bool = False) -> str:
 		"""
 		Create a linear array of selected objects
 		dx, dy, dz: Spacing between copies
 		count: Number of copies to create
+		as_blocks: Place block instances instead of full copies (lighter for large arrays)
 		Objects must be selected in Rhino first
 		"""
 		try:
 			params = {
 				"displacement": [dx, dy, dz],
-				"count": count
+				"count": count,
+				"as_blocks": as_blocks
 			}
-			result = send_to_rhino("array_linear", params)
+			result = await send_to_rhino_async("array_linear", params)
 			created = result.get("created", 0)
+			if result.get("block"):
+				return f"Created linear array with {created} instances of block {result['block']}"
 			return f"Created linear array with {created} new objects"
 		except Exception as e:
 			return f"Error: {e}"
 
 	@mcp.tool()
-	def array_polar(center_x: float, center_y: float, center_z: float,
-					count: int, angle: float = 360) -> str:
+	async def array_polar(center_x: float, center_y: float, center_z: float,
+					count: int, angle: float = 360, as_blocks: bool = False,
+					axis_x: float = 0, axis_y: float = 0, axis_z: float = 0) -> str:
 		"""
 		Create a polar (circular) array of selected objects
 		center_x, center_y, center_z: Center point of the array
 		count: Number of copies (including original)
 		angle: Total angle to fill in degrees (default 360 = full circle)
+		as_blocks: Place block instances instead of full copies (lighter for large arrays)
+		axis_x, axis_y, axis_z: Rotation axis (default: the active construction plane normal)
 		Objects must be selected in Rhino first
 		"""
 		try:
 			params = {
 				"center": [center_x, center_y, center_z],
 				"count": count,
-				"angle": angle
+				"angle": angle,
+				"as_blocks": as_blocks
 			}
-			result = send_to_rhino("array_polar", params)
+			if axis_x or axis_y or axis_z:
+				params["axis"] = [axis_x, axis_y, axis_z]
+			result = await send_to_rhino_async("array_polar", params)
 			created = result.get("created", 0)
+			if result.get("block"):
+				return f"Created polar array with {created} instances of block {result['block']}"
 			return f"Created polar array with {created} new objects"
 		except Exception as e:
 			return f"Error: {e}"
 
 	@mcp.tool()
-	def orient_objects(from_x: float, from_y: float, from_z: float,
+	async def orient_objects(from_x: float, from_y: float, from_z: float,
 					   to_x: float, to_y: float, to_z: float) -> str:
 		"""
 		Orient selected objects from one reference point to a target point
@@ -155,7 +193,7 @@ def register_tools(mcp):
 				"reference": [from_x, from_y, from_z],
 				"target": [to_x, to_y, to_z]
 			}
-			result = send_to_rhino("orient_objects", params)
+			result = await send_to_rhino_async("orient_objects", params)
 			count = result.get("count", 0)
 			return f"Oriented {count} objects"
 		except Exception as e:
@@ -3,14 +3,14 @@ MCP tools for user data operations
 """
 
 import json
-from .utils import send_to_rhino
+from .utils import send_to_rhino_async
 
 
 def register_tools(mcp):
 	"""Register all user data tools with the MCP server"""
 
 	@mcp.tool()
-	def set_user_text(object_id: str, key: str, value: str) -> str:
+	async def set_user_text(object_id: str, key: str, value: str) -> str:
 		"""
 		Set user text (key-value metadata) on an object
 		object_id: ID of the object
@@ -19,13 +19,13 @@ def register_tools(mcp):
 		"""
 		try:
 			params = {"object_id": object_id, "key": key, "value": value}
-			send_to_rhino("set_user_text", params)
+			await send_to_rhino_async("set_user_text", params)
 			return f"Set user text '{key}' = '{value}' on object"
 		except Exception as e:
 			return f"Error: {e}"
 
 	@mcp.tool()
-	def get_user_text(object_id: str, key: str = "") -> str:
+	async def get_user_text(object_id: str, key: str = "") -> str:
 		"""
 		Get user text from an object. If no key specified, returns all key-value pairs.
 		object_id: ID of the object
@@ -35,13 +35,13 @@ def register_tools(mcp):
 			params = {"object_id": object_id}
 			if key:
 				params["key"] = key
-			result = send_to_rhino("get_user_text", params)
+			result = await send_to_rhino_async("get_user_text", params)
 			return json.dumps(result, indent=2)
 		except Exception as e:
 			return f"Error: {e}"
 
 	@mcp.tool()
-	def set_document_user_text(key: str, value: str) -> str:
+	async def set_document_user_text(key: str, value: str) -> str:
 		"""
 		Set document-level user text (key-value metadata)
 		key: Metadata key name
@@ -49,13 +49,13 @@ def register_tools(mcp):
 		"""
 		try:
 			params = {"key": key, "value": value}
-			send_to_rhino("set_document_user_text", params)
+			await send_to_rhino_async("set_document_user_text", params)
 			return f"Set document user text '{key}' = '{value}'"
 		except Exception as e:
 			return f"Error: {e}"
 
 	@mcp.tool()
-	def get_document_user_text(key: str = "") -> str:
+	async def get_document_user_text(key: str = "") -> str:
 		"""
 		Get document-level user text. If no key specified, returns all key-value pairs.
 		key: Specific key to retrieve (optional, empty = get all)
@@ -64,7 +64,7 @@ def register_tools(mcp):
 			params = {}
 			if key:
 				params["key"] = key
-			result = send_to_rhino("get_document_user_text", params)
+			result = await send_to_rhino_async("get_document_user_text", params)
 			return json.dumps(result, indent=2)
 		except Exception as e:
 			return f"Error: {e}"
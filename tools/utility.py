@@ -2,14 +2,15 @@
 MCP tools for analysis and measurement
 """
 
-from .utils import send_to_rhino
+import json
+from .utils import send_to_rhino_async, pin_async_connection, unpin_async_connection
 
 
 def register_tools(mcp):
 	"""Register all analysis/utility tools with the MCP server"""
 
 	@mcp.tool()
-	def measure_distance(point1_x: float, point1_y: float, point1_z: float,
+	async def measure_distance(point1_x: float, point1_y: float, point1_z: float,
 						 point2_x: float, point2_y: float, point2_z: float) -> str:
 		"""
 		Measure distance between two points
@@ -21,53 +22,53 @@ def register_tools(mcp):
 				"point1": [point1_x, point1_y, point1_z],
 				"point2": [point2_x, point2_y, point2_z]
 			}
-			result = send_to_rhino("measure_distance", params)
+			result = await send_to_rhino_async("measure_distance", params)
 			distance = result.get("distance", 0)
 			return f"Distance: {distance}"
 		except Exception as e:
 			return f"Error: {e}"
 
 	@mcp.tool()
-	def measure_curve_length() -> str:
+	async def measure_curve_length() -> str:
 		"""
 		Measure length of selected curve
 		One curve must be selected in Rhino first
 		"""
 		try:
-			result = send_to_rhino("measure_curve_length")
+			result = await send_to_rhino_async("measure_curve_length")
 			length = result.get("length", 0)
 			return f"Curve length: {length}"
 		except Exception as e:
 			return f"Error: {e}"
 
 	@mcp.tool()
-	def measure_area() -> str:
+	async def measure_area() -> str:
 		"""
 		Measure area of selected surface or closed curve
 		One surface or closed planar curve must be selected in Rhino first
 		"""
 		try:
-			result = send_to_rhino("measure_area")
+			result = await send_to_rhino_async("measure_area")
 			area = result.get("area", 0)
 			return f"Area: {area}"
 		except Exception as e:
 			return f"Error: {e}"
 
 	@mcp.tool()
-	def measure_volume() -> str:
+	async def measure_volume() -> str:
 		"""
 		Measure volume of selected solid
 		One closed solid must be selected in Rhino first
 		"""
 		try:
-			result = send_to_rhino("measure_volume")
+			result = await send_to_rhino_async("measure_volume")
 			volume = result.get("volume", 0)
 			return f"Volume: {volume}"
 		except Exception as e:
 			return f"Error: {e}"
 
 	@mcp.tool()
-	def execute_python_code(code: str) -> str:
+	async def execute_python_code(code: str) -> str:
 		"""
 		Execute arbitrary Python code in Rhino with access to rhinoscriptsyntax.
 		Use this for complex operations like loops, conditionals, and mathematical patterns.
@@ -84,7 +85,7 @@ def register_tools(mcp):
 		code: Python code to execute
 		"""
 		try:
-			result = send_to_rhino("execute_python_code", {"code": code})
+			result = await send_to_rhino_async("execute_python_code", {"code": code})
 			message = result.get("message", "Code executed")
 			output = result.get("output", "")
 			if output:
@@ -92,3 +93,170 @@ def register_tools(mcp):
 			return message
 		except Exception as e:
 			return f"Error: {e}"
+
+	@mcp.tool()
+	async def run_batch(commands: str, stop_on_error: bool = True, atomic: bool = False) -> str:
+		"""
+		Run many listener commands in one round trip with a single redraw.
+		Much faster than separate tool calls when creating lots of objects.
+
+		Example:
+		  [{"type": "create_sphere", "params": {"center": [0, 0, 0], "radius": 2}},
+		   {"type": "create_sphere", "params": {"center": [10, 0, 0], "radius": 2}}]
+
+		commands: JSON array of {"type": ..., "params": {...}} objects
+		stop_on_error: Stop at the first failed command (default True)
+		atomic: Undo the whole batch in one step if any command fails (default False)
+		"""
+		try:
+			items = json.loads(commands)
+			params = {"commands": items, "stop_on_error": stop_on_error, "atomic": atomic}
+			result = await send_to_rhino_async("batch", params)
+			completed = result.get("completed", 0)
+			failed = result.get("failed", 0)
+			summary = f"Batch ran {completed} of {result.get('count', 0)} commands, {failed} failed"
+			if result.get("rolled_back"):
+				summary += ", all changes rolled back"
+			results = result.get("results", [])
+			errors = [r.get("message", "") for r in results if r.get("status") != "success"]
+			if errors:
+				return summary + "\nErrors: " + "; ".join(errors)
+			return summary
+		except Exception as e:
+			return f"Error: {e}"
+
+	@mcp.tool()
+	async def begin_transaction(name: str = "RhinoMCP transaction") -> str:
+		"""
+		Start a transaction: following commands share one undo record and
+		redraw is suspended until commit_transaction or rollback_transaction
+		name: Description shown in Rhino's undo list
+		"""
+		pinned = False
+		try:
+			pinned = await pin_async_connection()
+			await send_to_rhino_async("begin_transaction", {"name": name})
+			return f"Transaction started: {name}"
+		except Exception as e:
+			if pinned:
+				unpin_async_connection()
+			return f"Error: {e}"
+
+	@mcp.tool()
+	async def commit_transaction() -> str:
+		"""
+		Finish the open transaction, keeping its changes as one undo step
+		"""
+		try:
+			result = await send_to_rhino_async("commit_transaction")
+			return f"Committed {result.get('name')}: {result.get('commands', 0)} commands"
+		except Exception as e:
+			return f"Error: {e}"
+		finally:
+			unpin_async_connection()
+
+	@mcp.tool()
+	async def rollback_transaction() -> str:
+		"""
+		Undo every change made since begin_transaction in a single step
+		"""
+		try:
+			result = await send_to_rhino_async("rollback_transaction")
+			if result.get("undone"):
+				commands = result.get("commands", 0)
+				return f"Rolled back {result.get('name')}: {commands} commands undone"
+			return f"Closed {result.get('name')}: nothing to undo"
+		except Exception as e:
+			return f"Error: {e}"
+		finally:
+			unpin_async_connection()
+
+	@mcp.tool()
+	async def get_listener_status() -> str:
+		"""
+		Report how busy the Rhino listener is
+		Shows queued commands, the queue limit, open connections and rejections
+		"""
+		try:
+			result = await send_to_rhino_async("listener_status")
+			return json.dumps(result, indent=2)
+		except Exception as e:
+			return f"Error: {e}"
+
+	@mcp.tool()
+	async def check_scene_index(repair: bool = False) -> str:
+		"""
+		Verify the listener's scene index against a full rescan of the document
+		repair: Rebuild the index if it is out of date
+		"""
+		try:
+			result = await send_to_rhino_async("check_scene_index", {"repair": repair})
+			return json.dumps(result, indent=2)
+		except Exception as e:
+			return f"Error: {e}"
+
+	@mcp.tool()
+	async def flush_result_cache() -> str:
+		"""
+		Empty the listener's cache of measurement and analysis results
+		Returns the cache size and hit/miss counts from before the flush
+		"""
+		try:
+			result = await send_to_rhino_async("flush_result_cache")
+			return json.dumps(result, indent=2)
+		except Exception as e:
+			return f"Error: {e}"
+
+	@mcp.tool()
+	async def list_commands() -> str:
+		"""
+		List every Rhino listener command with its metadata: whether it
+		modifies the document, its cost class (light/medium/heavy), whether it
+		acts on the selection, whether it redraws and whether it can stream
+		"""
+		try:
+			result = await send_to_rhino_async("list_commands")
+			return json.dumps(result.get("commands", []), indent=2)
+		except Exception as e:
+			return f"Error: {e}"
+
+	@mcp.tool()
+	async def submit_job(command_type: str, params: str = "{}") -> str:
+		"""
+		Start a long-running Rhino command without waiting for it to finish.
+		Use for heavy booleans, network surfaces or large batches, then poll
+		get_job_status and fetch the output with get_job_result.
+
+		command_type: Listener command name, e.g. "boolean_union"
+		params: JSON object with the command's parameters
+		"""
+		try:
+			job = {"type": command_type, "params": json.loads(params)}
+			result = await send_to_rhino_async("submit_job", job)
+			return f"Started job {result.get('job_id')} ({result.get('state')})"
+		except Exception as e:
+			return f"Error: {e}"
+
+	@mcp.tool()
+	async def get_job_status(job_id: int) -> str:
+		"""
+		Get the state, elapsed time and progress of a submitted job
+		job_id: Id returned by submit_job
+		"""
+		try:
+			result = await send_to_rhino_async("job_status", {"job_id": job_id})
+			return json.dumps(result, indent=2)
+		except Exception as e:
+			return f"Error: {e}"
+
+	@mcp.tool()
+	async def get_job_result(job_id: int) -> str:
+		"""
+		Collect the result of a finished job
+		job_id: Id returned by submit_job
+		"""
+		try:
+			result = await send_to_rhino_async("job_result", {"job_id": job_id})
+			return json.dumps(result, indent=2)
+		except Exception as e:
+			return f"Error: {e}"
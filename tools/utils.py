@@ -2,19 +2,293 @@
 Utility functions for MCP tools
 """
 
-import socket
+import os
+import array
+import asyncio
 import json
+import itertools
+
+import protocol
 
 RHINO_HOST = "localhost"
 RHINO_PORT = 54321
 SOCKET_TIMEOUT = 30
-RECV_CHUNK_SIZE = 8192
+
+ASYNC_POOL_SIZE = 4
+BUSY_RETRIES = 3
+ACCEPT_CODECS = protocol.available_codecs()
+
+_request_ids = itertools.count(1)
+
+
+def pack_points(points):
+	"""
+	Pack [x, y, z] points into a flat float64 array for binary transfer
+	points: list of [x, y, z]
+	return: array.array of 3 * len(points) doubles
+	"""
+	packed = array.array("d")
+	for point in points:
+		packed.extend(point[:3])
+		if len(point) == 2:
+			packed.append(0.0)
+	return packed
+
+
+def pack_values(values):
+	"""
+	Pack a column of numbers into a float64 array for binary transfer
+	values: list of numbers
+	return: array.array of doubles
+	"""
+	return array.array("d", values)
+
+
+def pack_faces(faces):
+	"""
+	Pack mesh faces into a flat int32 array, 4 indices per face
+	Triangles repeat their last index, as Rhino expects.
+	faces: list of 3 or 4 vertex indices per face
+	return: array.array of 4 * len(faces) ints
+	"""
+	packed = array.array("i")
+	for face in faces:
+		packed.extend(face[:4])
+		if len(face) == 3:
+			packed.append(face[2])
+	return packed
+
+
+def next_request_id():
+	"""Get a process-unique request id"""
+	return next(_request_ids)
+
+
+def encode_request(command, request_id):
+	"""
+	Frame a command tagged with its request id
+	Large responses to it may come back compressed with ACCEPT_CODECS.
+	command: request dict
+	request_id: id the response will carry
+	return: framed request bytes
+	"""
+	return protocol.encode_message(dict(command, id=request_id, compress=ACCEPT_CODECS))
+
+
+def check_response_id(response, request_id):
+	"""
+	Check a response answers the expected request
+	A connection-level error is returned as-is so its message reaches the caller.
+	response: decoded response dict
+	request_id: id the response must carry
+	return: response dict
+	"""
+	if response.get("id") not in (request_id, protocol.CONNECTION_ERROR_ID):
+		raise protocol.ProtocolError("Response id does not match request")
+	return response
+
+
+# ============================================================================
+# ASYNCIO TRANSPORT
+# ============================================================================
+
+async def read_frame(reader):
+	"""
+	Read one framed message, decompressing a compressed payload as it arrives
+	reader: asyncio StreamReader
+	return: (flags, payload bytes)
+	"""
+	header = await reader.readexactly(protocol.HEADER_SIZE)
+	flags, length = protocol.decode_header(header)
+	if not flags & protocol.COMPRESSION_FLAGS:
+		return flags, await reader.readexactly(length)
+	inflater = protocol.Inflater(flags)
+	remaining = length
+	while remaining:
+		chunk = await reader.read(min(remaining, protocol.RECV_CHUNK_SIZE))
+		if not chunk:
+			raise asyncio.IncompleteReadError(b"", remaining)
+		remaining -= len(chunk)
+		inflater.feed(chunk)
+	return flags, inflater.finish()
 
 
-def send_to_rhino(command_type, params=None):
+class AsyncConnection:
 	"""
-	Send JSON command to Rhino and return response.
-	Uses chunked reading to handle large responses.
+	Asyncio connection to the listener that multiplexes requests by id
+	Any number of coroutines can await responses on the same connection;
+	a single reader task routes each response to its waiting future.
+	"""
+
+	def __init__(self, reader, writer):
+		self.reader = reader
+		self.writer = writer
+		self.pending = {}
+		self.closed = False
+		self.write_lock = asyncio.Lock()
+		self.reader_task = asyncio.ensure_future(self.read_responses())
+
+	async def read_responses(self):
+		"""Read framed responses and resolve the matching futures"""
+		error = ConnectionError("Connection closed by Rhino")
+		try:
+			while True:
+				flags, payload = await read_frame(self.reader)
+				response = protocol.decode_payload(flags, payload)
+				if response.get("id") == protocol.CONNECTION_ERROR_ID:
+					error = ConnectionError(response.get("message", "Connection error"))
+					break
+				future = self.pending.pop(response.get("id"), None)
+				if future is not None and not future.done():
+					future.set_result(response)
+		except asyncio.IncompleteReadError:
+			pass
+		except Exception as e:
+			error = e
+		finally:
+			self.fail_pending(error)
+
+	def fail_pending(self, error):
+		"""Mark the connection closed and fail every waiting request"""
+		self.closed = True
+		for future in self.pending.values():
+			if not future.done():
+				future.set_exception(error)
+		self.pending.clear()
+		self.writer.close()
+
+	async def request(self, command, timeout=SOCKET_TIMEOUT):
+		"""
+		Send one command and wait for its response
+		Cancelling the caller stops the wait; a late response is dropped.
+		command: request dict
+		timeout: seconds to wait for the response
+		return: response dict
+		"""
+		if self.closed:
+			raise ConnectionError("Connection closed by Rhino")
+		request_id = next_request_id()
+		future = asyncio.get_running_loop().create_future()
+		self.pending[request_id] = future
+		try:
+			async with self.write_lock:
+				self.writer.write(encode_request(command, request_id))
+				await self.writer.drain()
+			return await asyncio.wait_for(future, timeout)
+		finally:
+			self.pending.pop(request_id, None)
+
+
+# (event loop, lock, list of AsyncConnection) for the loop in use
+_async_pool = [None]
+
+# Pooled connection every request uses while a transaction is open, since
+# the listener only takes a transaction's commands from the connection that
+# began it
+_pinned_connection = [None]
+
+
+async def open_async_streams():
+	"""
+	Open asyncio streams to the listener, preferring the Unix socket
+	return: (StreamReader, StreamWriter)
+	"""
+	path = protocol.unix_socket_path()
+	if path and os.path.exists(path):
+		try:
+			return await asyncio.open_unix_connection(path)
+		except OSError:
+			pass
+	reader, writer = await asyncio.open_connection(RHINO_HOST, RHINO_PORT)
+	protocol.set_nodelay(writer.get_extra_info("socket"))
+	return reader, writer
+
+
+async def get_async_connection():
+	"""
+	Get an asyncio connection with the fewest requests in flight
+	The listener answers each connection in request order, so one slow
+	command would hold up every response behind it. Requests go to an idle
+	connection when there is one, and a new connection is opened while fewer
+	than ASYNC_POOL_SIZE are open; only then are busy connections shared.
+	While a connection is pinned, it is returned as long as it is open.
+	return: (AsyncConnection, reused)
+	"""
+	loop = asyncio.get_running_loop()
+	pool = _async_pool[0]
+	if pool is None or pool[0] is not loop:
+		pool = (loop, asyncio.Lock(), [])
+		_async_pool[0] = pool
+	connections = pool[2]
+
+	async with pool[1]:
+		connections[:] = [connection for connection in connections if not connection.closed]
+		if _pinned_connection[0] in connections:
+			return _pinned_connection[0], True
+		_pinned_connection[0] = None
+		if connections:
+			connection = min(connections, key=lambda c: len(c.pending))
+			if not connection.pending or len(connections) >= ASYNC_POOL_SIZE:
+				return connection, True
+		reader, writer = await asyncio.wait_for(open_async_streams(), SOCKET_TIMEOUT)
+		connection = AsyncConnection(reader, writer)
+		connections.append(connection)
+		return connection, False
+
+
+async def pin_async_connection():
+	"""
+	Send every request over one pooled connection until unpin_async_connection
+	return: False if a connection was already pinned
+	"""
+	connection, reused = await get_async_connection()
+	if _pinned_connection[0] is connection:
+		return False
+	_pinned_connection[0] = connection
+	return True
+
+
+def unpin_async_connection():
+	"""Let requests spread over the pool again"""
+	_pinned_connection[0] = None
+
+
+async def request_async(command):
+	"""
+	Send a command over a pooled asyncio connection
+	A reused connection that turns out to be closed is replaced once.
+	command: request dict
+	return: response dict
+	"""
+	connection, reused = await get_async_connection()
+	try:
+		return await connection.request(command)
+	except ConnectionError:
+		if not reused:
+			raise
+		connection, reused = await get_async_connection()
+		return await connection.request(command)
+
+
+async def request_admitted_async(command):
+	"""
+	Send a command, waiting and retrying while the listener reports busy
+	command: request dict
+	return: response dict (still busy after BUSY_RETRIES attempts)
+	"""
+	for attempt in range(BUSY_RETRIES):
+		response = await request_async(command)
+		if not response.get("busy"):
+			return response
+		await asyncio.sleep(response.get("retry_after_ms", 0) / 1000.0)
+	return await request_async(command)
+
+
+async def send_to_rhino_async(command_type, params=None):
+	"""
+	Send a framed JSON command to Rhino and return the result.
+	Many calls can be outstanding at once over a few connections without
+	a thread per call, and cancelling the caller cancels the wait.
 	"""
 	if params is None:
 		params = {}
@@ -25,45 +299,79 @@ def send_to_rhino(command_type, params=None):
 	}
 
 	try:
-		sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-		sock.settimeout(SOCKET_TIMEOUT)
-		sock.connect((RHINO_HOST, RHINO_PORT))
-
-		sock.sendall(json.dumps(command).encode("utf-8"))
-
-		# Chunked reading for large responses
-		chunks = []
-		while True:
-			chunk = sock.recv(RECV_CHUNK_SIZE)
-			if not chunk:
-				break
-			chunks.append(chunk)
-			# Try to parse - if valid JSON, we have the full response
-			try:
-				response_data = b"".join(chunks)
-				response = json.loads(response_data.decode("utf-8"))
-				break
-			except (json.JSONDecodeError, UnicodeDecodeError):
-				continue
-
-		sock.close()
-
-		if not chunks:
-			raise Exception("Empty response from Rhino")
-
-		response_data = b"".join(chunks)
-		response = json.loads(response_data.decode("utf-8"))
+		response = await request_admitted_async(command)
 
 		if response.get("status") == "error":
 			raise Exception(response.get("message", "Unknown error from Rhino"))
 
 		return response.get("result", {})
 
+	except asyncio.CancelledError:
+		raise
 	except ConnectionRefusedError:
 		raise Exception("Cannot connect to Rhino. Ensure listener is running.")
-	except socket.timeout:
+	except asyncio.TimeoutError:
 		raise Exception("Connection timeout. Rhino may be busy.")
-	except json.JSONDecodeError as e:
+	except (json.JSONDecodeError, protocol.ProtocolError) as e:
 		raise Exception(f"Invalid response from Rhino: {e}")
 	except Exception as e:
 		raise Exception(f"Communication error: {e}")
+
+
+async def stream_from_rhino_async(command_type, params=None):
+	"""
+	Run a listing command in streaming mode and collect its records
+	Supported by get_scene_info (id/type per object), get_selected_objects,
+	list_layers, list_groups and list_blocks. The listener produces records
+	on the UI thread a chunk at a time, so a long listing never holds the UI
+	thread for one long call. Stream chunks carry no request id, so the
+	stream has a connection of its own instead of a multiplexed one.
+	command_type: listing command name
+	params: command parameters
+	return: (list of records, trailer result with the record count)
+	"""
+	command = {"type": command_type, "params": params or {}, "stream": True}
+	request_id = next_request_id()
+	reader, writer = await asyncio.wait_for(open_async_streams(), SOCKET_TIMEOUT)
+	records = []
+	try:
+		writer.write(encode_request(command, request_id))
+		await writer.drain()
+		while True:
+			flags, payload = await asyncio.wait_for(read_frame(reader), SOCKET_TIMEOUT)
+			if not flags & protocol.FLAG_STREAM:
+				break
+			records.extend(protocol.decode_records(payload))
+	finally:
+		writer.close()
+
+	response = check_response_id(protocol.decode_payload(flags, payload), request_id)
+	if response.get("status") == "error":
+		raise Exception(response.get("message", "Unknown error from Rhino"))
+	return records, response.get("result", {})
+
+
+async def list_from_rhino_async(command_type, key, params, item=None):
+	"""
+	Get a listing: one page when params has a limit or cursor, else every
+	record streamed
+	command_type: listing command name
+	key: result key holding the listed items
+	params: command parameters
+	item: function turning a streamed record into a listed item (default unchanged)
+	return: result dict shaped like the paged command's result
+	"""
+	if "limit" in params or "cursor" in params:
+		return await send_to_rhino_async(command_type, params)
+
+	try:
+		records, result = await stream_from_rhino_async(command_type, params)
+	except asyncio.CancelledError:
+		raise
+	except ConnectionRefusedError:
+		raise Exception("Cannot connect to Rhino. Ensure listener is running.")
+	except asyncio.TimeoutError:
+		raise Exception("Connection timeout. Rhino may be busy.")
+
+	items = [item(record) for record in records] if item else records
+	return dict(result, total=len(items), next_cursor=None, **{key: items})